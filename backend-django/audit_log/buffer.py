@@ -0,0 +1,119 @@
+"""In-process, batched audit log writer.
+
+Events are queued in memory and written with bulk_create by a background
+thread, either when AUDIT_LOG_BATCH_SIZE events are waiting or every
+AUDIT_LOG_FLUSH_INTERVAL seconds. The queue is bounded: when it is full the
+oldest events are dropped (and counted) rather than growing without limit.
+Pending events are flushed at interpreter exit and Celery worker shutdown.
+"""
+import atexit
+import logging
+import os
+import threading
+from collections import deque
+from django.conf import settings
+from django.db import close_old_connections, connection
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+class AuditBuffer:
+    def __init__(self, max_size, batch_size, flush_interval):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._events = deque(maxlen=max_size)
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._pid = None
+        self.dropped = 0
+        self.written = 0
+
+    def enqueue(self, action, model_name, object_id, user_id=None, details=None):
+        event = {
+            'user_id': user_id,
+            'action': action,
+            'model_name': model_name,
+            'object_id': str(object_id),
+            'timestamp': timezone.now(),
+            'details': details,
+        }
+        with self._lock:
+            if len(self._events) == self._events.maxlen:
+                self.dropped += 1
+            self._events.append(event)
+            pending = len(self._events)
+        self._ensure_worker()
+        if pending >= self.batch_size:
+            self._wakeup.set()
+
+    def _ensure_worker(self):
+        # Started lazily and re-started after fork (gunicorn/celery prefork)
+        if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+                return
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name='audit-log-flusher', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception('Audit log flush failed')
+                close_old_connections()
+
+    def _take_batch(self):
+        with self._lock:
+            return [self._events.popleft() for _ in range(min(self.batch_size, len(self._events)))]
+
+    def flush(self):
+        from .models import ActivityLog
+
+        with self._flush_lock:
+            while True:
+                batch = self._take_batch()
+                if not batch:
+                    return
+                try:
+                    ActivityLog.objects.bulk_create([ActivityLog(**event) for event in batch])
+                except Exception:
+                    # Put the batch back (oldest first) and retry on the next tick.
+                    # Events queued meanwhile may have filled the deque: keep the
+                    # newest part that fits and count the rest as dropped, like
+                    # enqueue does, instead of evicting newer events.
+                    with self._lock:
+                        free = self._events.maxlen - len(self._events)
+                        requeue = batch[len(batch) - free:] if free < len(batch) else batch
+                        self.dropped += len(batch) - len(requeue)
+                        self._events.extendleft(reversed(requeue))
+                    raise
+                self.written += len(batch)
+
+    def close(self):
+        try:
+            self.flush()
+        except Exception:
+            logger.exception('Audit log flush at shutdown failed')
+        finally:
+            connection.close()
+
+
+audit_buffer = AuditBuffer(
+    max_size=settings.AUDIT_LOG_MAX_BUFFER,
+    batch_size=settings.AUDIT_LOG_BATCH_SIZE,
+    flush_interval=settings.AUDIT_LOG_FLUSH_INTERVAL,
+)
+atexit.register(audit_buffer.close)
+
+
+def log_event(action, model_name, object_id, user_id=None, details=None):
+    """Queue an ActivityLog row; never blocks on the database."""
+    audit_buffer.enqueue(action, model_name, object_id, user_id=user_id, details=details)
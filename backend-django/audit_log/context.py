@@ -0,0 +1,17 @@
+from contextvars import ContextVar
+
+# Id of the user behind the current request, for signal-driven audit events
+current_user_id = ContextVar('audit_current_user_id', default=None)
+
+
+class AuditUserMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        user = getattr(request, 'user', None)
+        token = current_user_id.set(user.pk if user is not None and user.is_authenticated else None)
+        try:
+            return self.get_response(request)
+        finally:
+            current_user_id.reset(token)
@@ -0,0 +1,132 @@
+# Generated by Django 5.2.9 on 2026-10-17 15:40
+
+from datetime import date
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+def add_months(day, months):
+    index = day.year * 12 + day.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def create_monthly_partitions(apps, schema_editor):
+    # One partition per month from the oldest existing row to 3 months ahead;
+    # must exist before the old rows are copied in
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute('SELECT min("timestamp")::date, now()::date FROM audit_log_activitylog_old')
+        oldest, today = cursor.fetchone()
+        month = date((oldest or today).year, (oldest or today).month, 1)
+        last = add_months(date(today.year, today.month, 1), 3)
+        while month <= last:
+            cursor.execute(
+                f'CREATE TABLE audit_log_activitylog_p{month:%Y%m} PARTITION OF audit_log_activitylog '
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+            )
+            month = add_months(month, 1)
+
+
+class Migration(migrations.Migration):
+
+    atomic = True
+
+    dependencies = [
+        ('audit_log', '0002_activitylog_timestamp_default'),
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    sql="""
+                    ALTER TABLE audit_log_activitylog RENAME TO audit_log_activitylog_old;
+                    -- Free the sequence and primary key names for the new table
+                    ALTER TABLE audit_log_activitylog_old ALTER COLUMN id DROP IDENTITY;
+                    ALTER TABLE audit_log_activitylog_old
+                        RENAME CONSTRAINT audit_log_activitylog_pkey TO audit_log_activitylog_old_pkey;
+
+                    CREATE SEQUENCE audit_log_activitylog_id_seq;
+                    CREATE TABLE audit_log_activitylog (
+                        id bigint NOT NULL DEFAULT nextval('audit_log_activitylog_id_seq'),
+                        action varchar(255) NOT NULL,
+                        model_name varchar(100) NOT NULL,
+                        object_id varchar(50) NOT NULL,
+                        "timestamp" timestamp with time zone NOT NULL,
+                        details jsonb NULL,
+                        user_id bigint NULL REFERENCES users_user (id) DEFERRABLE INITIALLY DEFERRED,
+                        PRIMARY KEY (id, "timestamp")
+                    ) PARTITION BY RANGE ("timestamp");
+                    ALTER SEQUENCE audit_log_activitylog_id_seq OWNED BY audit_log_activitylog.id;
+                    CREATE TABLE audit_log_activitylog_default PARTITION OF audit_log_activitylog DEFAULT;
+                    """,
+                    # Partitions and the id sequence go with the table
+                    reverse_sql="""
+                    DROP TABLE audit_log_activitylog;
+                    ALTER TABLE audit_log_activitylog_old
+                        RENAME CONSTRAINT audit_log_activitylog_old_pkey TO audit_log_activitylog_pkey;
+                    ALTER TABLE audit_log_activitylog_old RENAME TO audit_log_activitylog;
+                    ALTER TABLE audit_log_activitylog ALTER COLUMN id ADD GENERATED BY DEFAULT AS IDENTITY;
+                    SELECT setval(pg_get_serial_sequence('audit_log_activitylog', 'id'),
+                                  COALESCE((SELECT max(id) FROM audit_log_activitylog), 0) + 1, false);
+                    """,
+                ),
+                migrations.RunPython(create_monthly_partitions, migrations.RunPython.noop),
+                migrations.RunSQL(
+                    sql="""
+                    INSERT INTO audit_log_activitylog (id, action, model_name, object_id, "timestamp", details, user_id)
+                    SELECT id, action, model_name, object_id, "timestamp", details, user_id
+                    FROM audit_log_activitylog_old;
+                    SELECT setval('audit_log_activitylog_id_seq', COALESCE((SELECT max(id) FROM audit_log_activitylog), 0) + 1, false);
+                    DROP TABLE audit_log_activitylog_old;
+
+                    CREATE INDEX audit_log_ts_id_idx ON audit_log_activitylog ("timestamp", id);
+                    CREATE INDEX audit_log_ts_brin ON audit_log_activitylog USING brin ("timestamp");
+                    CREATE INDEX audit_log_object_idx ON audit_log_activitylog (model_name, object_id);
+                    CREATE INDEX audit_log_user_ts_idx ON audit_log_activitylog (user_id, "timestamp");
+                    """,
+                    # The plain table as 0001 created it, under the name the
+                    # step above renames back; constraint names are Django's
+                    reverse_sql="""
+                    CREATE TABLE audit_log_activitylog_old (
+                        id bigint NOT NULL,
+                        action varchar(255) NOT NULL,
+                        model_name varchar(100) NOT NULL,
+                        object_id varchar(50) NOT NULL,
+                        "timestamp" timestamp with time zone NOT NULL,
+                        details jsonb NULL,
+                        user_id bigint NULL,
+                        CONSTRAINT audit_log_activitylog_old_pkey PRIMARY KEY (id)
+                    );
+                    ALTER TABLE audit_log_activitylog_old
+                        ADD CONSTRAINT audit_log_activitylog_user_id_1865e1d3_fk_users_user_id
+                        FOREIGN KEY (user_id) REFERENCES users_user (id) DEFERRABLE INITIALLY DEFERRED;
+                    CREATE INDEX audit_log_activitylog_user_id_1865e1d3 ON audit_log_activitylog_old (user_id);
+
+                    INSERT INTO audit_log_activitylog_old (id, action, model_name, object_id, "timestamp", details, user_id)
+                    SELECT id, action, model_name, object_id, "timestamp", details, user_id
+                    FROM audit_log_activitylog;
+                    """,
+                ),
+            ],
+            state_operations=[
+                migrations.AddIndex(
+                    model_name='activitylog',
+                    index=models.Index(fields=['timestamp', 'id'], name='audit_log_ts_id_idx'),
+                ),
+                migrations.AddIndex(
+                    model_name='activitylog',
+                    index=django.contrib.postgres.indexes.BrinIndex(fields=['timestamp'], name='audit_log_ts_brin'),
+                ),
+                migrations.AddIndex(
+                    model_name='activitylog',
+                    index=models.Index(fields=['model_name', 'object_id'], name='audit_log_object_idx'),
+                ),
+                migrations.AddIndex(
+                    model_name='activitylog',
+                    index=models.Index(fields=['user', 'timestamp'], name='audit_log_user_ts_idx'),
+                ),
+            ],
+        ),
+    ]
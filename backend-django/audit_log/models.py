@@ -1,13 +1,26 @@
 from django.db import models
 from django.conf import settings
+from django.contrib.postgres.indexes import BrinIndex
+from django.utils import timezone
 
 class ActivityLog(models.Model):
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True)
     action = models.CharField(max_length=255)
     model_name = models.CharField(max_length=100)
     object_id = models.CharField(max_length=50)
-    timestamp = models.DateTimeField(auto_now_add=True)
+    # Set when the event is queued, not when the batch is flushed
+    timestamp = models.DateTimeField(default=timezone.now, editable=False)
     details = models.JSONField(blank=True, null=True)
 
+    class Meta:
+        # Table is range-partitioned by month on timestamp (migration 0003,
+        # audit_log.partitions); the real primary key is (id, timestamp)
+        indexes = [
+            models.Index(fields=['timestamp', 'id'], name='audit_log_ts_id_idx'),
+            BrinIndex(fields=['timestamp'], name='audit_log_ts_brin'),
+            models.Index(fields=['model_name', 'object_id'], name='audit_log_object_idx'),
+            models.Index(fields=['user', 'timestamp'], name='audit_log_user_ts_idx'),
+        ]
+
     def __str__(self):
         return f"{self.user} - {self.action} on {self.model_name} at {self.timestamp}"
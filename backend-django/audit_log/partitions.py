@@ -0,0 +1,83 @@
+"""Monthly range partitions of audit_log_activitylog on timestamp.
+
+The parent table is created by migration 0003. A DEFAULT partition catches
+anything outside the monthly ones, so inserts never fail; maintenance keeps
+a few future months created ahead of time and drops whole months past the
+retention window (cheap DROP TABLE instead of a huge DELETE).
+"""
+import re
+from datetime import date
+from django.db import connection
+
+PARENT_TABLE = 'audit_log_activitylog'
+PARTITION_NAME = re.compile(r'^audit_log_activitylog_p(\d{4})(\d{2})$')
+
+
+def month_start(day):
+    return date(day.year, day.month, 1)
+
+
+def add_months(day, months):
+    index = day.year * 12 + day.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month):
+    return f'{PARENT_TABLE}_p{month:%Y%m}'
+
+
+def existing_partitions(cursor):
+    cursor.execute(
+        """
+        SELECT child.relname
+        FROM pg_inherits
+        JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+        JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        WHERE parent.relname = %s
+        """,
+        [PARENT_TABLE],
+    )
+    return {row[0] for row in cursor.fetchall()}
+
+
+def ensure_partitions(first_month, last_month, using=connection):
+    """Create monthly partitions for [first_month, last_month] if missing."""
+    created = []
+    with using.cursor() as cursor:
+        existing = existing_partitions(cursor)
+        month = month_start(first_month)
+        while month <= last_month:
+            name = partition_name(month)
+            if name not in existing:
+                cursor.execute(
+                    f'CREATE TABLE {name} PARTITION OF {PARENT_TABLE} '
+                    f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+                )
+                created.append(name)
+            month = add_months(month, 1)
+    return created
+
+
+def drop_partitions_before(cutoff_month, using=connection):
+    """Drop monthly partitions that end on or before cutoff_month."""
+    dropped = []
+    with using.cursor() as cursor:
+        for name in sorted(existing_partitions(cursor)):
+            match = PARTITION_NAME.match(name)
+            if not match:
+                continue  # the DEFAULT partition
+            month = date(int(match.group(1)), int(match.group(2)), 1)
+            if add_months(month, 1) <= cutoff_month:
+                cursor.execute(f'DROP TABLE {name}')
+                dropped.append(name)
+    return dropped
+
+
+def estimated_rows(queryset):
+    """Planner row estimate for a queryset, instead of an exact COUNT(*)."""
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN {sql}', params)
+        plan = cursor.fetchone()[0]
+    match = re.search(r'rows=(\d+)', plan)
+    return int(match.group(1)) if match else 0
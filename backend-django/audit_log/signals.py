@@ -0,0 +1,48 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from billing.models import Invoice
+from bookings.models import Booking
+from housekeeping.models import HousekeepingTask
+from rooms.models import Room
+from .buffer import log_event
+from .context import current_user_id
+
+AUDITED_MODELS = (Booking, Room, Invoice, HousekeepingTask)
+
+# Small, stable subset of fields worth keeping per model
+AUDIT_FIELDS = {
+    Booking: ('room_id', 'guest_id', 'check_in', 'check_out', 'status'),
+    Room: ('room_number', 'status', 'floor'),
+    Invoice: ('invoice_number', 'booking_id', 'paid_at'),
+    HousekeepingTask: ('room_id', 'assigned_to_id', 'status'),
+}
+
+
+def _details(instance, update_fields=None):
+    details = {field: getattr(instance, field) for field in AUDIT_FIELDS[type(instance)]}
+    if update_fields:
+        details['update_fields'] = sorted(update_fields)
+    # JSONField needs plain values
+    return {key: value if isinstance(value, (int, str, list, type(None))) else str(value)
+            for key, value in details.items()}
+
+
+def _log_on_commit(action, instance, details):
+    user_id = current_user_id.get()
+    model_name = type(instance).__name__
+    object_id = instance.pk
+    # Only record changes that actually committed
+    transaction.on_commit(lambda: log_event(action, model_name, object_id, user_id=user_id, details=details))
+
+
+def audit_saved(sender, instance, created, update_fields=None, **kwargs):
+    _log_on_commit('created' if created else 'updated', instance, _details(instance, update_fields))
+
+
+def audit_deleted(sender, instance, **kwargs):
+    _log_on_commit('deleted', instance, _details(instance))
+
+
+for model in AUDITED_MODELS:
+    post_save.connect(audit_saved, sender=model, dispatch_uid=f'audit_saved_{model.__name__}')
+    post_delete.connect(audit_deleted, sender=model, dispatch_uid=f'audit_deleted_{model.__name__}')
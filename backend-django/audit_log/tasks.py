@@ -0,0 +1,13 @@
+from celery import shared_task
+from django.conf import settings
+from django.utils import timezone
+from .partitions import add_months, drop_partitions_before, ensure_partitions, month_start
+
+
+@shared_task
+def maintain_partitions():
+    """Pre-create upcoming monthly partitions and drop expired ones."""
+    this_month = month_start(timezone.now().date())
+    created = ensure_partitions(this_month, add_months(this_month, settings.AUDIT_LOG_PARTITIONS_AHEAD))
+    dropped = drop_partitions_before(add_months(this_month, -settings.AUDIT_LOG_RETENTION_MONTHS))
+    return f"Audit log partitions: created {len(created)}, dropped {len(dropped)}"
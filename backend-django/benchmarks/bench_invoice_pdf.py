@@ -0,0 +1,31 @@
+from decimal import Decimal
+import pytest
+from billing.tasks import invoice_fingerprint, render_invoice_pdf
+
+
+def invoice_data(lines):
+    items = [
+        (f'Room Charge (Deluxe Suite, night {i + 1})', 1, Decimal('250.00'), Decimal('250.00'))
+        for i in range(lines)
+    ]
+    return {
+        'invoice_number': 'INV-100042',
+        'issued_at': '2026-10-17',
+        'guest': 'guest42',
+        'room': '204',
+        'items': items,
+        'total': sum((item[3] for item in items), Decimal('0')),
+    }
+
+
+@pytest.mark.parametrize('lines', [1, 30])
+def bench_render_invoice_pdf(benchmark, lines):
+    data = invoice_data(lines)
+    pdf = benchmark(render_invoice_pdf, data)
+    assert pdf.startswith(b'%PDF')
+
+
+def bench_invoice_fingerprint(benchmark):
+    # Runs for every invoice on every render request, changed or not
+    data = invoice_data(30)
+    benchmark(invoice_fingerprint, data)
@@ -0,0 +1,15 @@
+"""Benchmarks for the CPU-bound parts of invoice PDF generation.
+
+    cd backend-django
+    python -m pytest -c benchmarks/pytest.ini benchmarks
+
+No database is needed: the render path is benchmarked from the same plain
+snapshot billing.tasks.invoice_render_data() produces. Baselines use
+pytest-benchmark's JSON storage (--benchmark-save / --benchmark-compare-fail).
+"""
+import os
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
+django.setup()
@@ -7,5 +7,8 @@ class LineItemInline(admin.TabularInline):
 
 @admin.register(Invoice)
 class InvoiceAdmin(admin.ModelAdmin):
-    list_display = ('invoice_number', 'booking', 'issued_at', 'total_amount', 'paid_at')
+    list_display = ('invoice_number', 'booking', 'issued_at', 'total', 'line_count', 'paid_at')
+    # Booking.__str__ reads guest and room
+    list_select_related = ('booking__guest', 'booking__room')
+    readonly_fields = ('total', 'line_count')
     inlines = [LineItemInline]
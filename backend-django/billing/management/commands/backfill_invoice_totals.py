@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Max
+from billing.models import Invoice
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the stored Invoice.total / line_count from line items'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=10000,
+                            help='Invoice id range updated per statement')
+
+    def handle(self, *args, **options):
+        batch = options['batch_size']
+        last_id = Invoice.objects.aggregate(m=Max('id'))['m'] or 0
+        updated = 0
+        # Id-range batches keep each UPDATE (and its row locks) short
+        for start in range(0, last_id + 1, batch):
+            updated += Invoice.recalculate_totals(Invoice.objects.filter(id__gte=start, id__lt=start + batch))
+        self.stdout.write(self.style.SUCCESS(f'Backfilled totals for {updated} invoices'))
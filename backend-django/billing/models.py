@@ -1,4 +1,7 @@
+from decimal import Decimal
 from django.db import models
+from django.db.models import Count, DecimalField, F, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
 from bookings.models import Booking
 
 class Invoice(models.Model):
@@ -8,10 +11,33 @@ class Invoice(models.Model):
     due_date = models.DateField()
     paid_at = models.DateTimeField(blank=True, null=True)
     pdf_file = models.FileField(upload_to="invoices/", blank=True, null=True)
+    # sha256 of the rendered content (billing.tasks.invoice_fingerprint)
+    pdf_fingerprint = models.CharField(max_length=64, blank=True, default='', editable=False)
+    # Denormalized from the line items; maintained by billing.signals
+    total = models.DecimalField(max_digits=12, decimal_places=2, default=0, editable=False)
+    line_count = models.PositiveIntegerField(default=0, editable=False)
 
     @property
     def total_amount(self):
-        return sum(item.amount for item in self.items.all())
+        return self.total
+
+    @classmethod
+    def apply_line_delta(cls, invoice_id, amount, count):
+        # Atomic in-place increment; no read of the other line items
+        cls.objects.filter(pk=invoice_id).update(
+            total=F('total') + amount,
+            line_count=F('line_count') + count,
+        )
+
+    @classmethod
+    def recalculate_totals(cls, queryset):
+        """Recompute stored totals from the line items with one UPDATE."""
+        items = LineItem.objects.filter(invoice=OuterRef('pk')).order_by().values('invoice')
+        amount = Sum(F('quantity') * F('unit_price'), output_field=DecimalField(max_digits=12, decimal_places=2))
+        return queryset.update(
+            total=Coalesce(Subquery(items.annotate(s=amount).values('s')), Value(Decimal('0'))),
+            line_count=Coalesce(Subquery(items.annotate(c=Count('id')).values('c')), Value(0)),
+        )
 
     def __str__(self):
         return f"Invoice {self.invoice_number} for {self.booking}"
@@ -21,6 +47,16 @@ class LineItem(models.Model):
     description = models.CharField(max_length=200)
     quantity = models.PositiveIntegerField(default=1)
     unit_price = models.DecimalField(max_digits=10, decimal_places=2)
+
+    # (invoice_id, amount) as last read from / written to the DB, so saves
+    # can apply a delta to Invoice.total instead of re-summing
+    _tracked = None
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._tracked = (instance.invoice_id, instance.amount)
+        return instance
     
     @property
     def amount(self):
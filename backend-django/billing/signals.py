@@ -0,0 +1,28 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import Invoice, LineItem
+
+
+@receiver(post_save, sender=LineItem)
+def update_invoice_totals_on_save(sender, instance, created, **kwargs):
+    previous = instance._tracked
+    if created:
+        Invoice.apply_line_delta(instance.invoice_id, instance.amount, 1)
+    elif previous is None:
+        # Saved without being loaded first; previous amount unknown
+        Invoice.recalculate_totals(Invoice.objects.filter(pk=instance.invoice_id))
+    else:
+        old_invoice_id, old_amount = previous
+        if old_invoice_id == instance.invoice_id:
+            if instance.amount != old_amount:
+                Invoice.apply_line_delta(instance.invoice_id, instance.amount - old_amount, 0)
+        else:
+            Invoice.apply_line_delta(old_invoice_id, -old_amount, -1)
+            Invoice.apply_line_delta(instance.invoice_id, instance.amount, 1)
+    instance._tracked = (instance.invoice_id, instance.amount)
+
+
+@receiver(post_delete, sender=LineItem)
+def update_invoice_totals_on_delete(sender, instance, **kwargs):
+    invoice_id, amount = instance._tracked or (instance.invoice_id, instance.amount)
+    Invoice.apply_line_delta(invoice_id, -amount, -1)
@@ -1,31 +1,92 @@
-from celery import shared_task
+from celery import shared_task, chord
 from django.core.files.base import ContentFile
 from django.conf import settings
+from django.db import transaction
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter
+from redis.exceptions import RedisError
+import hashlib
 import io
+import json
+import logging
 import os
+import time
+from core.redis_client import get_redis
 from .models import Invoice
 
-@shared_task
-def generate_invoice_pdf(invoice_id):
-    try:
-        invoice = Invoice.objects.get(id=invoice_id)
-    except Invoice.DoesNotExist:
-        return f"Invoice {invoice_id} not found"
+logger = logging.getLogger(__name__)
+
+PAGE_WIDTH, PAGE_HEIGHT = letter
+
+# Invoices rendered per chord member / per process pool task
+PDF_BATCH_CHUNK_SIZE = 100
+
+# Set by the FastAPI invoices router while a render is queued/running
+# (value: task id); must match app/routers/invoices.py
+PDF_RENDER_LOCK_PREFIX = 'invoice-pdf-render:'
+RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+def invoices_for_render():
+    # Everything the PDF needs in a constant number of queries:
+    # one for invoice+booking+guest+room, one for all line items
+    return Invoice.objects.select_related('booking__guest', 'booking__room').prefetch_related('items')
+
+
+def invoice_render_data(invoice):
+    """Plain, picklable snapshot of what goes on the PDF."""
+    items = [
+        (item.description, item.quantity, item.unit_price, item.amount)
+        for item in invoice.items.all()
+    ]
+    return {
+        'invoice_number': invoice.invoice_number,
+        'issued_at': invoice.issued_at.strftime('%Y-%m-%d'),
+        'guest': invoice.booking.guest.username,
+        'room': invoice.booking.room.room_number,
+        'items': items,
+        'total': invoice.total,
+    }
+
+
+def invoice_fingerprint(data):
+    """Content hash of everything that ends up on the PDF."""
+    canonical = json.dumps(data, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
 
+def pdf_filename(invoice, fingerprint):
+    # Content-addressed: identical content maps to the same file name
+    return f"invoice_{invoice.invoice_number}_{fingerprint[:16]}.pdf"
+
+
+def is_pdf_current(invoice, fingerprint):
+    return (
+        invoice.pdf_fingerprint == fingerprint
+        and bool(invoice.pdf_file)
+        and invoice.pdf_file.storage.exists(invoice.pdf_file.name)
+    )
+
+
+def render_invoice_pdf(data):
+    """Render one invoice to PDF bytes. Pure function, safe in a process pool."""
     buffer = io.BytesIO()
     p = canvas.Canvas(buffer, pagesize=letter)
-    width, height = letter
+    height = PAGE_HEIGHT
 
     # Draw Invoice Header
     p.setFont("Helvetica-Bold", 24)
-    p.drawString(50, height - 50, f"INVOICE #{invoice.invoice_number}")
+    p.drawString(50, height - 50, f"INVOICE #{data['invoice_number']}")
 
     p.setFont("Helvetica", 12)
-    p.drawString(50, height - 80, f"Date: {invoice.issued_at.strftime('%Y-%m-%d')}")
-    p.drawString(50, height - 100, f"Guest: {invoice.booking.guest.username}")
-    p.drawString(50, height - 120, f"Room: {invoice.booking.room.room_number}")
+    p.drawString(50, height - 80, f"Date: {data['issued_at']}")
+    p.drawString(50, height - 100, f"Guest: {data['guest']}")
+    p.drawString(50, height - 120, f"Room: {data['room']}")
 
     # Draw Line Items
     y = height - 160
@@ -34,16 +95,16 @@ def generate_invoice_pdf(invoice_id):
     p.drawString(300, y, "Qty")
     p.drawString(400, y, "Unit Price")
     p.drawString(500, y, "Amount")
-    
+
     y -= 20
     p.line(50, y+15, 550, y+15)
-    
+
     p.setFont("Helvetica", 12)
-    for item in invoice.items.all():
-        p.drawString(50, y, item.description)
-        p.drawString(300, y, str(item.quantity))
-        p.drawString(400, y, f"${item.unit_price}")
-        p.drawString(500, y, f"${item.amount}")
+    for description, quantity, unit_price, amount in data['items']:
+        p.drawString(50, y, description)
+        p.drawString(300, y, str(quantity))
+        p.drawString(400, y, f"${unit_price}")
+        p.drawString(500, y, f"${amount}")
         y -= 20
 
     # Total
@@ -51,15 +112,132 @@ def generate_invoice_pdf(invoice_id):
     p.line(50, y+15, 550, y+15)
     p.setFont("Helvetica-Bold", 14)
     p.drawString(400, y, "Total:")
-    p.drawString(500, y, f"${invoice.total_amount}")
+    p.drawString(500, y, f"${data['total']}")
 
     p.showPage()
     p.save()
+    return buffer.getvalue()
+
+
+def attach_pdf(invoice, pdf_bytes, fingerprint):
+    """Write the file to storage without saving the model row.
+
+    Returns the name of the file this render supersedes (or None); it is
+    still what the row points at, so remove it only via save_rendered_pdfs().
+    """
+    previous = invoice.pdf_file.name or None
+    invoice.pdf_file.save(pdf_filename(invoice, fingerprint), ContentFile(pdf_bytes), save=False)
+    invoice.pdf_fingerprint = fingerprint
+    return previous if previous != invoice.pdf_file.name else None
+
+
+def save_rendered_pdfs(invoices, superseded):
+    """Point the rows at their new files, then delete the old ones.
+
+    Deleting only after commit means a concurrent download always finds
+    whichever file the row currently names.
+    """
+    superseded = [name for name in superseded if name]
+    with transaction.atomic():
+        Invoice.objects.bulk_update(invoices, ['pdf_file', 'pdf_fingerprint'])
+        if superseded:
+            transaction.on_commit(lambda: delete_pdf_files(superseded))
+
+
+def delete_pdf_files(names):
+    storage = Invoice._meta.get_field('pdf_file').storage
+    for name in names:
+        storage.delete(name)
+
+
+def release_render_lock(invoice_id, task_id):
+    try:
+        get_redis().eval(RELEASE_LOCK_SCRIPT, 1, f'{PDF_RENDER_LOCK_PREFIX}{invoice_id}', task_id)
+    except RedisError as e:
+        logger.warning("Could not release PDF render lock for invoice %s: %s", invoice_id, e)
+
+
+@shared_task(bind=True)
+def generate_invoice_pdf(self, invoice_id):
+    try:
+        try:
+            invoice = invoices_for_render().get(id=invoice_id)
+        except Invoice.DoesNotExist:
+            return f"Invoice {invoice_id} not found"
+
+        data = invoice_render_data(invoice)
+        fingerprint = invoice_fingerprint(data)
+        if is_pdf_current(invoice, fingerprint):
+            return f"PDF for Invoice {invoice.invoice_number} is up to date"
+
+        superseded = attach_pdf(invoice, render_invoice_pdf(data), fingerprint)
+        save_rendered_pdfs([invoice], [superseded])
+
+        return f"PDF generated for Invoice {invoice.invoice_number}"
+    finally:
+        if self.request.id:
+            release_render_lock(invoice_id, self.request.id)
+
+
+@shared_task
+def render_invoice_pdf_chunk(invoice_ids):
+    """Render a chunk of invoices: 2 reads + 1 bulk UPDATE regardless of size.
+
+    Invoices whose PDF already matches their content are skipped.
+    """
+    rendered, superseded = [], []
+    for invoice in invoices_for_render().filter(id__in=invoice_ids):
+        data = invoice_render_data(invoice)
+        fingerprint = invoice_fingerprint(data)
+        if not is_pdf_current(invoice, fingerprint):
+            superseded.append(attach_pdf(invoice, render_invoice_pdf(data), fingerprint))
+            rendered.append(invoice)
+    save_rendered_pdfs(rendered, superseded)
+    return len(rendered)
+
+
+@shared_task
+def summarize_invoice_pdf_batch(rendered_counts, requested, started_at):
+    elapsed = max(time.time() - started_at, 1e-6)
+    rendered = sum(rendered_counts)
+    summary = {
+        'requested': requested,
+        'rendered': rendered,
+        'skipped_up_to_date': requested - rendered,
+        'seconds': round(elapsed, 2),
+        'per_second': round(rendered / elapsed, 1),
+    }
+    logger.info("Invoice PDF batch finished: %s", summary)
+    return summary
+
+
+def select_invoice_ids(invoice_ids=None, issued_from=None, issued_to=None, unpaid_only=False):
+    qs = Invoice.objects.all()
+    if invoice_ids is not None:
+        qs = qs.filter(id__in=invoice_ids)
+    if issued_from:
+        qs = qs.filter(issued_at__date__gte=issued_from)
+    if issued_to:
+        qs = qs.filter(issued_at__date__lte=issued_to)
+    if unpaid_only:
+        qs = qs.filter(paid_at__isnull=True)
+    return list(qs.order_by('id').values_list('id', flat=True))
+
+
+@shared_task
+def generate_invoice_pdfs(invoice_ids=None, issued_from=None, issued_to=None, unpaid_only=False,
+                          chunk_size=PDF_BATCH_CHUNK_SIZE):
+    """Fan a batch of invoices out over the workers as a chord of chunks.
+
+    Select by explicit ids and/or issue date range (ISO dates). The chord
+    callback reports throughput once every chunk is done.
+    """
+    ids = select_invoice_ids(invoice_ids, issued_from, issued_to, unpaid_only)
+    if not ids:
+        return "No invoices to render"
 
-    buffer.seek(0)
-    
-    # Save to model
-    filename = f"invoice_{invoice.invoice_number}.pdf"
-    invoice.pdf_file.save(filename, ContentFile(buffer.getvalue()), save=True)
-    
-    return f"PDF generated for Invoice {invoice.invoice_number}"
+    chunks = [ids[i:i + chunk_size] for i in range(0, len(ids), chunk_size)]
+    result = chord(render_invoice_pdf_chunk.s(chunk) for chunk in chunks)(
+        summarize_invoice_pdf_batch.s(len(ids), time.time())
+    )
+    return f"Rendering {len(ids)} invoices in {len(chunks)} chunks (summary task {result.id})"
@@ -1,8 +1,25 @@
 from django.contrib import admin
-from .models import Booking
+from .models import Booking, RoomNight
 
 @admin.register(Booking)
 class BookingAdmin(admin.ModelAdmin):
-    list_display = ('id', 'guest', 'room', 'check_in', 'check_out', 'status')
+    list_display = ('id', 'guest', 'room', 'check_in', 'check_out', 'status', 'total_price')
+    # Priced from the rate calendar on save (Booking.needs_pricing)
+    readonly_fields = ('total_price',)
     list_filter = ('status', 'check_in')
     search_fields = ('guest__username', 'room__room_number')
+
+@admin.register(RoomNight)
+class RoomNightAdmin(admin.ModelAdmin):
+    list_display = ('room', 'night', 'booking', 'status', 'nightly_rate')
+    list_filter = ('status',)
+    list_select_related = ('room',)
+    raw_id_fields = ('booking',)
+    date_hierarchy = 'night'
+
+    # Derived from Booking; rebuilt automatically
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,104 @@
+"""Per-room availability bitmaps in Redis.
+
+One bitmap per room per year at inventory:room:<room_id>:<year>; bit
+(day of year - 1) is set when that night is booked. Bit WARM_BIT marks a
+key as fully loaded, so a missing key (or a cleared sentinel) means "not
+cached" rather than "all free". FastAPI reads these for
+GET /rooms/{id}/calendar and loads cold years from bookings.RoomNight.
+
+Writers only touch keys that are already warm, and bump a per-key
+generation counter so a reader that loaded from the database before the
+write does not store a stale bitmap. Must match
+backend-fastapi/app/inventory.py.
+"""
+import logging
+from collections import defaultdict
+from datetime import date, timedelta
+from django.conf import settings
+from redis.exceptions import RedisError
+from core.redis_client import get_redis
+from .models import RoomNight
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = 'inventory:room:'
+WARM_BIT = 367
+BITMAP_BYTES = WARM_BIT // 8 + 1
+
+# KEYS: bitmap and generation key per year, interleaved;
+# ARGV: bit value, generation TTL, then first/last bit per year
+UPDATE_SCRIPT = """
+local value = tonumber(ARGV[1])
+for i = 1, #KEYS, 2 do
+    redis.call('INCR', KEYS[i + 1])
+    redis.call('EXPIRE', KEYS[i + 1], ARGV[2])
+    if redis.call('GETBIT', KEYS[i], %d) == 1 then
+        local n = (i + 1) / 2
+        for bit = tonumber(ARGV[1 + 2 * n]), tonumber(ARGV[2 + 2 * n]) do
+            redis.call('SETBIT', KEYS[i], bit, value)
+        end
+    end
+end
+return 1
+""" % WARM_BIT
+
+
+def bitmap_key(room_id, year):
+    return f'{KEY_PREFIX}{room_id}:{year}'
+
+
+def generation_key(room_id, year):
+    return f'{bitmap_key(room_id, year)}:gen'
+
+
+def bit_ranges(check_in, check_out):
+    """{year: (first_bit, last_bit)} for the nights in [check_in, check_out)."""
+    ranges = {}
+    night = check_in
+    while night < check_out:
+        year_end = min(check_out, date(night.year + 1, 1, 1))
+        first = night.timetuple().tm_yday - 1
+        last = (year_end - timedelta(days=1)).timetuple().tm_yday - 1
+        ranges[night.year] = (first, last)
+        night = year_end
+    return ranges
+
+
+def build_bitmap(nights):
+    """Warm bitmap bytes for one year from the booked nights in it."""
+    buf = bytearray(BITMAP_BYTES)
+    for bit in [night.timetuple().tm_yday - 1 for night in nights] + [WARM_BIT]:
+        buf[bit >> 3] |= 0x80 >> (bit & 7)
+    return bytes(buf)
+
+
+def update_nights(room_id, check_in, check_out, booked):
+    """Set (booked) or clear the nights of one stay. Call after commit."""
+    ranges = bit_ranges(check_in, check_out)
+    if not ranges:
+        return
+    keys, args = [], [1 if booked else 0, settings.INVENTORY_CACHE_TTL * 2]
+    for year, (first, last) in ranges.items():
+        keys += [bitmap_key(room_id, year), generation_key(room_id, year)]
+        args += [first, last]
+    try:
+        get_redis().eval(UPDATE_SCRIPT, len(keys), *keys, *args)
+    except RedisError as e:
+        # The bitmap expires within INVENTORY_CACHE_TTL; rebuild_inventory_bitmaps fixes it sooner
+        logger.warning('Could not update inventory bitmap for room %s: %s', room_id, e)
+
+
+def rebuild_bitmaps(room_ids, year):
+    """Load the given rooms' bitmaps for one year from RoomNight."""
+    nights = defaultdict(list)
+    for room_id, night in RoomNight.objects.filter(
+        room_id__in=room_ids, night__year=year,
+    ).values_list('room_id', 'night'):
+        nights[room_id].append(night)
+    pipe = get_redis().pipeline(transaction=False)
+    for room_id in room_ids:
+        pipe.set(bitmap_key(room_id, year), build_bitmap(nights[room_id]), ex=settings.INVENTORY_CACHE_TTL)
+        # Invalidate any cold load that read the database before this one
+        pipe.incr(generation_key(room_id, year))
+        pipe.expire(generation_key(room_id, year), settings.INVENTORY_CACHE_TTL * 2)
+    pipe.execute()
@@ -0,0 +1,24 @@
+from django.db import connection
+
+# Advisory lock namespace for per-room booking writes. The FastAPI service
+# uses the same value (app/locking.py) so both writers serialize on one key.
+BOOKING_LOCK_NAMESPACE = 7301
+
+# SQLSTATE raised by the booking_no_overlap exclusion constraint
+EXCLUSION_VIOLATION = '23P01'
+
+
+def lock_room(room_id):
+    """Serialize booking writes for one room until the transaction ends.
+
+    Must be called inside transaction.atomic(); writers for other rooms are
+    not blocked.
+    """
+    if connection.vendor != 'postgresql':
+        return
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT pg_advisory_xact_lock(%s, %s)', [BOOKING_LOCK_NAMESPACE, room_id])
+
+
+def is_exclusion_violation(exc):
+    return getattr(exc.__cause__, 'sqlstate', None) == EXCLUSION_VIOLATION
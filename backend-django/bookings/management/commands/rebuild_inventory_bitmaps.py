@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rooms.models import Room
+from bookings.inventory import rebuild_bitmaps
+
+
+class Command(BaseCommand):
+    help = 'Reloads the Redis availability bitmaps from the room-night table'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--year', type=int, action='append', dest='years',
+                            help='Year to load (repeatable; default: this year and next)')
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        this_year = timezone.localdate().year
+        years = options['years'] or [this_year, this_year + 1]
+        room_ids = list(Room.objects.order_by('id').values_list('id', flat=True))
+        size = options['batch_size']
+        for year in years:
+            for i in range(0, len(room_ids), size):
+                rebuild_bitmaps(room_ids[i:i + size], year)
+            self.stdout.write(f'{year}: {len(room_ids)} rooms')
+        self.stdout.write(self.style.SUCCESS('Inventory bitmaps rebuilt'))
@@ -0,0 +1,17 @@
+from datetime import date
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from bookings.room_nights import reconcile_room_nights
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the room-night table from bookings (all dates by default)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--since', type=date.fromisoformat, default=date.min,
+                            help='Only reconcile nights on or after this date (YYYY-MM-DD)')
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            deleted, upserted = reconcile_room_nights(options['since'])
+        self.stdout.write(self.style.SUCCESS(f'Room nights rebuilt: {deleted} removed, {upserted} upserted'))
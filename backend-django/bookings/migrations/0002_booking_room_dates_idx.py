@@ -0,0 +1,17 @@
+# Generated by Django 5.2.9 on 2026-10-17 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(condition=models.Q(('status__in', ['cancelled', 'no_show']), _negated=True), fields=['room', 'check_in', 'check_out'], name='booking_room_dates_idx'),
+        ),
+    ]
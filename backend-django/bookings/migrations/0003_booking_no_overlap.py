@@ -0,0 +1,23 @@
+# Generated by Django 5.2.9 on 2026-10-17 10:04
+
+import bookings.models
+import django.contrib.postgres.constraints
+import django.contrib.postgres.fields.ranges
+from django.contrib.postgres.operations import BtreeGistExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0002_booking_room_dates_idx'),
+    ]
+
+    operations = [
+        # GiST equality on the integer room_id needs btree_gist
+        BtreeGistExtension(),
+        migrations.AddConstraint(
+            model_name='booking',
+            constraint=django.contrib.postgres.constraints.ExclusionConstraint(condition=models.Q(('status__in', ['cancelled', 'no_show']), _negated=True), expressions=[(bookings.models.DateRange('check_in', 'check_out', django.contrib.postgres.fields.ranges.RangeBoundary()), '&&'), ('room', '=')], name='booking_no_overlap', violation_error_message='This room is already booked for the selected dates.'),
+        ),
+    ]
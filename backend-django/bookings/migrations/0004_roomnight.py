@@ -0,0 +1,30 @@
+# Generated by Django 5.2.9 on 2026-10-17 16:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0003_booking_no_overlap'),
+        ('rooms', '0002_nightlyrate'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RoomNight',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('night', models.DateField()),
+                ('status', models.CharField(choices=[('reserved', 'Reserved'), ('checked_in', 'Checked In'), ('checked_out', 'Checked Out'), ('cancelled', 'Cancelled'), ('no_show', 'No Show')], max_length=20)),
+                ('nightly_rate', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('booking', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='room_nights', to='bookings.booking')),
+                ('room', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='room_nights', to='rooms.room')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['night'], name='room_night_night_idx')],
+                'constraints': [models.UniqueConstraint(fields=('room', 'night'), name='room_night_room_night_uniq')],
+            },
+        ),
+    ]
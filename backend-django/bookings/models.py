@@ -1,8 +1,16 @@
-from django.db import models
+from django.db import models, transaction, IntegrityError
 from django.conf import settings
+from django.contrib.postgres.constraints import ExclusionConstraint
+from django.contrib.postgres.fields import DateRangeField, RangeBoundary, RangeOperators
 from django.utils.translation import gettext_lazy as _
 from django.core.exceptions import ValidationError
 from rooms.models import Room
+from rooms.pricing import quote
+from .locks import lock_room, is_exclusion_violation
+
+class DateRange(models.Func):
+    function = 'DATERANGE'
+    output_field = DateRangeField()
 
 class Booking(models.Model):
     class Status(models.TextChoices):
@@ -21,6 +29,57 @@ class Booking(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # Overlap lookups (Booking.clean, FastAPI availability search)
+            # only ever look at bookings that still hold the room
+            models.Index(
+                fields=['room', 'check_in', 'check_out'],
+                name='booking_room_dates_idx',
+                condition=~models.Q(status__in=['cancelled', 'no_show']),
+            ),
+        ]
+        constraints = [
+            # Last line of defence against double booking: no two active
+            # bookings of the same room may have overlapping [check_in, check_out)
+            ExclusionConstraint(
+                name='booking_no_overlap',
+                expressions=[
+                    (DateRange('check_in', 'check_out', RangeBoundary()), RangeOperators.OVERLAPS),
+                    ('room', RangeOperators.EQUAL),
+                ],
+                condition=~models.Q(status__in=['cancelled', 'no_show']),
+                violation_error_message=_("This room is already booked for the selected dates."),
+            ),
+        ]
+
+    # (room_id, check_in, check_out, status, total_price) as loaded, so
+    # post_save can tell whether the room-night rows need rebuilding
+    _tracked = None
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._tracked = instance.room_night_key()
+        return instance
+
+    def room_night_key(self):
+        return (self.room_id, self.check_in, self.check_out, self.status, self.total_price)
+
+    @property
+    def is_active(self):
+        return self.status not in (self.Status.CANCELLED, self.Status.NO_SHOW)
+
+    def needs_pricing(self):
+        """New stays without a price, and stays whose room or dates changed."""
+        if self.room_id is None or self.check_in is None or self.check_out is None:
+            return False
+        if self.check_in >= self.check_out:
+            return False  # full_clean reports it
+        if self.total_price is None:
+            return True
+        return self._tracked is not None and self._tracked[:3] != (self.room_id, self.check_in, self.check_out)
+
     def clean(self):
         # Prevent overlapping bookings for the same room
         overlapping = Booking.objects.filter(
@@ -36,8 +95,48 @@ class Booking(models.Model):
             raise ValidationError(_("Check-out date must be after check-in date."))
 
     def save(self, *args, **kwargs):
-        self.full_clean()
-        super().save(*args, **kwargs)
+        # The per-room advisory lock makes the overlap check in clean() race
+        # free; the exclusion constraint backs it up for writers that skip
+        # the lock (raw SQL, bulk_create).
+        with transaction.atomic():
+            lock_room(self.room_id)
+            if self.needs_pricing():
+                # Same rate calendar FastAPI quotes from (app/pricing.py)
+                self.total_price = quote(self.room.room_type, self.check_in, self.check_out)
+            # clean() already ran the overlap query under the lock
+            self.full_clean(validate_constraints=False)
+            try:
+                super().save(*args, **kwargs)
+            except IntegrityError as exc:
+                if is_exclusion_violation(exc):
+                    raise ValidationError(_("This room is already booked for the selected dates."))
+                raise
 
     def __str__(self):
         return f"Booking {self.pk}: {self.guest.username} in {self.room.room_number}"
+
+
+class RoomNight(models.Model):
+    """One row per occupied (room, night) of an active booking.
+
+    Derived from Booking: rebuilt by bookings.signals on every booking write
+    and reconciled periodically by bookings.tasks.reconcile_room_nights.
+    Cancelled / no-show bookings have no rows, so (room, night) is unique.
+    """
+    room = models.ForeignKey(Room, on_delete=models.CASCADE, related_name="room_nights")
+    night = models.DateField()
+    booking = models.ForeignKey(Booking, on_delete=models.CASCADE, related_name="room_nights")
+    status = models.CharField(max_length=20, choices=Booking.Status.choices)
+    nightly_rate = models.DecimalField(max_digits=12, decimal_places=2)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['room', 'night'], name='room_night_room_night_uniq'),
+        ]
+        indexes = [
+            # Whole-property reports scan a night range across all rooms
+            models.Index(fields=['night'], name='room_night_night_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.room_id} @ {self.night} (booking {self.booking_id})"
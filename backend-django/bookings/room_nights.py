@@ -0,0 +1,92 @@
+"""Keep bookings.RoomNight in step with Booking.
+
+Nightly revenue is the booking total spread evenly over its nights; the
+rounding remainder goes on the last night so the rows always sum back to
+total_price. RECONCILE_SQL below applies exactly the same split.
+"""
+from datetime import timedelta
+from decimal import Decimal, ROUND_HALF_UP
+from django.db import connection
+from .models import Booking, RoomNight
+
+CENT = Decimal('0.01')
+INACTIVE_STATUSES = (Booking.Status.CANCELLED, Booking.Status.NO_SHOW)
+
+
+def nightly_rates(total_price, nights):
+    if nights <= 0:
+        return []
+    total = Decimal(total_price or 0)
+    per_night = (total / nights).quantize(CENT, rounding=ROUND_HALF_UP)
+    return [per_night] * (nights - 1) + [total - per_night * (nights - 1)]
+
+
+def room_night_rows(booking):
+    if not booking.is_active:
+        return []
+    nights = (booking.check_out - booking.check_in).days
+    return [
+        RoomNight(
+            room_id=booking.room_id,
+            night=booking.check_in + timedelta(days=offset),
+            booking_id=booking.pk,
+            status=booking.status,
+            nightly_rate=rate,
+        )
+        for offset, rate in enumerate(nightly_rates(booking.total_price, nights))
+    ]
+
+
+def sync_room_nights(booking):
+    """Replace the booking's rows (call inside the booking's transaction)."""
+    RoomNight.objects.filter(booking_id=booking.pk).delete()
+    RoomNight.objects.bulk_create(room_night_rows(booking))
+
+
+# Set-based repair for writers that bypass the signals (queryset.update(),
+# raw SQL, a crashed worker). Only bookings/nights from %(cutoff)s onward
+# are touched so the hourly run stays cheap; pass a far past date for a
+# full rebuild.
+RECONCILE_DELETE_SQL = """
+DELETE FROM bookings_roomnight rn
+USING bookings_booking b
+WHERE rn.booking_id = b.id
+  AND rn.night >= %(cutoff)s
+  AND (b.status = ANY(%(inactive)s)
+       OR rn.room_id <> b.room_id
+       OR rn.night < b.check_in
+       OR rn.night >= b.check_out)
+"""
+
+RECONCILE_UPSERT_SQL = """
+INSERT INTO bookings_roomnight (room_id, night, booking_id, status, nightly_rate)
+SELECT b.room_id, gs.night::date, b.id, b.status,
+       CASE WHEN gs.night::date = b.check_out - 1
+            THEN b.total_price - ROUND(b.total_price / (b.check_out - b.check_in), 2) * (b.check_out - b.check_in - 1)
+            ELSE ROUND(b.total_price / (b.check_out - b.check_in), 2)
+       END
+FROM bookings_booking b
+CROSS JOIN LATERAL generate_series(GREATEST(b.check_in, %(cutoff)s), b.check_out - 1, interval '1 day') AS gs(night)
+WHERE b.status <> ALL(%(inactive)s)
+  AND b.check_out > %(cutoff)s
+ON CONFLICT (room_id, night) DO UPDATE
+SET booking_id = EXCLUDED.booking_id,
+    status = EXCLUDED.status,
+    nightly_rate = EXCLUDED.nightly_rate
+WHERE (bookings_roomnight.booking_id, bookings_roomnight.status, bookings_roomnight.nightly_rate)
+      IS DISTINCT FROM (EXCLUDED.booking_id, EXCLUDED.status, EXCLUDED.nightly_rate)
+"""
+
+
+def reconcile_room_nights(cutoff):
+    """Bring RoomNight back in line with Booking for nights >= cutoff.
+
+    Returns (deleted, upserted) row counts; both are 0 when nothing drifted.
+    """
+    params = {'cutoff': cutoff, 'inactive': [str(s) for s in INACTIVE_STATUSES]}
+    with connection.cursor() as cursor:
+        cursor.execute(RECONCILE_DELETE_SQL, params)
+        deleted = cursor.rowcount
+        cursor.execute(RECONCILE_UPSERT_SQL, params)
+        upserted = cursor.rowcount
+    return deleted, upserted
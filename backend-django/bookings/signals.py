@@ -0,0 +1,60 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from core.events import publish_on_commit
+from .models import Booking
+from .room_nights import sync_room_nights
+from .inventory import update_nights
+
+INACTIVE_STATUSES = (Booking.Status.CANCELLED, Booking.Status.NO_SHOW)
+
+
+def _booking_event(instance, action):
+    # Same shape as app/events.py booking_event() in FastAPI
+    return {
+        'type': 'booking', 'action': action, 'id': instance.pk, 'room_id': instance.room_id,
+        'status': instance.status, 'check_in': instance.check_in, 'check_out': instance.check_out,
+    }
+
+
+def _held_stay(key):
+    """(room_id, check_in, check_out) if a room_night_key() holds the room."""
+    room_id, check_in, check_out, status, _ = key
+    return None if status in INACTIVE_STATUSES else (room_id, check_in, check_out)
+
+
+@receiver(post_save, sender=Booking)
+def update_room_nights(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    # Booking.save() runs in a transaction, so the rows commit (or roll
+    # back) together with the booking. Deletes cascade via the FK.
+    key = instance.room_night_key()
+    previous = instance._tracked
+    if created or previous != key:
+        sync_room_nights(instance)
+
+        # Availability bitmaps live outside the transaction: once committed,
+        # free the nights the booking used to hold, then mark the new ones.
+        # (A booking saved without being loaded has unknown old dates; its
+        # stale bits age out with the bitmap TTL.)
+        old_stay = _held_stay(previous) if previous else None
+        new_stay = _held_stay(key)
+
+        def apply():
+            if old_stay:
+                update_nights(*old_stay, booked=False)
+            if new_stay:
+                update_nights(*new_stay, booked=True)
+
+        transaction.on_commit(apply)
+        publish_on_commit(_booking_event(instance, 'created' if created else 'updated'))
+    instance._tracked = key
+
+
+@receiver(post_delete, sender=Booking)
+def free_inventory_nights(sender, instance, **kwargs):
+    stay = _held_stay(instance._tracked or instance.room_night_key())
+    if stay:
+        transaction.on_commit(lambda: update_nights(*stay, booked=False))
+    publish_on_commit(_booking_event(instance, 'deleted'))
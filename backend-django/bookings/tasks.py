@@ -0,0 +1,17 @@
+from celery import shared_task
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from datetime import timedelta
+from .room_nights import reconcile_room_nights as reconcile
+
+
+@shared_task
+def reconcile_room_nights(days_back=None):
+    """Repair RoomNight drift for recent and future nights (hourly beat)."""
+    if days_back is None:
+        days_back = settings.ROOM_NIGHT_RECONCILE_DAYS
+    cutoff = timezone.localdate() - timedelta(days=days_back)
+    with transaction.atomic():
+        deleted, upserted = reconcile(cutoff)
+    return f"Room nights reconciled from {cutoff}: {deleted} removed, {upserted} upserted"
@@ -1,5 +1,6 @@
 import os
 from celery import Celery
+from celery.signals import task_postrun, task_prerun, worker_process_shutdown
 
 # Set the default Django settings module for the 'celery' program.
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
@@ -15,6 +16,26 @@ app.config_from_object('django.conf:settings', namespace='CELERY')
 # Load task modules from all registered Django apps.
 app.autodiscover_tasks()
 
+
+@worker_process_shutdown.connect
+def flush_audit_log(**kwargs):
+    # Prefork children exit via os._exit, which skips atexit handlers
+    from audit_log.buffer import audit_buffer
+    audit_buffer.close()
+
+
+# Task durations for the Django /metrics endpoint (core/metrics.py)
+@task_prerun.connect
+def start_task_timer(task_id=None, **kwargs):
+    from core.metrics import task_started
+    task_started(task_id)
+
+
+@task_postrun.connect
+def record_task_duration(task_id=None, task=None, state=None, **kwargs):
+    from core.metrics import task_finished
+    task_finished(task_id, task.name, state)
+
 @app.task(bind=True, ignore_result=True)
 def debug_task(self):
     print(f'Request: {self.request!r}')
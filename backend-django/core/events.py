@@ -0,0 +1,25 @@
+import json
+import logging
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from redis.exceptions import RedisError
+from .redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+# FastAPI fans these out to GET /events/rooms (app/events.py)
+EVENTS_CHANNEL = 'room-events'
+
+
+def publish_on_commit(event):
+    """Publish a compact change event once the current transaction commits."""
+    payload = json.dumps(event, cls=DjangoJSONEncoder, separators=(',', ':'))
+
+    def publish():
+        try:
+            get_redis().publish(EVENTS_CHANNEL, payload)
+        except RedisError as e:
+            # Clients refetch on reconnect/resync, so a lost event is recoverable
+            logger.warning('Could not publish room event: %s', e)
+
+    transaction.on_commit(publish)
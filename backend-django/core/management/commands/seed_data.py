@@ -1,101 +1,214 @@
 from django.core.management.base import BaseCommand
 from django.contrib.auth import get_user_model
-from rooms.models import RoomType, Room, Amenity
+from django.contrib.auth.hashers import make_password
+from django.db import connection, transaction
+from django.db.models import Max
+from redis.exceptions import RedisError
+from rooms.models import RoomType, Room, Amenity, PricingRule
+from rooms.pricing import resolve_rates
+from rooms.catalog_cache import invalidate_catalog
 from bookings.models import Booking
-from billing.models import Invoice, LineItem
+from bookings.room_nights import nightly_rates
+from bookings.inventory import rebuild_bitmaps
+from billing.models import Invoice
 from datetime import date, timedelta
 from decimal import Decimal
+from itertools import accumulate
 import random
+import time
 
 User = get_user_model()
 
+ROOMS_PER_FLOOR = 50
+
+ROOM_TYPES = [
+    ('Standard User', 100.00, 2),
+    ('Deluxe Suite', 250.00, 4),
+    ('Penthouse', 500.00, 6),
+]
+AMENITIES = ['Wi-Fi', 'TV', 'AC', 'Projector', 'Mini Bar', 'Ocean View']
+
+
+def count(value):
+    # Accepts 1e6 as well as 1000000
+    return int(float(value))
+
+
 class Command(BaseCommand):
-    help = 'Seeds the database with initial data'
+    help = 'Seeds the database; scale it up with --rooms/--guests/--days for load tests'
 
-    def handle(self, *args, **kwargs):
+    def add_arguments(self, parser):
+        parser.add_argument('--rooms', type=count, default=10)
+        parser.add_argument('--guests', type=count, default=5)
+        parser.add_argument('--days', type=count, default=30,
+                            help='Length of the booking window, starting tomorrow (minus --history-days)')
+        parser.add_argument('--history-days', type=count, default=0,
+                            help='Start the window this many days in the past (checked-out stays)')
+        parser.add_argument('--occupancy', type=float, default=0.6,
+                            help='Rough share of room-nights that get booked')
+        parser.add_argument('--cancel-rate', type=float, default=0.05)
+        parser.add_argument('--seed', type=int, default=None, help='Random seed for a reproducible dataset')
+        parser.add_argument('--chunk-size', type=count, default=10000,
+                            help='Rows per bulk insert / COPY batch')
+
+    def handle(self, *args, **options):
+        self.rng = random.Random(options['seed'])
+        self.chunk_size = options['chunk_size']
+        started = time.monotonic()
         self.stdout.write('Seeding data...')
-        
+
         # 1. Create Admin
         if not User.objects.filter(username='admin').exists():
             User.objects.create_superuser('admin', 'admin@hotel.local', 'adminpass', role='superadmin')
             self.stdout.write(self.style.SUCCESS('Created admin user'))
 
-        # 2. Create Guests
-        guests = []
-        for i in range(5):
-            username = f'guest{i+1}'
-            if not User.objects.filter(username=username).exists():
-                user = User.objects.create_user(username, f'{username}@example.com', 'password', role='guest')
-                guests.append(user)
-            else:
-                guests.append(User.objects.get(username=username))
-        self.stdout.write(self.style.SUCCESS(f'Created {len(guests)} guests'))
-
-        # 3. Amenities
-        amenities = ['Wi-Fi', 'TV', 'AC', 'Projector', 'Mini Bar', 'Ocean View']
-        created_amenities = []
-        for name in amenities:
-            obj, _ = Amenity.objects.get_or_create(name=name)
-            created_amenities.append(obj)
-
-        # 4. Room Types
-        types = [
-            ('Standard User', 100.00, 2),
-            ('Deluxe Suite', 250.00, 4),
-            ('Penthouse', 500.00, 6)
-        ]
+        guest_ids = self.seed_guests(options['guests'])
+        room_types = self.seed_room_types()
+        rooms = self.seed_rooms(options['rooms'], room_types)
+
+        start = date.today() + timedelta(days=1) - timedelta(days=options['history_days'])
+        end = start + timedelta(days=options['days'])
+        created = self.seed_bookings(rooms, guest_ids, start, end, options['occupancy'], options['cancel_rate'])
+
+        # Bulk inserts skip model signals: refresh the derived caches once
+        invalidate_catalog()
+        self.refresh_inventory(rooms, start, end)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Seeding completed: {len(guest_ids)} guests, {len(rooms)} rooms, '
+            f'{created} bookings in {time.monotonic() - started:.1f}s'
+        ))
+
+    def seed_guests(self, total):
+        # One hash for everyone: hashing is deliberately slow (~100ms each)
+        password = make_password('password')
+        for lo in range(0, total, self.chunk_size):
+            User.objects.bulk_create([
+                User(username=f'guest{i + 1}', email=f'guest{i + 1}@example.com', password=password, role='guest')
+                for i in range(lo, min(lo + self.chunk_size, total))
+            ], ignore_conflicts=True)
+        guest_ids = list(User.objects.filter(role='guest').order_by('id').values_list('id', flat=True)[:total])
+        self.stdout.write(self.style.SUCCESS(f'Created {len(guest_ids)} guests'))
+        return guest_ids
+
+    def seed_room_types(self):
+        amenities = [Amenity.objects.get_or_create(name=name)[0] for name in AMENITIES]
         room_types = []
-        for name, rate, cap in types:
+        for name, rate, cap in ROOM_TYPES:
             rt, created = RoomType.objects.get_or_create(
                 name=name,
                 defaults={'description': f'A lovely {name}', 'base_rate': rate, 'capacity': cap}
             )
             if created:
-                rt.amenities.set(random.sample(created_amenities, 3))
+                rt.amenities.set(self.rng.sample(amenities, 3))
             room_types.append(rt)
+        return room_types
 
-        # 5. Rooms
-        created_rooms = []
-        for i in range(1, 11):
-            room_number = f'{100+i}'
-            rt = random.choice(room_types)
-            room, created = Room.objects.get_or_create(
-                room_number=room_number,
-                defaults={'room_type': rt, 'floor': 1}
-            )
-            created_rooms.append(room)
-        self.stdout.write(self.style.SUCCESS(f'Created {len(created_rooms)} rooms'))
+    def seed_rooms(self, total, room_types):
+        numbers = []
+        new_rooms = []
+        for i in range(total):
+            floor = i // ROOMS_PER_FLOOR + 1
+            number = str(floor * 100 + i % ROOMS_PER_FLOOR + 1)
+            numbers.append(number)
+            new_rooms.append(Room(room_number=number, room_type=self.rng.choice(room_types), floor=floor))
+        for lo in range(0, total, self.chunk_size):
+            Room.objects.bulk_create(new_rooms[lo:lo + self.chunk_size], ignore_conflicts=True)
+        rooms = list(Room.objects.filter(room_number__in=numbers).select_related('room_type').order_by('id'))
+        self.stdout.write(self.style.SUCCESS(f'Created {len(rooms)} rooms'))
+        return rooms
+
+    def stay_prices(self, room_types, start, end):
+        """Per room type, a function (check_in, check_out) -> total price.
 
-        # 6. Bookings
+        Rates for the whole window are resolved once per type; a stay is
+        then a difference of two prefix sums.
+        """
+        prefix = {}
+        for rt in room_types:
+            rules = PricingRule.objects.filter(room_type=rt, start_date__lt=end, end_date__gte=start)
+            prefix[rt.pk] = [Decimal('0')] + list(accumulate(resolve_rates(rt.base_rate, list(rules), start, end)))
+        return lambda rt_id, ci, co: prefix[rt_id][(co - start).days] - prefix[rt_id][(ci - start).days]
+
+    def seed_bookings(self, rooms, guest_ids, start, end, occupancy, cancel_rate):
+        if not rooms or not guest_ids or start >= end:
+            return 0
+        price = self.stay_prices({room.room_type for room in rooms}, start, end)
+        room_type_names = {room.pk: room.room_type.name for room in rooms}
         today = date.today()
-        for i in range(10):
-            guest = random.choice(guests)
-            room = random.choice(created_rooms)
-            start_date = today + timedelta(days=random.randint(1, 30))
-            end_date = start_date + timedelta(days=random.randint(1, 5))
-            
-            # Simple overlap check for seed data
-            if not Booking.objects.filter(room=room, check_in__lt=end_date, check_out__gt=start_date).exists():
-                b = Booking.objects.create(
-                    guest=guest,
-                    room=room,
-                    check_in=start_date,
-                    check_out=end_date,
-                    total_price=room.room_type.base_rate * (end_date - start_date).days,
-                    status='reserved'
-                )
-                
-                # Invoice
-                inv = Invoice.objects.create(
-                    booking=b,
-                    invoice_number=f"INV-{b.id}",
-                    due_date=end_date,
-                )
-                LineItem.objects.create(
-                    invoice=inv,
-                    description=f"Room Charge ({room.room_type.name})",
-                    quantity=(end_date - start_date).days,
-                    unit_price=room.room_type.base_rate
-                )
-
-        self.stdout.write(self.style.SUCCESS('Seeding completed!'))
+        # Continue after whatever a previous run already booked, so the
+        # exclusion constraint never rejects a batch
+        booked_until = dict(
+            Booking.objects.filter(room__in=rooms).exclude(status__in=['cancelled', 'no_show'])
+            .values_list('room_id').annotate(last=Max('check_out'))
+        )
+        # Mean gap so that stays (mean 3 nights) fill roughly `occupancy`
+        mean_gap = 3 * (1 - occupancy) / max(occupancy, 0.01)
+
+        pending = []
+        created = 0
+        for room in rooms:
+            night = max(start, booked_until.get(room.pk, start))
+            while True:
+                night += timedelta(days=int(self.rng.expovariate(1 / mean_gap)) if mean_gap > 0 else 0)
+                check_out = night + timedelta(days=self.rng.randint(1, 5))
+                if check_out > end:
+                    break
+                if self.rng.random() < cancel_rate:
+                    status = Booking.Status.CANCELLED
+                elif check_out <= today:
+                    status = Booking.Status.CHECKED_OUT
+                elif night <= today:
+                    status = Booking.Status.CHECKED_IN
+                else:
+                    status = Booking.Status.RESERVED
+                pending.append(Booking(
+                    guest_id=self.rng.choice(guest_ids), room_id=room.pk, check_in=night, check_out=check_out,
+                    status=status, total_price=price(room.room_type_id, night, check_out),
+                ))
+                night = check_out
+                if len(pending) >= self.chunk_size:
+                    created += self.write_bookings(pending, room_type_names)
+                    pending = []
+        if pending:
+            created += self.write_bookings(pending, room_type_names)
+        return created
+
+    @transaction.atomic
+    def write_bookings(self, bookings, room_type_names):
+        """One chunk: bookings and invoices via bulk_create, rows via COPY."""
+        Booking.objects.bulk_create(bookings)  # sets pks (RETURNING id)
+        invoices = Invoice.objects.bulk_create([
+            # One line per stay, so the stored totals are known up front
+            Invoice(booking_id=b.pk, invoice_number=f'INV-{b.pk}', due_date=b.check_out,
+                    total=b.total_price, line_count=1)
+            for b in bookings
+        ])
+        with connection.cursor() as cursor:
+            with cursor.copy('COPY billing_lineitem (invoice_id, description, quantity, unit_price) FROM STDIN') as copy:
+                for b, invoice in zip(bookings, invoices):
+                    nights = (b.check_out - b.check_in).days
+                    copy.write_row((
+                        invoice.pk, f'Room Charge ({room_type_names[b.room_id]}, {nights} nights)', 1, b.total_price,
+                    ))
+            with cursor.copy(
+                'COPY bookings_roomnight (room_id, night, booking_id, status, nightly_rate) FROM STDIN'
+            ) as copy:
+                for b in bookings:
+                    if not b.is_active:
+                        continue
+                    rates = nightly_rates(b.total_price, (b.check_out - b.check_in).days)
+                    for offset, rate in enumerate(rates):
+                        copy.write_row((b.room_id, b.check_in + timedelta(days=offset), b.pk, b.status, rate))
+        self.stdout.write(f'  {len(bookings)} bookings written')
+        return len(bookings)
+
+    def refresh_inventory(self, rooms, start, end):
+        room_ids = [room.pk for room in rooms]
+        try:
+            for year in range(start.year, end.year + 1):
+                for lo in range(0, len(room_ids), 500):
+                    rebuild_bitmaps(room_ids[lo:lo + 500], year)
+        except RedisError as e:
+            self.stdout.write(self.style.WARNING(f'Inventory bitmaps not refreshed ({e}); '
+                                                 'run rebuild_inventory_bitmaps'))
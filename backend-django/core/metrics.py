@@ -0,0 +1,89 @@
+import logging
+import time
+
+from prometheus_client import Gauge, Histogram, REGISTRY
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, HistogramMetricFamily
+from redis.exceptions import RedisError
+
+from .redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+REQUEST_LATENCY = Histogram(
+    'django_http_request_duration_seconds', 'Time to build the response',
+    ['method', 'route', 'status'],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+IN_FLIGHT = Gauge('django_http_requests_in_flight', 'Requests currently being handled')
+
+# Celery runs in other processes (prefork children), so task runs are
+# accumulated in Redis and read back by whichever process is scraped.
+CELERY_QUEUES = ['celery']
+TASK_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300)
+TASKS_KEY = 'metrics:celery:tasks'
+TASK_KEY = 'metrics:celery:task:'
+
+_task_started = {}  # task_id -> monotonic start, per worker process
+
+
+def task_started(task_id):
+    _task_started[task_id] = time.monotonic()
+
+
+def task_finished(task_id, task_name, state):
+    started = _task_started.pop(task_id, None)
+    if started is None:
+        return
+    seconds = time.monotonic() - started
+    bucket = next((str(le) for le in TASK_BUCKETS if seconds <= le), '+Inf')
+    key = TASK_KEY + task_name
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        pipe.sadd(TASKS_KEY, task_name)
+        pipe.hincrby(key, 'count', 1)
+        pipe.hincrbyfloat(key, 'sum', seconds)
+        pipe.hincrby(key, f'bucket:{bucket}', 1)
+        pipe.hincrby(key, f'state:{state or "UNKNOWN"}', 1)
+        pipe.execute()
+    except RedisError as e:
+        logger.warning('Could not record task duration: %s', e)
+
+
+class CeleryCollector:
+    """Queue depth (LLEN of the broker lists) and task runs from Redis."""
+
+    def describe(self):
+        # Without it, register() calls collect() (a Redis round-trip) at import
+        return []
+
+    def collect(self):
+        try:
+            redis = get_redis()
+            depths = [(queue, redis.llen(queue)) for queue in CELERY_QUEUES]
+            tasks = {name: redis.hgetall(TASK_KEY + name) for name in sorted(redis.smembers(TASKS_KEY))}
+        except RedisError as e:
+            logger.warning('Celery metrics unavailable: %s', e)
+            return
+
+        queue_length = GaugeMetricFamily('celery_queue_length', 'Messages waiting in the broker', labels=['queue'])
+        for queue, depth in depths:
+            queue_length.add_metric([queue], depth)
+        yield queue_length
+
+        durations = HistogramMetricFamily('celery_task_duration_seconds', 'Task run time', labels=['task'])
+        runs = CounterMetricFamily('celery_task_runs', 'Finished task runs by final state', labels=['task', 'state'])
+        for name, fields in tasks.items():
+            cumulative = 0
+            buckets = []
+            for le in [str(le) for le in TASK_BUCKETS] + ['+Inf']:
+                cumulative += int(fields.get(f'bucket:{le}', 0))
+                buckets.append((le, cumulative))
+            durations.add_metric([name], buckets, float(fields.get('sum', 0)))
+            for field, value in fields.items():
+                if field.startswith('state:'):
+                    runs.add_metric([name, field.removeprefix('state:')], int(value))
+        yield durations
+        yield runs
+
+
+REGISTRY.register(CeleryCollector())
@@ -0,0 +1,97 @@
+import logging
+import re
+import time
+from collections import defaultdict
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+
+from .metrics import IN_FLIGHT, REQUEST_LATENCY
+
+logger = logging.getLogger(__name__)
+
+_PLACEHOLDER_LIST = re.compile(r'\((?:\s*%s\s*,?)+\)')
+_NUMBER = re.compile(r'\b\d+\b')
+_WHITESPACE = re.compile(r'\s+')
+
+
+def statement_shape(sql):
+    """SQL with literals and IN-lists collapsed, so repeats group together."""
+    shape = _PLACEHOLDER_LIST.sub('(?)', sql)
+    shape = _NUMBER.sub('N', shape)
+    return _WHITESPACE.sub(' ', shape).strip()
+
+
+class QueryRecorder:
+    """connection.execute_wrapper() that times every statement of a request."""
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.statements = defaultdict(lambda: [0, 0.0])  # shape -> [executions, seconds]
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            seconds = time.perf_counter() - started
+            self.queries += 1
+            self.db_time += seconds
+            entry = self.statements[statement_shape(sql)]
+            entry[0] += 1
+            entry[1] += seconds
+
+
+class RequestInstrumentationMiddleware:
+    """Counts SQL per request and reports it in a Server-Timing header
+    (and the Prometheus request histogram, see core/metrics.py):
+
+        Server-Timing: db;dur=4.1;desc="3 queries", app;dur=2.2, total;dur=6.3
+
+    Requests slower than SLOW_REQUEST_MS are logged with their most
+    expensive statements; with N_PLUS_ONE_THRESHOLD > 0 a statement shape
+    repeated more often than that is logged as a likely N+1. Same format
+    as the FastAPI app's instrumentation middleware.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        recorder = QueryRecorder()
+        started = time.perf_counter()
+        with ExitStack() as stack, IN_FLIGHT.track_inprogress():
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(recorder))
+            response = self.get_response(request)
+        total = time.perf_counter() - started
+
+        # Label by URL pattern (rooms/<int:pk>/), never by raw path
+        match = request.resolver_match
+        REQUEST_LATENCY.labels(request.method, match.route if match else 'unmatched',
+                               str(response.status_code)).observe(total)
+
+        response['Server-Timing'] = (
+            f'db;dur={recorder.db_time * 1000:.1f};desc="{recorder.queries} queries", '
+            f'app;dur={max(total - recorder.db_time, 0) * 1000:.1f}, total;dur={total * 1000:.1f}'
+        )
+        self.report(request, response, recorder, total)
+        return response
+
+    def report(self, request, response, recorder, total):
+        route = f'{request.method} {request.path}'
+        if total * 1000 >= settings.SLOW_REQUEST_MS and not response.streaming:
+            top = sorted(recorder.statements.items(), key=lambda item: item[1][1], reverse=True)
+            lines = ''.join(
+                f'\n  {count}x {seconds * 1000:.1f}ms {shape[:300]}'
+                for shape, (count, seconds) in top[:settings.SLOW_REQUEST_TOP_QUERIES]
+            )
+            logger.warning('Slow request %s -> %s: %.0fms total, %.0fms in %d queries%s',
+                           route, response.status_code, total * 1000, recorder.db_time * 1000,
+                           recorder.queries, lines)
+        if settings.N_PLUS_ONE_THRESHOLD:
+            for shape, (count, _) in recorder.statements.items():
+                if count > settings.N_PLUS_ONE_THRESHOLD:
+                    logger.warning('Possible N+1 in %s: %d executions of %s', route, count, shape[:300])
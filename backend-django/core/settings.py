@@ -1,6 +1,7 @@
 import os
 from pathlib import Path
 import environ
+from celery.schedules import crontab
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -23,6 +24,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     
     # Third party
     'corsheaders',
@@ -38,6 +40,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # Outermost, so Server-Timing covers every other middleware's queries
+    'core.middleware.RequestInstrumentationMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -45,6 +49,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'audit_log.context.AuditUserMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -89,6 +94,18 @@ AUTH_PASSWORD_VALIDATORS = [
 # Custom User Model
 AUTH_USER_MODEL = 'users.User'
 
+# Signed API tokens, verified statelessly by the FastAPI service.
+# API_TOKEN_KEYS is a list of kid=secret pairs; new tokens are signed with
+# API_TOKEN_ACTIVE_KID and every listed key is accepted. To rotate, add the
+# new key, switch the active kid, and drop the old key once the last refresh
+# token signed with it has expired.
+API_TOKEN_KEYS = env.dict('API_TOKEN_KEYS', default={}) or {'default': SECRET_KEY}
+API_TOKEN_ACTIVE_KID = env('API_TOKEN_ACTIVE_KID', default='default')
+API_TOKEN_ALGORITHM = 'HS256'
+API_TOKEN_ISSUER = 'hotel-management'
+API_TOKEN_ACCESS_TTL = env.int('API_TOKEN_ACCESS_TTL', default=300)
+API_TOKEN_REFRESH_TTL = env.int('API_TOKEN_REFRESH_TTL', default=7 * 24 * 3600)
+
 # Internationalization
 LANGUAGE_CODE = 'en-us'
 TIME_ZONE = 'UTC'
@@ -103,12 +120,52 @@ MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Redis (shared with the FastAPI service for caches and pub/sub)
+REDIS_URL = env('REDIS_URL', default='redis://redis:6379/0')
+
 # Celery
-CELERY_BROKER_URL = env('REDIS_URL', default='redis://redis:6379/0')
-CELERY_RESULT_BACKEND = env('REDIS_URL', default='redis://redis:6379/0')
+CELERY_BROKER_URL = REDIS_URL
+CELERY_RESULT_BACKEND = REDIS_URL
 CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
+CELERY_BEAT_SCHEDULE = {
+    'extend-rate-calendar': {
+        'task': 'rooms.tasks.extend_rate_calendar',
+        'schedule': crontab(hour=2, minute=0),
+    },
+    'maintain-audit-log-partitions': {
+        'task': 'audit_log.tasks.maintain_partitions',
+        'schedule': crontab(hour=3, minute=0),
+    },
+    'reconcile-room-nights': {
+        'task': 'bookings.tasks.reconcile_room_nights',
+        'schedule': crontab(minute=15),
+    },
+}
+
+# Pricing: nights materialized in rooms.NightlyRate, counted from today
+RATE_CALENDAR_HORIZON_DAYS = env.int('RATE_CALENDAR_HORIZON_DAYS', default=730)
+
+# bookings.RoomNight: the hourly reconcile looks this many days into the past
+ROOM_NIGHT_RECONCILE_DAYS = env.int('ROOM_NIGHT_RECONCILE_DAYS', default=7)
+
+# Redis availability bitmaps (bookings/inventory.py); must match FastAPI
+INVENTORY_CACHE_TTL = env.int('INVENTORY_CACHE_TTL', default=86400)
+
+# Per-request instrumentation (core/middleware.py): requests slower than
+# this are logged with their top queries; N+1 detection is on in DEBUG
+SLOW_REQUEST_MS = env.float('SLOW_REQUEST_MS', default=500)
+SLOW_REQUEST_TOP_QUERIES = env.int('SLOW_REQUEST_TOP_QUERIES', default=5)
+N_PLUS_ONE_THRESHOLD = env.int('N_PLUS_ONE_THRESHOLD', default=10 if DEBUG else 0)
+
+# Audit log: buffered in-process and written with bulk_create
+AUDIT_LOG_BATCH_SIZE = env.int('AUDIT_LOG_BATCH_SIZE', default=500)
+AUDIT_LOG_FLUSH_INTERVAL = env.float('AUDIT_LOG_FLUSH_INTERVAL', default=2.0)
+AUDIT_LOG_MAX_BUFFER = env.int('AUDIT_LOG_MAX_BUFFER', default=20000)
+# Monthly partitions kept ahead of time / retained before being dropped
+AUDIT_LOG_PARTITIONS_AHEAD = env.int('AUDIT_LOG_PARTITIONS_AHEAD', default=3)
+AUDIT_LOG_RETENTION_MONTHS = env.int('AUDIT_LOG_RETENTION_MONTHS', default=12)
 
 # CORS
 CORS_ALLOW_ALL_ORIGINS = True # Change for production
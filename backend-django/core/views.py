@@ -0,0 +1,10 @@
+from django.http import HttpResponse
+from django.views.decorators.http import require_GET
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+
+@require_GET
+def metrics(request):
+    """Prometheus scrape target. Served on backend-django:8000 only; nginx
+    does not route /metrics."""
+    return HttpResponse(generate_latest(), content_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,22 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from core.events import publish_on_commit
+from .models import HousekeepingTask
+
+
+def _task_event(instance, action):
+    return {
+        'type': 'housekeeping', 'action': action, 'id': instance.pk, 'room_id': instance.room_id,
+        'status': instance.status, 'assigned_to_id': instance.assigned_to_id,
+    }
+
+
+@receiver(post_save, sender=HousekeepingTask)
+def publish_task_change(sender, instance, created, raw=False, **kwargs):
+    if not raw:
+        publish_on_commit(_task_event(instance, 'created' if created else 'updated'))
+
+
+@receiver(post_delete, sender=HousekeepingTask)
+def publish_task_delete(sender, instance, **kwargs):
+    publish_on_commit(_task_event(instance, 'deleted'))
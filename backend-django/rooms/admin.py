@@ -1,7 +1,20 @@
 from django.contrib import admin
-from .models import Amenity, RoomType, Room, PricingRule
+from .models import Amenity, RoomType, Room, PricingRule, NightlyRate
 
 admin.site.register(Amenity)
 admin.site.register(RoomType)
 admin.site.register(Room)
 admin.site.register(PricingRule)
+
+@admin.register(NightlyRate)
+class NightlyRateAdmin(admin.ModelAdmin):
+    list_display = ('room_type', 'night', 'rate')
+    list_filter = ('room_type',)
+    date_hierarchy = 'night'
+
+    # Derived from PricingRule; rebuilt automatically
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,25 @@
+import logging
+from django.db import transaction
+from redis.exceptions import RedisError
+from core.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Must match backend-fastapi/app/response_cache.py
+VERSION_KEY = 'catalog:version'
+INVALIDATION_CHANNEL = 'catalog-invalidate'
+
+
+def _bump():
+    try:
+        client = get_redis()
+        version = client.incr(VERSION_KEY)
+        client.publish(INVALIDATION_CHANNEL, str(version))
+    except RedisError as e:
+        # FastAPI keeps serving the previous version until its entries expire
+        logger.warning('Could not bump catalog cache version: %s', e)
+
+
+def invalidate_catalog():
+    """Retire every cached GET /rooms/ response once this change commits."""
+    transaction.on_commit(_bump)
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+from rooms.models import RoomType
+from rooms.pricing import rebuild_rate_calendar
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the precomputed nightly rate calendar for all room types'
+
+    def handle(self, *args, **kwargs):
+        total = 0
+        for room_type in RoomType.objects.all():
+            nights = rebuild_rate_calendar(room_type)
+            total += nights
+            self.stdout.write(f'{room_type.name}: {nights} nights')
+        self.stdout.write(self.style.SUCCESS(f'Rate calendar rebuilt ({total} rows)'))
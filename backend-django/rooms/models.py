@@ -45,3 +45,21 @@ class PricingRule(models.Model):
 
     def __str__(self):
         return f"{self.room_type.name} override: {self.start_date} to {self.end_date}"
+
+class NightlyRate(models.Model):
+    """Precomputed rate calendar: the resolved price of one night for a room type.
+
+    Maintained by rooms.pricing from RoomType.base_rate and PricingRule; do
+    not edit by hand.
+    """
+    room_type = models.ForeignKey(RoomType, on_delete=models.CASCADE, related_name="nightly_rates")
+    night = models.DateField()
+    rate = models.DecimalField(max_digits=10, decimal_places=2)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['room_type', 'night'], name='nightly_rate_room_type_night_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.room_type.name} {self.night}: {self.rate}"
@@ -0,0 +1,94 @@
+"""Seasonal pricing.
+
+A night costs RoomType.base_rate unless a PricingRule covers it
+(start_date..end_date, both inclusive). When rules overlap, the narrowest
+rule wins, then the most recently created one. The FastAPI service applies
+the same precedence (app/pricing.py).
+
+Resolved rates are materialized in NightlyRate for a rolling horizon so a
+quote is a single indexed range sum instead of per-night rule queries.
+"""
+from datetime import date, timedelta
+from decimal import Decimal
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Sum
+from .models import NightlyRate, PricingRule, RoomType
+
+
+def calendar_window():
+    start = date.today()
+    return start, start + timedelta(days=settings.RATE_CALENDAR_HORIZON_DAYS)
+
+
+def resolve_rates(base_rate, rules, start, end):
+    """Per-night rates for [start, end) from a base rate and PricingRules."""
+    nights = (end - start).days
+    rates = [base_rate] * nights
+    # Paint widest/oldest first so narrower and newer rules overwrite them
+    ordered = sorted(rules, key=lambda r: (-(r.end_date - r.start_date).days, r.pk or 0))
+    for rule in ordered:
+        lo = max((rule.start_date - start).days, 0)
+        hi = min((rule.end_date - start).days + 1, nights)
+        if lo < hi:
+            rates[lo:hi] = [rule.rate_override] * (hi - lo)
+    return rates
+
+
+def _rules_overlapping(room_type_id, start, end):
+    return list(PricingRule.objects.filter(
+        room_type_id=room_type_id, start_date__lt=end, end_date__gte=start,
+    ))
+
+
+def rebuild_rate_calendar(room_type, start=None, end=None):
+    """Recompute NightlyRate rows for one room type over [start, end).
+
+    The range is clipped to the calendar horizon; rule changes only rebuild
+    the nights they can affect.
+    """
+    window_start, window_end = calendar_window()
+    start = max(start or window_start, window_start)
+    end = min(end or window_end, window_end)
+    if start >= end:
+        return 0
+
+    rates = resolve_rates(room_type.base_rate, _rules_overlapping(room_type.pk, start, end), start, end)
+    rows = [
+        NightlyRate(room_type_id=room_type.pk, night=start + timedelta(days=i), rate=rate)
+        for i, rate in enumerate(rates)
+    ]
+    with transaction.atomic():
+        NightlyRate.objects.filter(room_type_id=room_type.pk, night__lt=window_start).delete()
+        NightlyRate.objects.bulk_create(
+            rows,
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=['room_type', 'night'],
+            update_fields=['rate'],
+        )
+    return len(rows)
+
+
+def quote_all(check_in, check_out, room_type_ids=None):
+    """Total stay price per room type id, one grouped query over the calendar."""
+    nights = (check_out - check_in).days
+    qs = NightlyRate.objects.filter(night__gte=check_in, night__lt=check_out)
+    if room_type_ids is not None:
+        qs = qs.filter(room_type_id__in=room_type_ids)
+    totals = {
+        row['room_type_id']: row['total']
+        for row in qs.values('room_type_id').annotate(total=Sum('rate'), nights=Count('id'))
+        if row['nights'] == nights
+    }
+
+    # Nights outside the materialized horizon: resolve from the rules
+    types = RoomType.objects.all() if room_type_ids is None else RoomType.objects.filter(pk__in=room_type_ids)
+    for room_type in types.exclude(pk__in=list(totals)):
+        rules = _rules_overlapping(room_type.pk, check_in, check_out)
+        totals[room_type.pk] = sum(resolve_rates(room_type.base_rate, rules, check_in, check_out), Decimal('0'))
+    return totals
+
+
+def quote(room_type, check_in, check_out):
+    return quote_all(check_in, check_out, [room_type.pk])[room_type.pk]
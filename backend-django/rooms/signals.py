@@ -0,0 +1,83 @@
+from datetime import timedelta
+from django.db.models.signals import pre_save, post_save, post_delete, m2m_changed
+from django.dispatch import receiver
+from core.events import publish_on_commit
+from .catalog_cache import invalidate_catalog
+from .models import Amenity, PricingRule, Room, RoomType
+from .pricing import rebuild_rate_calendar
+
+
+def _rebuild_rule_range(room_type_id, start_date, end_date):
+    room_type = RoomType.objects.filter(pk=room_type_id).first()
+    if room_type is not None:  # gone when the rule is cascade-deleted
+        rebuild_rate_calendar(room_type, start_date, end_date + timedelta(days=1))
+
+
+@receiver(pre_save, sender=PricingRule)
+def remember_previous_rule(sender, instance, **kwargs):
+    instance._previous_range = None
+    if instance.pk:
+        instance._previous_range = PricingRule.objects.filter(pk=instance.pk).values_list(
+            'room_type_id', 'start_date', 'end_date'
+        ).first()
+
+
+@receiver(post_save, sender=PricingRule)
+def refresh_calendar_for_rule(sender, instance, **kwargs):
+    # Only the nights the rule covered before and covers now can change
+    current = (instance.room_type_id, instance.start_date, instance.end_date)
+    _rebuild_rule_range(*current)
+    previous = getattr(instance, '_previous_range', None)
+    if previous and previous != current:
+        _rebuild_rule_range(*previous)
+
+
+@receiver(post_delete, sender=PricingRule)
+def refresh_calendar_for_deleted_rule(sender, instance, **kwargs):
+    _rebuild_rule_range(instance.room_type_id, instance.start_date, instance.end_date)
+
+
+@receiver(pre_save, sender=RoomType)
+def remember_previous_base_rate(sender, instance, **kwargs):
+    instance._previous_base_rate = None
+    if instance.pk:
+        instance._previous_base_rate = RoomType.objects.filter(pk=instance.pk).values_list(
+            'base_rate', flat=True
+        ).first()
+
+
+@receiver(post_save, sender=RoomType)
+def refresh_calendar_for_room_type(sender, instance, created, **kwargs):
+    if created or instance._previous_base_rate != instance.base_rate:
+        rebuild_rate_calendar(instance)
+
+
+@receiver(post_save, sender=Room)
+def publish_room_change(sender, instance, created, raw=False, **kwargs):
+    if not raw:
+        publish_on_commit({
+            'type': 'room', 'action': 'created' if created else 'updated', 'id': instance.pk,
+            'room_number': instance.room_number, 'status': instance.status, 'floor': instance.floor,
+        })
+
+
+@receiver(post_delete, sender=Room)
+def publish_room_delete(sender, instance, **kwargs):
+    publish_on_commit({'type': 'room', 'action': 'deleted', 'id': instance.pk})
+
+
+def catalog_changed(sender, raw=False, **kwargs):
+    if not raw:
+        invalidate_catalog()
+
+
+def catalog_amenities_changed(sender, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        invalidate_catalog()
+
+
+for model in (Room, RoomType, Amenity):
+    post_save.connect(catalog_changed, sender=model, dispatch_uid=f'catalog_saved_{model.__name__}')
+    post_delete.connect(catalog_changed, sender=model, dispatch_uid=f'catalog_deleted_{model.__name__}')
+m2m_changed.connect(catalog_amenities_changed, sender=RoomType.amenities.through,
+                    dispatch_uid='catalog_room_type_amenities')
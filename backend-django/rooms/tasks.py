@@ -0,0 +1,10 @@
+from celery import shared_task
+from .models import RoomType
+from .pricing import rebuild_rate_calendar
+
+
+@shared_task
+def extend_rate_calendar():
+    """Roll the NightlyRate horizon forward one day at a time (daily beat)."""
+    nights = sum(rebuild_rate_calendar(room_type) for room_type in RoomType.objects.all())
+    return f"Rate calendar refreshed: {nights} nights"
@@ -0,0 +1,38 @@
+import logging
+from redis.exceptions import RedisError
+from core.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Must match backend-fastapi/app/session_cache.py
+KEY_PREFIX = 'session-user:'
+USER_INDEX_PREFIX = 'session-user:by-user:'
+INVALIDATION_CHANNEL = 'session-invalidate'
+
+
+def invalidate_session(session_key):
+    """Drop a session from the FastAPI auth cache (Redis and in-process tiers)."""
+    if not session_key:
+        return
+    try:
+        client = get_redis()
+        client.delete(KEY_PREFIX + session_key)
+        client.publish(INVALIDATION_CHANNEL, f'session:{session_key}')
+    except RedisError as e:
+        logger.warning('Could not invalidate cached session: %s', e)
+
+
+def invalidate_user(user_id):
+    """Drop every cached session of a user, e.g. after a role change."""
+    try:
+        client = get_redis()
+        index_key = f'{USER_INDEX_PREFIX}{user_id}'
+        session_keys = client.smembers(index_key)
+        pipe = client.pipeline(transaction=False)
+        for session_key in session_keys:
+            pipe.delete(KEY_PREFIX + session_key)
+        pipe.delete(index_key)
+        pipe.publish(INVALIDATION_CHANNEL, f'user:{user_id}')
+        pipe.execute()
+    except RedisError as e:
+        logger.warning('Could not invalidate cached sessions for user %s: %s', user_id, e)
@@ -0,0 +1,27 @@
+from django.contrib.auth.signals import user_logged_out
+from django.contrib.sessions.models import Session
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .models import User
+from .session_cache import invalidate_session, invalidate_user
+
+
+@receiver(user_logged_out)
+def drop_session_on_logout(sender, request, user, **kwargs):
+    invalidate_session(request.session.session_key)
+
+
+@receiver(post_delete, sender=Session)
+def drop_deleted_session(sender, instance, **kwargs):
+    # Covers session.flush(), clearsessions and admin deletes
+    transaction.on_commit(lambda: invalidate_session(instance.session_key))
+
+
+@receiver(post_save, sender=User)
+def drop_sessions_on_user_change(sender, instance, created, update_fields=None, **kwargs):
+    # FastAPI caches the role; a demoted or deactivated user must not keep it.
+    # Logins only touch last_login and need no invalidation.
+    if created or (update_fields and set(update_fields) == {'last_login'}):
+        return
+    transaction.on_commit(lambda: invalidate_user(instance.pk))
@@ -0,0 +1,59 @@
+import time
+import uuid
+from django.conf import settings
+from jose import jwt, JWTError
+
+ACCESS = 'access'
+REFRESH = 'refresh'
+
+
+def _encode(claims):
+    kid = settings.API_TOKEN_ACTIVE_KID
+    return jwt.encode(
+        claims,
+        settings.API_TOKEN_KEYS[kid],
+        algorithm=settings.API_TOKEN_ALGORITHM,
+        headers={'kid': kid},
+    )
+
+
+def issue_token_pair(user):
+    """Mint a short-lived access token and a longer-lived refresh token."""
+    now = int(time.time())
+    base = {'sub': str(user.pk), 'iss': settings.API_TOKEN_ISSUER, 'iat': now}
+    access = _encode({
+        **base,
+        'typ': ACCESS,
+        'role': user.role,
+        'username': user.username,
+        'exp': now + settings.API_TOKEN_ACCESS_TTL,
+    })
+    refresh = _encode({
+        **base,
+        'typ': REFRESH,
+        'jti': uuid.uuid4().hex,
+        'exp': now + settings.API_TOKEN_REFRESH_TTL,
+    })
+    return {
+        'access_token': access,
+        'refresh_token': refresh,
+        'token_type': 'bearer',
+        'expires_in': settings.API_TOKEN_ACCESS_TTL,
+    }
+
+
+def decode_token(token, expected_type):
+    """Verify signature, expiry, issuer and type; raises JWTError."""
+    kid = jwt.get_unverified_header(token).get('kid')
+    key = settings.API_TOKEN_KEYS.get(kid)
+    if key is None:
+        raise JWTError('Unknown signing key')
+    claims = jwt.decode(
+        token,
+        key,
+        algorithms=[settings.API_TOKEN_ALGORITHM],
+        issuer=settings.API_TOKEN_ISSUER,
+    )
+    if claims.get('typ') != expected_type:
+        raise JWTError('Wrong token type')
+    return claims
@@ -0,0 +1,10 @@
+from django.urls import path
+from . import views
+
+urlpatterns = [
+    path('csrf/', views.csrf, name='api-csrf'),
+    path('login/', views.login_view, name='api-login'),
+    path('logout/', views.logout_view, name='api-logout'),
+    path('token/', views.issue_token, name='api-token'),
+    path('token/refresh/', views.refresh_token, name='api-token-refresh'),
+]
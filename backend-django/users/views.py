@@ -0,0 +1,74 @@
+import json
+from django.contrib.auth import authenticate, login, logout
+from django.http import JsonResponse
+from django.middleware.csrf import get_token
+from django.views.decorators.csrf import csrf_exempt, ensure_csrf_cookie
+from django.views.decorators.http import require_GET, require_POST
+from jose import JWTError
+from .models import User
+from .tokens import issue_token_pair, decode_token, REFRESH
+
+
+@ensure_csrf_cookie
+@require_GET
+def csrf(request):
+    """Set the csrftoken cookie for JSON clients before they POST."""
+    return JsonResponse({'csrftoken': get_token(request)})
+
+
+@require_POST
+def login_view(request):
+    """JSON login. Starts a regular Django session (sessionid cookie),
+    which FastAPI accepts as well."""
+    try:
+        payload = json.loads(request.body or b'{}')
+    except ValueError:
+        payload = None
+    if not isinstance(payload, dict):
+        return JsonResponse({'detail': 'Expected a JSON object'}, status=400)
+
+    user = authenticate(request, username=payload.get('username'), password=payload.get('password'))
+    if user is None:
+        return JsonResponse({'detail': 'Invalid credentials'}, status=401)
+    login(request, user)
+    return JsonResponse({'id': user.pk, 'username': user.username, 'role': user.role})
+
+
+@require_POST
+def logout_view(request):
+    logout(request)  # also drops the session from the FastAPI cache (users.signals)
+    return JsonResponse({'detail': 'Logged out'})
+
+
+@require_POST
+def issue_token(request):
+    """Exchange the Django session for a signed API token pair."""
+    if not request.user.is_authenticated:
+        return JsonResponse({'detail': 'Not authenticated'}, status=401)
+    return JsonResponse(issue_token_pair(request.user))
+
+
+@csrf_exempt  # authenticated by the refresh token itself, not by cookies
+@require_POST
+def refresh_token(request):
+    """Trade a valid refresh token for a new token pair.
+
+    The user is re-read here (the only DB hit in the token flow), so role
+    changes and deactivation take effect at the next refresh.
+    """
+    try:
+        token = json.loads(request.body or b'{}').get('refresh_token')
+    except (ValueError, AttributeError):
+        token = None
+    if not token:
+        return JsonResponse({'detail': 'refresh_token is required'}, status=400)
+
+    try:
+        claims = decode_token(token, REFRESH)
+    except JWTError:
+        return JsonResponse({'detail': 'Invalid refresh token'}, status=401)
+
+    user = User.objects.filter(pk=claims['sub'], is_active=True).first()
+    if user is None:
+        return JsonResponse({'detail': 'Invalid refresh token'}, status=401)
+    return JsonResponse(issue_token_pair(user))
@@ -0,0 +1,71 @@
+import asyncio
+import logging
+import os
+from collections import deque
+from datetime import datetime, timezone
+from sqlalchemy import insert
+from . import models
+from .database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+# Same batching policy as the Django writer (audit_log/buffer.py): events
+# are queued in memory and inserted in one multi-row INSERT per batch, by
+# size or by time. The queue is bounded; when full the oldest events are
+# dropped and counted.
+AUDIT_LOG_BATCH_SIZE = int(os.getenv("AUDIT_LOG_BATCH_SIZE", "500"))
+AUDIT_LOG_FLUSH_INTERVAL = float(os.getenv("AUDIT_LOG_FLUSH_INTERVAL", "2.0"))
+AUDIT_LOG_MAX_BUFFER = int(os.getenv("AUDIT_LOG_MAX_BUFFER", "20000"))
+
+class AuditBuffer:
+    def __init__(self, max_size: int, batch_size: int, flush_interval: float):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._events = deque(maxlen=max_size)
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self.dropped = 0
+        self.written = 0
+
+    def log(self, action: str, model_name: str, object_id, user_id=None, details=None):
+        """Queue an ActivityLog row; never awaits the database."""
+        if len(self._events) == self._events.maxlen:
+            self.dropped += 1
+        self._events.append({
+            "user_id": user_id,
+            "action": action,
+            "model_name": model_name,
+            "object_id": str(object_id),
+            "timestamp": datetime.now(timezone.utc),
+            "details": details,
+        })
+        if len(self._events) >= self.batch_size:
+            self._wakeup.set()
+
+    async def flush(self):
+        async with self._flush_lock:
+            while self._events:
+                batch = [self._events.popleft() for _ in range(min(self.batch_size, len(self._events)))]
+                try:
+                    async with SessionLocal() as db:
+                        await db.execute(insert(models.ActivityLog), batch)
+                        await db.commit()
+                except Exception:
+                    self._events.extendleft(reversed(batch))
+                    raise
+                self.written += len(batch)
+
+    async def run(self):
+        # Background flusher, started from the app lifespan
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.warning("Audit log flush failed: %s", e)
+
+audit_buffer = AuditBuffer(AUDIT_LOG_MAX_BUFFER, AUDIT_LOG_BATCH_SIZE, AUDIT_LOG_FLUSH_INTERVAL)
@@ -1,10 +1,17 @@
 from fastapi import Request, HTTPException, Depends, Security
-from sqlalchemy.orm import Session
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from jose import JWTError
+from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from .database import get_db
 from .models import DjangoSession, User
+from .session_cache import session_cache, CachedUser
+from .tokens import verify_access_token
+from .instrumentation import timed
 import json
 import base64
-from datetime import datetime
+import time
 
 # Logic to decode Django session
 # Django default session serializer is JSON (since 1.6+) but might be signed. 
@@ -17,12 +24,16 @@ from datetime import datetime
 # For this MVP, we will rely on a simpler 'get' from the decoded session data if possible,
 # or we can use a helper library, but standard base64 decoding usually works for the _auth_user_id.
 
-def get_user_from_session(session_key: str, db: Session):
-    session = db.query(DjangoSession).filter(DjangoSession.session_key == session_key).first()
+async def load_session(session_key: str, db: AsyncSession):
+    """Return (user_id, expires_at epoch seconds) for a live session, else None."""
+    result = await db.execute(select(DjangoSession).where(DjangoSession.session_key == session_key))
+    session = result.scalar_one_or_none()
     if not session:
         return None
     
-    if session.expire_date < datetime.now():
+    # timestamp() copes with both naive and tz-aware expire_date values
+    expires_at = session.expire_date.timestamp()
+    if expires_at < time.time():
         return None
 
     # Decode session data
@@ -33,22 +44,55 @@ def get_user_from_session(session_key: str, db: Session):
         decoded_json = base64.b64decode(encoded_data).decode("utf-8")
         session_dict = json.loads(decoded_json)
         user_id = session_dict.get("_auth_user_id")
-        return user_id
+        return (user_id, expires_at) if user_id else None
     except Exception as e:
         print(f"Error decoding session: {e}")
         return None
 
-async def get_current_user(request: Request, db: Session = Depends(get_db)):
+async def get_user_from_session(session_key: str, db: AsyncSession):
+    loaded = await load_session(session_key, db)
+    return loaded[0] if loaded else None
+
+bearer_scheme = HTTPBearer(auto_error=False)
+
+async def get_token_user(credentials: Optional[HTTPAuthorizationCredentials] = Security(bearer_scheme)):
+    # Stateless: signature + expiry check only, no database or cache lookup
+    if not credentials:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    try:
+        claims = verify_access_token(credentials.credentials)
+        return User(id=int(claims["sub"]), username=claims.get("username"), role=claims.get("role"))
+    except (JWTError, KeyError, ValueError):
+        raise HTTPException(status_code=401, detail="Invalid token")
+
+@timed("auth")
+async def get_current_user(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    credentials: Optional[HTTPAuthorizationCredentials] = Security(bearer_scheme),
+):
+    # Bearer tokens (minted by Django at /auth/token/) win over the cookie
+    if credentials:
+        return await get_token_user(credentials)
+
     sessionid = request.cookies.get("sessionid")
     if not sessionid:
         raise HTTPException(status_code=401, detail="Not authenticated")
     
-    user_id = get_user_from_session(sessionid, db)
-    if not user_id:
+    # Common case: resolved from the session cache without touching the DB.
+    # Routers only need id/role, so a detached User is enough.
+    cached = await session_cache.get(sessionid)
+    if cached:
+        return User(id=cached.user_id, username=cached.username, role=cached.role)
+
+    loaded = await load_session(sessionid, db)
+    if not loaded:
         raise HTTPException(status_code=401, detail="Invalid session")
+    user_id, expires_at = loaded
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, int(user_id))
     if not user:
          raise HTTPException(status_code=401, detail="User not found")
-         
+
+    await session_cache.set(sessionid, CachedUser(user.id, user.username, user.role, expires_at))
     return user
@@ -3,4 +3,5 @@ import os
 
 CELERY_BROKER_URL = os.getenv("REDIS_URL", "redis://redis:6379/0")
 
-celery_app = Celery('fastapi_client', broker=CELERY_BROKER_URL)
+# Same Redis result backend as the Django workers, so task state is readable here
+celery_app = Celery('fastapi_client', broker=CELERY_BROKER_URL, backend=CELERY_BROKER_URL)
@@ -0,0 +1,90 @@
+import asyncio
+import json
+import logging
+import os
+from contextlib import contextmanager
+
+from redis.exceptions import RedisError
+
+from .redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Django (core/events.py) and the booking routers publish compact JSON
+# change events here; must match core/events.py
+EVENTS_CHANNEL = "room-events"
+EVENTS_QUEUE_SIZE = int(os.getenv("EVENTS_QUEUE_SIZE", "256"))
+
+RESYNC = {"type": "resync"}
+
+class EventHub:
+    """One Redis subscription per process, fanned out to every open stream.
+
+    Each client gets a bounded queue. A client that falls behind has its
+    queue replaced by a single "resync" event (refetch, then keep going)
+    instead of slowing the hub or growing memory.
+    """
+
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self._queues = set()
+
+    @property
+    def clients(self) -> int:
+        return len(self._queues)
+
+    @contextmanager
+    def subscribe(self):
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self._queues.add(queue)
+        try:
+            yield queue
+        finally:
+            self._queues.discard(queue)
+
+    def _broadcast(self, event: dict):
+        for queue in self._queues:
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(RESYNC)
+
+    async def run(self):
+        while True:
+            try:
+                async with get_redis().pubsub() as pubsub:
+                    await pubsub.subscribe(EVENTS_CHANNEL)
+                    async for message in pubsub.listen():
+                        if message["type"] == "subscribe":
+                            # (Re)connected: anything may have been missed
+                            self._broadcast(RESYNC)
+                        elif message["type"] == "message":
+                            try:
+                                self._broadcast(json.loads(message["data"]))
+                            except ValueError:
+                                logger.warning("Dropping malformed room event: %r", message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Room event listener error: %s", e)
+                await asyncio.sleep(1)
+
+event_hub = EventHub(EVENTS_QUEUE_SIZE)
+
+async def publish_events(events) -> None:
+    """Publish after commit; a lost event only costs clients a refetch."""
+    try:
+        async with get_redis().pipeline(transaction=False) as pipe:
+            for event in events:
+                pipe.publish(EVENTS_CHANNEL, json.dumps(event, separators=(",", ":"), default=str))
+            await pipe.execute()
+    except RedisError as e:
+        logger.warning("Could not publish room events: %s", e)
+
+def booking_event(booking, action: str) -> dict:
+    return {
+        "type": "booking", "action": action, "id": booking.id, "room_id": booking.room_id,
+        "status": booking.status, "check_in": booking.check_in, "check_out": booking.check_out,
+    }
@@ -0,0 +1,165 @@
+"""Per-request timing and SQL accounting.
+
+RequestInstrumentationMiddleware opens a RequestStats for every HTTP
+request in a context variable; SQLAlchemy cursor events on the shared
+engine add each statement to it (SQLAlchemy's asyncio greenlets inherit
+the caller's context). The result goes out as a Server-Timing header:
+
+    Server-Timing: db;dur=4.1;desc="3 queries", auth;dur=0.3, app;dur=2.2, total;dur=6.3
+
+Requests slower than SLOW_REQUEST_MS are logged with their most expensive
+statements. With N_PLUS_ONE_THRESHOLD > 0 (development), a statement
+shape executed more than that many times in one request is logged as a
+likely N+1.
+"""
+import functools
+import logging
+import os
+import re
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+from sqlalchemy import event
+
+from .database import engine
+
+logger = logging.getLogger(__name__)
+
+SLOW_REQUEST_MS = float(os.getenv("SLOW_REQUEST_MS", "500"))
+SLOW_REQUEST_TOP_QUERIES = int(os.getenv("SLOW_REQUEST_TOP_QUERIES", "5"))
+N_PLUS_ONE_THRESHOLD = int(os.getenv("N_PLUS_ONE_THRESHOLD", "0"))  # 0 = off
+
+_PLACEHOLDER_LIST = re.compile(r"\((?:\s*(?:%\(\w+\)s|%s|\?|:\w+|\$\d+)\s*,?)+\)")
+_NUMBER = re.compile(r"\b\d+\b")
+_WHITESPACE = re.compile(r"\s+")
+
+def statement_shape(statement: str) -> str:
+    """SQL with literals and IN-lists collapsed, so repeats group together."""
+    shape = _PLACEHOLDER_LIST.sub("(?)", statement)
+    shape = _NUMBER.sub("N", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+class RequestStats:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.db_time = 0.0
+        # shape -> [executions, seconds]
+        self.statements: Dict[str, List[float]] = defaultdict(lambda: [0, 0.0])
+        self.spans: Dict[str, float] = {}
+
+    def add_query(self, statement: str, seconds: float):
+        self.queries += 1
+        self.db_time += seconds
+        entry = self.statements[statement_shape(statement)]
+        entry[0] += 1
+        entry[1] += seconds
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def top_queries(self, n: int):
+        return sorted(self.statements.items(), key=lambda item: item[1][1], reverse=True)[:n]
+
+    def repeated(self, threshold: int):
+        return [(shape, int(count)) for shape, (count, _) in self.statements.items() if count > threshold]
+
+    def server_timing(self, total: float) -> str:
+        # Named spans overlap db/app (a commit is both); app is everything but db
+        app_time = max(total - self.db_time, 0.0)
+        parts = [f'db;dur={self.db_time * 1000:.1f};desc="{self.queries} queries"']
+        parts += [f"{name};dur={seconds * 1000:.1f}" for name, seconds in self.spans.items()]
+        parts += [f"app;dur={app_time * 1000:.1f}", f"total;dur={total * 1000:.1f}"]
+        return ", ".join(parts)
+
+current_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+@event.listens_for(engine.sync_engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_started"].pop()
+    stats = current_stats.get()
+    if stats is not None:
+        stats.add_query(statement, time.perf_counter() - started)
+
+@event.listens_for(engine.sync_engine, "handle_error")
+def _handle_error(context):
+    # A failed statement never reaches after_cursor_execute
+    started = context.connection.info.get("query_started") if context.connection is not None else None
+    if started:
+        started.pop()
+
+@contextmanager
+def span(name: str):
+    """Time a block as its own Server-Timing entry (its queries still count as db too)."""
+    stats = current_stats.get()
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        if stats is not None:
+            stats.spans[name] = stats.spans.get(name, 0.0) + time.perf_counter() - started
+
+def timed(name: str):
+    """span() as a decorator for async functions, e.g. FastAPI dependencies."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            with span(name):
+                return await fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+class RequestInstrumentationMiddleware:
+    """Pure ASGI, so the handler runs in the context that holds the stats."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        stats = RequestStats()
+        token = current_stats.set(stats)
+        status = 500
+        streaming = False
+
+        async def send_with_timing(message):
+            nonlocal status, streaming
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = list(message.get("headers", []))
+                # Event streams report the time to first byte and are never "slow"
+                streaming = (b"content-type", b"text/event-stream") in (
+                    (name.lower(), value.split(b";")[0]) for name, value in headers
+                )
+                headers.append((b"server-timing", stats.server_timing(stats.elapsed()).encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_stats.reset(token)
+            self.report(scope, status, stats, streaming)
+
+    def report(self, scope, status: int, stats: RequestStats, streaming: bool):
+        total_ms = stats.elapsed() * 1000
+        route = f'{scope["method"]} {scope["path"]}'
+        if total_ms >= SLOW_REQUEST_MS and not streaming:
+            top = "".join(
+                f"\n  {count}x {seconds * 1000:.1f}ms {shape[:300]}"
+                for shape, (count, seconds) in stats.top_queries(SLOW_REQUEST_TOP_QUERIES)
+            )
+            logger.warning("Slow request %s -> %s: %.0fms total, %.0fms in %d queries%s",
+                           route, status, total_ms, stats.db_time * 1000, stats.queries, top)
+        if N_PLUS_ONE_THRESHOLD:
+            for shape, count in stats.repeated(N_PLUS_ONE_THRESHOLD):
+                logger.warning("Possible N+1 in %s: %d executions of %s", route, count, shape[:300])
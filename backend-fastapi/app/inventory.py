@@ -0,0 +1,131 @@
+"""Per-room availability bitmaps in Redis.
+
+Layout and update rules match backend-django/bookings/inventory.py: one
+bitmap per room per year (bit = day of year - 1, set when booked), a
+WARM_BIT sentinel marking a fully loaded key, and a generation counter
+bumped by every writer so cold loads never overwrite a newer write.
+"""
+import calendar
+import logging
+import os
+from datetime import date, timedelta
+from typing import List, Optional
+
+from redis.exceptions import RedisError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from . import models
+from .redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+INVENTORY_CACHE_TTL = int(os.getenv("INVENTORY_CACHE_TTL", "86400"))
+
+KEY_PREFIX = "inventory:room:"
+WARM_BIT = 367
+BITMAP_BYTES = WARM_BIT // 8 + 1
+
+UPDATE_SCRIPT = """
+local value = tonumber(ARGV[1])
+for i = 1, #KEYS, 2 do
+    redis.call('INCR', KEYS[i + 1])
+    redis.call('EXPIRE', KEYS[i + 1], ARGV[2])
+    if redis.call('GETBIT', KEYS[i], %d) == 1 then
+        local n = (i + 1) / 2
+        for bit = tonumber(ARGV[1 + 2 * n]), tonumber(ARGV[2 + 2 * n]) do
+            redis.call('SETBIT', KEYS[i], bit, value)
+        end
+    end
+end
+return 1
+""" % WARM_BIT
+
+# Store a cold-loaded bitmap only if no writer ran since it was read
+FILL_SCRIPT = """
+if (redis.call('GET', KEYS[2]) or '0') == ARGV[2] then
+    redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[3])
+    return 1
+end
+return 0
+"""
+
+def bitmap_key(room_id: int, year: int) -> str:
+    return f"{KEY_PREFIX}{room_id}:{year}"
+
+def generation_key(room_id: int, year: int) -> str:
+    return f"{bitmap_key(room_id, year)}:gen"
+
+def bit_ranges(check_in: date, check_out: date) -> dict:
+    """{year: (first_bit, last_bit)} for the nights in [check_in, check_out)."""
+    ranges = {}
+    night = check_in
+    while night < check_out:
+        year_end = min(check_out, date(night.year + 1, 1, 1))
+        first = night.timetuple().tm_yday - 1
+        last = (year_end - timedelta(days=1)).timetuple().tm_yday - 1
+        ranges[night.year] = (first, last)
+        night = year_end
+    return ranges
+
+def build_bitmap(nights) -> bytes:
+    buf = bytearray(BITMAP_BYTES)
+    for bit in [night.timetuple().tm_yday - 1 for night in nights] + [WARM_BIT]:
+        buf[bit >> 3] |= 0x80 >> (bit & 7)
+    return bytes(buf)
+
+async def mark_booked(stays) -> None:
+    """Set the nights of committed (room_id, check_in, check_out) stays."""
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        for room_id, check_in, check_out in stays:
+            keys, args = [], [1, INVENTORY_CACHE_TTL * 2]
+            for year, (first, last) in bit_ranges(check_in, check_out).items():
+                keys += [bitmap_key(room_id, year), generation_key(room_id, year)]
+                args += [first, last]
+            if keys:
+                pipe.eval(UPDATE_SCRIPT, len(keys), *keys, *args)
+        await pipe.execute()
+    except RedisError as e:
+        logger.warning("Could not update inventory bitmaps: %s", e)
+
+async def _load_year(db: AsyncSession, room_id: int, year: int) -> List[date]:
+    return (await db.execute(
+        select(models.RoomNight.night).where(
+            models.RoomNight.room_id == room_id,
+            models.RoomNight.night >= date(year, 1, 1),
+            models.RoomNight.night < date(year + 1, 1, 1),
+        )
+    )).scalars().all()
+
+async def month_calendar(db: AsyncSession, room_id: int, year: int, month: int) -> Optional[List[bool]]:
+    """Booked flag per night of the month, or None if the room does not exist.
+
+    Warm path: one BITFIELD call reading the month's bits and the sentinel.
+    Cold path: load the whole year from room nights and cache it.
+    """
+    days = calendar.monthrange(year, month)[1]
+    first = date(year, month, 1).timetuple().tm_yday - 1
+    key, gen_key = bitmap_key(room_id, year), generation_key(room_id, year)
+
+    redis = get_redis()
+    try:
+        month_bits, warm = await redis.execute_command(
+            "BITFIELD", key, "GET", f"u{days}", first, "GET", "u1", WARM_BIT
+        )
+        if warm:
+            return [bool(month_bits >> (days - 1 - i) & 1) for i in range(days)]
+        generation = await redis.get(gen_key) or "0"
+    except RedisError as e:
+        logger.warning("Inventory cache unavailable, reading room nights: %s", e)
+        redis = None
+
+    if await db.get(models.Room, room_id) is None:
+        return None
+    booked = set(await _load_year(db, room_id, year))
+    if redis is not None:
+        try:
+            await redis.eval(FILL_SCRIPT, 2, key, gen_key, build_bitmap(booked), generation, INVENTORY_CACHE_TTL)
+        except RedisError as e:
+            logger.warning("Could not cache inventory bitmap for room %s: %s", room_id, e)
+    return [date(year, month, day) in booked for day in range(1, days + 1)]
@@ -0,0 +1,29 @@
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Advisory lock namespace for per-room booking writes. Must match
+# BOOKING_LOCK_NAMESPACE in the Django bookings app (bookings/locks.py) so
+# both services serialize on the same key.
+BOOKING_LOCK_NAMESPACE = 7301
+
+# SQLSTATE raised by the booking_no_overlap exclusion constraint
+EXCLUSION_VIOLATION = "23P01"
+
+async def lock_room(db: AsyncSession, room_id: int):
+    # Transaction-scoped: released by commit/rollback. Only writers for the
+    # same room wait on each other.
+    if db.bind.dialect.name != "postgresql":
+        return
+    await db.execute(
+        text("SELECT pg_advisory_xact_lock(:namespace, :room_id)"),
+        {"namespace": BOOKING_LOCK_NAMESPACE, "room_id": room_id},
+    )
+
+async def lock_rooms(db: AsyncSession, room_ids):
+    # Always acquire in ascending order so multi-room writers cannot deadlock
+    for room_id in sorted(set(room_ids)):
+        await lock_room(db, room_id)
+
+def is_exclusion_violation(exc: IntegrityError) -> bool:
+    return getattr(exc.orig, "sqlstate", None) == EXCLUSION_VIOLATION
@@ -1,13 +1,39 @@
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI, Depends, Response
 from fastapi.middleware.cors import CORSMiddleware
+from contextlib import asynccontextmanager
+import asyncio
 import os
+from .session_cache import session_cache
+from .audit import audit_buffer
+from .events import event_hub
+from .response_cache import catalog_cache
+from .instrumentation import RequestInstrumentationMiddleware
+from .metrics import MetricsMiddleware
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Keep the in-process session cache in sync with Django logouts
+    invalidation_listener = asyncio.create_task(session_cache.listen_for_invalidations())
+    audit_flusher = asyncio.create_task(audit_buffer.run())
+    # Single Redis subscriber feeding every /events/rooms stream
+    event_listener = asyncio.create_task(event_hub.run())
+    catalog_listener = asyncio.create_task(catalog_cache.listen_for_invalidations())
+    yield
+    invalidation_listener.cancel()
+    audit_flusher.cancel()
+    event_listener.cancel()
+    catalog_listener.cancel()
+    # Nothing queued is lost on a clean shutdown
+    await audit_buffer.flush()
 
 app = FastAPI(
     title="Hotel Management API",
     description="High-performance Public API for Local Smart Hotel Management system",
     version="1.0.0",
     docs_url="/docs",
-    openapi_url="/openapi.json"
+    openapi_url="/openapi.json",
+    lifespan=lifespan,
 )
 
 # CORS configuration
@@ -17,7 +43,13 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
+# add_middleware wraps what is already there, so the last one added runs
+# first: instrumentation is outermost and its Server-Timing / slow-request
+# logs cover the metrics middleware too
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(RequestInstrumentationMiddleware)
 
 @app.get("/")
 async def root():
@@ -27,7 +59,14 @@ async def root():
 async def health_check():
     return {"status": "healthy"}
 
-from .routers import rooms, bookings, invoices
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    # Prometheus scrapes backend-fastapi:8001 directly; nginx hides /api/metrics
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+from .routers import rooms, bookings, invoices, reports, events
 app.include_router(rooms.router)
 app.include_router(bookings.router)
 app.include_router(invoices.router)
+app.include_router(reports.router)
+app.include_router(events.router)
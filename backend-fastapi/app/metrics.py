@@ -0,0 +1,105 @@
+"""Prometheus metrics, served at GET /metrics (not routed through nginx).
+
+Request latency and in-flight requests come from MetricsMiddleware; pool
+and cache numbers are read from the live objects at scrape time. Celery
+queue depth and task durations are exported by Django's /metrics, next to
+the workers that produce them.
+"""
+import time
+
+from prometheus_client import Gauge, Histogram, REGISTRY
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from starlette.routing import Match
+
+from .database import engine
+from .response_cache import catalog_cache
+from .session_cache import session_cache
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds", "Time to the last response byte",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+# Open /events/rooms streams count as in flight for as long as they last
+IN_FLIGHT = Gauge("http_requests_in_flight", "Requests currently being handled", ["method"])
+
+def _route_template(app, scope) -> str:
+    # Label by path template (/rooms/{room_id}), never by raw path
+    route = scope.get("route")
+    if route is None:
+        for candidate in app.router.routes:
+            match, _ = candidate.matches(scope)
+            if match == Match.FULL:
+                route = candidate
+                break
+    return getattr(route, "path", "unmatched")
+
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        method = scope["method"]
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        IN_FLIGHT.labels(method).inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            IN_FLIGHT.labels(method).dec()
+            REQUEST_LATENCY.labels(method, _route_template(scope["app"], scope), str(status)).observe(
+                time.perf_counter() - started
+            )
+
+class PoolCollector:
+    """SQLAlchemy QueuePool usage; SQLite's pools have no counters and are skipped."""
+
+    def collect(self):
+        pool = engine.sync_engine.pool
+        if not hasattr(pool, "checkedout"):
+            return
+        checked_out = GaugeMetricFamily("db_pool_checked_out", "Connections lent out to sessions")
+        checked_out.add_metric([], pool.checkedout())
+        yield checked_out
+        idle = GaugeMetricFamily("db_pool_idle", "Open connections waiting in the pool")
+        idle.add_metric([], pool.checkedin())
+        yield idle
+        size = GaugeMetricFamily("db_pool_size", "Configured pool_size")
+        size.add_metric([], pool.size())
+        yield size
+        # Negative until the pool is full; max_overflow is the ceiling
+        overflow = GaugeMetricFamily("db_pool_overflow", "Connections opened beyond pool_size")
+        overflow.add_metric([], pool.overflow())
+        yield overflow
+
+class CacheCollector:
+    """Hit counters of the two-tier in-process caches."""
+
+    caches = {"session": session_cache, "catalog": catalog_cache}
+
+    def collect(self):
+        hits = CounterMetricFamily("cache_hits", "Cache hits by tier", labels=["cache", "tier"])
+        misses = CounterMetricFamily("cache_misses", "Lookups served by neither tier", labels=["cache"])
+        ratio = GaugeMetricFamily("cache_hit_ratio", "Hits / lookups since process start", labels=["cache"])
+        entries = GaugeMetricFamily("cache_local_entries", "Entries in the in-process tier", labels=["cache"])
+        for name, cache in self.caches.items():
+            stats = cache.stats()
+            hits.add_metric([name, "local"], stats["hits"])
+            hits.add_metric([name, "redis"], stats["redis_hits"])
+            misses.add_metric([name], stats["misses"])
+            ratio.add_metric([name], stats["hit_ratio"])
+            entries.add_metric([name], stats["entries"])
+        yield from (hits, misses, ratio, entries)
+
+REGISTRY.register(PoolCollector())
+REGISTRY.register(CacheCollector())
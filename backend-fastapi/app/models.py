@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime, Date, Numeric, Text, JSON
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime, Date, Numeric, Text, JSON, Table
 from sqlalchemy.orm import relationship
 from .database import Base
 
@@ -10,6 +10,10 @@ class User(Base):
     role = Column(String)
     # Mapping other required fields would go here if needed for API
 
+# Roles that may see other guests' data; must match User.is_staff_member
+# in Django (users/models.py)
+STAFF_ROLES = ("superadmin", "manager", "receptionist", "housekeeping")
+
 # Mirroring 'django_session'
 class DjangoSession(Base):
     __tablename__ = "django_session"
@@ -17,22 +21,58 @@ class DjangoSession(Base):
     session_data = Column(Text)
     expire_date = Column(DateTime)
 
+# Mirroring 'rooms_amenity' and the RoomType.amenities M2M table
+class Amenity(Base):
+    __tablename__ = "rooms_amenity"
+    id = Column(Integer, primary_key=True)
+    name = Column(String, unique=True)
+
+room_type_amenities = Table(
+    "rooms_roomtype_amenities",
+    Base.metadata,
+    Column("id", Integer, primary_key=True),
+    Column("roomtype_id", Integer, ForeignKey("rooms_roomtype.id")),
+    Column("amenity_id", Integer, ForeignKey("rooms_amenity.id")),
+)
+
 # Mirroring 'rooms_room'
 class RoomType(Base):
     __tablename__ = "rooms_roomtype"
     id = Column(Integer, primary_key=True)
     name = Column(String)
     base_rate = Column(Numeric)
+    capacity = Column(Integer)
     
+# Mirroring 'rooms_pricingrule' (dates inclusive)
+class PricingRule(Base):
+    __tablename__ = "rooms_pricingrule"
+    id = Column(Integer, primary_key=True)
+    room_type_id = Column(Integer, ForeignKey("rooms_roomtype.id"))
+    start_date = Column(Date)
+    end_date = Column(Date)
+    rate_override = Column(Numeric)
+
+# Mirroring 'rooms_nightlyrate', the rate calendar maintained by Django
+class NightlyRate(Base):
+    __tablename__ = "rooms_nightlyrate"
+    id = Column(Integer, primary_key=True)
+    room_type_id = Column(Integer, ForeignKey("rooms_roomtype.id"))
+    night = Column(Date)
+    rate = Column(Numeric)
+
 class Room(Base):
     __tablename__ = "rooms_room"
     id = Column(Integer, primary_key=True)
     room_number = Column(String, unique=True)
     room_type_id = Column(Integer, ForeignKey("rooms_roomtype.id"))
     status = Column(String)
+    floor = Column(Integer)
     
     room_type = relationship("RoomType")
 
+# Bookings in these states do not hold the room
+INACTIVE_BOOKING_STATUSES = ('cancelled', 'no_show')
+
 # Mirroring 'bookings_booking'
 class Booking(Base):
     __tablename__ = "bookings_booking"
@@ -46,3 +86,40 @@ class Booking(Base):
 
     room = relationship("Room")
     guest = relationship("User")
+
+# Mirroring 'bookings_roomnight': one row per occupied night of an active
+# booking, written alongside the booking (see app/room_nights.py)
+class RoomNight(Base):
+    __tablename__ = "bookings_roomnight"
+    id = Column(Integer, primary_key=True)
+    room_id = Column(Integer, ForeignKey("rooms_room.id"))
+    night = Column(Date)
+    booking_id = Column(Integer, ForeignKey("bookings_booking.id"))
+    status = Column(String)
+    nightly_rate = Column(Numeric)
+
+# Mirroring 'billing_invoice'
+class Invoice(Base):
+    __tablename__ = "billing_invoice"
+    id = Column(Integer, primary_key=True)
+    booking_id = Column(Integer, ForeignKey("bookings_booking.id"))
+    invoice_number = Column(String, unique=True)
+    issued_at = Column(DateTime)
+    due_date = Column(Date)
+    paid_at = Column(DateTime)
+    pdf_file = Column(String)  # path relative to MEDIA_ROOT
+    total = Column(Numeric)
+    line_count = Column(Integer)
+
+    booking = relationship("Booking")
+
+# Mirroring 'audit_log_activitylog' (written in batches by app/audit.py)
+class ActivityLog(Base):
+    __tablename__ = "audit_log_activitylog"
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users_user.id"), nullable=True)
+    action = Column(String)
+    model_name = Column(String)
+    object_id = Column(String)
+    timestamp = Column(DateTime(timezone=True))
+    details = Column(JSON, nullable=True)
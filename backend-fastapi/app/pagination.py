@@ -0,0 +1,23 @@
+import base64
+import json
+from fastapi import HTTPException
+
+# Keyset pagination cursors. A cursor is the sort key of the last row on the
+# previous page, encoded so clients treat it as an opaque token. The next
+# cursor is returned in this response header rather than in the body so the
+# list endpoints keep returning plain JSON arrays.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+def encode_cursor(*values) -> str:
+    raw = json.dumps(list(values), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str, arity: int) -> list:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded))
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(values, list) or len(values) != arity:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
@@ -0,0 +1,111 @@
+from datetime import date
+from decimal import Decimal
+from typing import Dict, Hashable, Iterable, Optional, Sequence, Tuple
+from sqlalchemy import select, func, values, column, and_, Integer, Date
+from sqlalchemy.ext.asyncio import AsyncSession
+from . import models
+
+# Quotes come from the rate calendar (rooms_nightlyrate) that Django
+# materializes from RoomType.base_rate + PricingRule. Nights outside the
+# calendar horizon are resolved from the rules with the same precedence as
+# rooms/pricing.py: narrowest rule wins, then the newest.
+
+def resolve_rates(base_rate, rules, start: date, end: date):
+    nights = (end - start).days
+    rates = [base_rate] * nights
+    ordered = sorted(rules, key=lambda r: (-(r.end_date - r.start_date).days, r.id or 0))
+    for rule in ordered:
+        lo = max((rule.start_date - start).days, 0)
+        hi = min((rule.end_date - start).days + 1, nights)
+        if lo < hi:
+            rates[lo:hi] = [rule.rate_override] * (hi - lo)
+    return rates
+
+async def quote_stays(
+    db: AsyncSession,
+    check_in: date,
+    check_out: date,
+    room_type_ids: Optional[Iterable[int]] = None,
+) -> Dict[int, Decimal]:
+    """Total price of the stay per room type id.
+
+    One grouped range-sum over the calendar covers every room type; only
+    types with missing calendar nights need the rule fallback.
+    """
+    nights = (check_out - check_in).days
+    ids = None if room_type_ids is None else list(set(room_type_ids))
+
+    stmt = (
+        select(models.NightlyRate.room_type_id, func.sum(models.NightlyRate.rate), func.count())
+        .where(models.NightlyRate.night >= check_in, models.NightlyRate.night < check_out)
+        .group_by(models.NightlyRate.room_type_id)
+    )
+    if ids is not None:
+        stmt = stmt.where(models.NightlyRate.room_type_id.in_(ids))
+    totals = {
+        room_type_id: Decimal(total)
+        for room_type_id, total, count in (await db.execute(stmt)).all()
+        if count == nights
+    }
+
+    types_stmt = select(models.RoomType).where(models.RoomType.id.notin_(list(totals)))
+    if ids is not None:
+        types_stmt = types_stmt.where(models.RoomType.id.in_(ids))
+    missing = (await db.execute(types_stmt)).scalars().all()
+    if missing:
+        rules_result = await db.execute(
+            select(models.PricingRule).where(
+                models.PricingRule.room_type_id.in_([rt.id for rt in missing]),
+                models.PricingRule.start_date < check_out,
+                models.PricingRule.end_date >= check_in,
+            )
+        )
+        rules_by_type = {}
+        for rule in rules_result.scalars().all():
+            rules_by_type.setdefault(rule.room_type_id, []).append(rule)
+        for room_type in missing:
+            rates = resolve_rates(room_type.base_rate, rules_by_type.get(room_type.id, []), check_in, check_out)
+            totals[room_type.id] = sum(rates, Decimal("0"))
+    return totals
+
+async def quote_stay(db: AsyncSession, room_type_id: int, check_in: date, check_out: date) -> Decimal:
+    return (await quote_stays(db, check_in, check_out, [room_type_id]))[room_type_id]
+
+async def quote_ranges(
+    db: AsyncSession,
+    stays: Sequence[Tuple[Hashable, int, date, date]],
+) -> Dict[Hashable, Decimal]:
+    """Price many (key, room_type_id, check_in, check_out) stays at once.
+
+    The stays are joined to the calendar as an inline VALUES list, so any
+    number of date ranges costs one query.
+    """
+    if not stays:
+        return {}
+    by_pos = dict(enumerate(stays))
+
+    req = values(
+        column("pos", Integer), column("room_type_id", Integer),
+        column("check_in", Date), column("check_out", Date),
+        name="req",
+    ).data([(pos, rt, ci, co) for pos, (_, rt, ci, co) in by_pos.items()])
+    result = await db.execute(
+        select(req.c.pos, func.sum(models.NightlyRate.rate), func.count(models.NightlyRate.id))
+        .join(models.NightlyRate, and_(
+            models.NightlyRate.room_type_id == req.c.room_type_id,
+            models.NightlyRate.night >= req.c.check_in,
+            models.NightlyRate.night < req.c.check_out,
+        ))
+        .group_by(req.c.pos)
+    )
+
+    totals = {}
+    for pos, total, count in result.all():
+        key, _, check_in, check_out = by_pos[pos]
+        if count == (check_out - check_in).days:
+            totals[key] = Decimal(total)
+    # Stays reaching past the calendar horizon
+    for key, room_type_id, check_in, check_out in stays:
+        if key not in totals:
+            totals[key] = await quote_stay(db, room_type_id, check_in, check_out)
+    return totals
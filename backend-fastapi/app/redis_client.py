@@ -0,0 +1,13 @@
+import os
+import redis.asyncio as redis
+
+REDIS_URL = os.getenv("REDIS_URL", "redis://redis:6379/0")
+
+_client = None
+
+def get_redis():
+    # One pooled client per process, created lazily inside the event loop
+    global _client
+    if _client is None:
+        _client = redis.from_url(REDIS_URL, decode_responses=True)
+    return _client
@@ -0,0 +1,82 @@
+"""Vectorized occupancy / revenue analytics.
+
+A window is laid out as two rooms x nights matrices: `occupied` (bool) and
+`revenue` (nightly revenue), filled from room-night rows in one scatter.
+Metrics are then plain array reductions:
+
+  occupancy = room-nights sold / room-nights available
+  ADR       = revenue / room-nights sold
+  RevPAR    = revenue / room-nights available
+"""
+from datetime import date, timedelta
+from typing import Dict, List, Sequence
+import numpy as np
+
+def matrices_from_room_nights(
+    room_rows: np.ndarray,
+    night_offsets: np.ndarray,
+    nightly_rates: np.ndarray,
+    n_rooms: int,
+    n_nights: int,
+):
+    """Occupancy and revenue matrices from (room, night, rate) rows."""
+    occupied = np.zeros((n_rooms, n_nights), dtype=bool)
+    revenue = np.zeros((n_rooms, n_nights), dtype=np.float64)
+    occupied[room_rows, night_offsets] = True
+    revenue[room_rows, night_offsets] = nightly_rates
+    return occupied, revenue
+
+def _metrics(sold, available, revenue) -> Dict[str, np.ndarray]:
+    sold = np.asarray(sold, dtype=np.float64)
+    available = np.asarray(available, dtype=np.float64)
+    revenue = np.asarray(revenue, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        occupancy = np.where(available > 0, sold / available, 0.0)
+        adr = np.where(sold > 0, revenue / sold, 0.0)
+        revpar = np.where(available > 0, revenue / available, 0.0)
+    return {
+        "room_nights_sold": sold,
+        "room_nights_available": available,
+        "revenue": revenue,
+        "occupancy": occupancy,
+        "adr": adr,
+        "revpar": revpar,
+    }
+
+def _rows(keys: Sequence, metrics: Dict[str, np.ndarray]) -> List[dict]:
+    return [
+        {
+            "key": str(key),
+            "room_nights_sold": int(metrics["room_nights_sold"][i]),
+            "room_nights_available": int(metrics["room_nights_available"][i]),
+            "revenue": round(float(metrics["revenue"][i]), 2),
+            "occupancy": round(float(metrics["occupancy"][i]), 4),
+            "adr": round(float(metrics["adr"][i]), 2),
+            "revpar": round(float(metrics["revpar"][i]), 2),
+        }
+        for i, key in enumerate(keys)
+    ]
+
+def summarize(occupied: np.ndarray, revenue: np.ndarray, start: date, group_by: str, room_labels: Sequence = ()):
+    """Totals plus a breakdown by day or by a per-room label (type, floor)."""
+    n_rooms, n_nights = occupied.shape
+    sold_per_room = occupied.sum(axis=1)
+    revenue_per_room = revenue.sum(axis=1)
+
+    totals = _rows(["total"], _metrics(
+        [sold_per_room.sum()], [n_rooms * n_nights], [revenue_per_room.sum()]
+    ))[0]
+    totals.pop("key")
+
+    if group_by == "day":
+        keys = [(start + timedelta(days=i)).isoformat() for i in range(n_nights)]
+        breakdown = _rows(keys, _metrics(occupied.sum(axis=0), np.full(n_nights, n_rooms), revenue.sum(axis=0)))
+    else:
+        keys, codes = np.unique(np.asarray(room_labels), return_inverse=True)
+        groups = len(keys)
+        breakdown = _rows(keys.tolist(), _metrics(
+            np.bincount(codes, weights=sold_per_room, minlength=groups),
+            np.bincount(codes, minlength=groups) * n_nights,
+            np.bincount(codes, weights=revenue_per_room, minlength=groups),
+        ))
+    return totals, breakdown
@@ -0,0 +1,178 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, NamedTuple, Optional, Tuple
+
+from fastapi import Request, Response
+from redis.exceptions import RedisError
+
+from .redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Rendered catalog responses (GET /rooms/, GET /rooms/{id}), in two tiers
+# like the session cache: a small in-process LRU in front of Redis. Entries
+# are keyed by the catalog version, which Django bumps (and publishes) on
+# any Room / RoomType / Amenity change; must match rooms/catalog_cache.py.
+CATALOG_CACHE_TTL = int(os.getenv("CATALOG_CACHE_TTL", "300"))
+CATALOG_CACHE_LOCAL_TTL = float(os.getenv("CATALOG_CACHE_LOCAL_TTL", "5"))
+CATALOG_CACHE_MAX_ENTRIES = int(os.getenv("CATALOG_CACHE_MAX_ENTRIES", "2000"))
+# Browsers/nginx must revalidate (cheap 304) unless a max-age is configured
+CATALOG_CACHE_MAX_AGE = int(os.getenv("CATALOG_CACHE_MAX_AGE", "0"))
+
+VERSION_KEY = "catalog:version"
+KEY_PREFIX = "catalog:"
+INVALIDATION_CHANNEL = "catalog-invalidate"
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    etag: str
+    headers: Dict[str, str]
+
+Producer = Callable[[], Awaitable[Tuple[bytes, Dict[str, str]]]]
+
+def _etag(body: bytes) -> str:
+    # Content hash: unchanged bodies keep their ETag across version bumps
+    return '"%s"' % hashlib.blake2b(body, digest_size=12).hexdigest()
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag in candidates or "*" in candidates
+
+class CatalogCache:
+    def __init__(self, max_entries: int, local_ttl: float, redis_ttl: int):
+        self.max_entries = max_entries
+        self.local_ttl = local_ttl
+        self.redis_ttl = redis_ttl
+        self._entries = OrderedDict()  # key -> (CachedResponse, deadline)
+        self._version = None
+        self._version_read_at = 0.0
+        self.hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.not_modified = 0
+
+    async def version(self) -> str:
+        # Pushed by the invalidation listener; re-read now and then in case
+        # a message was missed
+        if self._version is None or time.monotonic() - self._version_read_at > self.local_ttl:
+            try:
+                self._set_version(await get_redis().get(VERSION_KEY) or "0")
+            except RedisError as e:
+                logger.warning("Catalog version read failed: %s", e)
+                return self._version or "0"
+        return self._version
+
+    def _set_version(self, version: str):
+        if version != self._version:
+            self._entries.clear()
+        self._version = version
+        self._version_read_at = time.monotonic()
+
+    def _get_local(self, key: str) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        cached, deadline = entry
+        if deadline <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return cached
+
+    def _set_local(self, key: str, cached: CachedResponse):
+        self._entries[key] = (cached, time.monotonic() + self.local_ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def _lookup(self, key: str) -> Optional[CachedResponse]:
+        cached = self._get_local(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+        try:
+            raw = await get_redis().get(key)
+        except RedisError as e:
+            logger.warning("Catalog cache read failed: %s", e)
+            raw = None
+        if raw:
+            data = json.loads(raw)
+            cached = CachedResponse(data["body"].encode(), data["etag"], data["headers"])
+            self.redis_hits += 1
+            self._set_local(key, cached)
+            return cached
+        self.misses += 1
+        return None
+
+    async def _store(self, key: str, cached: CachedResponse):
+        self._set_local(key, cached)
+        try:
+            await get_redis().set(key, json.dumps({
+                "body": cached.body.decode(), "etag": cached.etag, "headers": cached.headers,
+            }), ex=self.redis_ttl)
+        except RedisError as e:
+            logger.warning("Catalog cache write failed: %s", e)
+
+    async def respond(self, request: Request, route: str, produce: Producer) -> Response:
+        """Serve a JSON catalog response from cache, rendering it on a miss.
+
+        `produce` returns the serialized body and any headers that belong
+        to it (e.g. X-Next-Cursor); both are cached together.
+        """
+        params = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+        key = f"{KEY_PREFIX}v{await self.version()}:{route}?{params}"
+
+        cached = await self._lookup(key)
+        if cached is None:
+            body, headers = await produce()
+            cached = CachedResponse(body, _etag(body), headers)
+            await self._store(key, cached)
+
+        headers = {
+            **cached.headers,
+            "ETag": cached.etag,
+            "Cache-Control": f"public, max-age={CATALOG_CACHE_MAX_AGE}, must-revalidate",
+        }
+        if _etag_matches(request, cached.etag):
+            self.not_modified += 1
+            return Response(status_code=304, headers=headers)
+        return Response(content=cached.body, media_type="application/json", headers=headers)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.redis_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "version": self._version,
+            "hits": self.hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "not_modified": self.not_modified,
+            "hit_ratio": (self.hits + self.redis_hits) / lookups if lookups else 0.0,
+        }
+
+    async def listen_for_invalidations(self):
+        # Django publishes the new version after every catalog change
+        while True:
+            try:
+                async with get_redis().pubsub() as pubsub:
+                    await pubsub.subscribe(INVALIDATION_CHANNEL)
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            self._set_version(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Falls back to re-reading the version every local TTL
+                logger.warning("Catalog invalidation listener error: %s", e)
+                self._version = None
+                await asyncio.sleep(1)
+
+catalog_cache = CatalogCache(CATALOG_CACHE_MAX_ENTRIES, CATALOG_CACHE_LOCAL_TTL, CATALOG_CACHE_TTL)
@@ -0,0 +1,25 @@
+from decimal import Decimal
+
+import orjson
+from fastapi.responses import Response
+
+# Fast path for large list endpoints: rows selected as plain columns are
+# turned into dicts and encoded by orjson, instead of ORM objects being
+# re-validated into response models and run through jsonable_encoder.
+# Only for trusted rows whose dicts already have the response model's
+# shape; the route's response_model then documents the schema only.
+
+def _default(value):
+    # Same as Pydantic's JSON mode: Decimal("100.00") -> "100.00"
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def dumps(content) -> bytes:
+    return orjson.dumps(content, default=_default)
+
+class FastJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return dumps(content)
@@ -0,0 +1,38 @@
+from datetime import timedelta
+from decimal import Decimal, ROUND_HALF_UP
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from . import models
+
+CENT = Decimal("0.01")
+
+def nightly_rates(total_price, nights: int):
+    """Total spread evenly over the nights, remainder on the last one.
+
+    Must match backend-django/bookings/room_nights.py (and its reconcile SQL).
+    """
+    if nights <= 0:
+        return []
+    total = Decimal(total_price or 0)
+    per_night = (total / nights).quantize(CENT, rounding=ROUND_HALF_UP)
+    return [per_night] * (nights - 1) + [total - per_night * (nights - 1)]
+
+async def add_room_nights(db: AsyncSession, bookings) -> None:
+    """Insert the room-night rows for freshly created bookings.
+
+    Runs in the caller's transaction so rows commit with the bookings.
+    """
+    rows = [
+        {
+            "room_id": booking.room_id,
+            "night": booking.check_in + timedelta(days=offset),
+            "booking_id": booking.id,
+            "status": booking.status,
+            "nightly_rate": rate,
+        }
+        for booking in bookings
+        if booking.status not in models.INACTIVE_BOOKING_STATUSES
+        for offset, rate in enumerate(nightly_rates(booking.total_price, (booking.check_out - booking.check_in).days))
+    ]
+    if rows:
+        await db.execute(insert(models.RoomNight), rows)
@@ -1,11 +1,21 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import select, insert, values, column, and_, Integer, Date
+from sqlalchemy.exc import IntegrityError
 from typing import List
 from datetime import date
 from .. import models, schemas
 from ..database import get_db
 from ..auth import get_current_user
+from ..locking import lock_room, lock_rooms, is_exclusion_violation
+from ..pricing import quote_stay, quote_ranges
+from ..audit import audit_buffer
+from ..room_nights import add_room_nights
+from ..inventory import mark_booked
+from ..events import publish_events, booking_event
+from ..instrumentation import span
+from ..responses import FastJSONResponse
 
 router = APIRouter(
     prefix="/bookings",
@@ -13,9 +23,9 @@ router = APIRouter(
 )
 
 @router.post("/", response_model=schemas.BookingOut)
-def create_booking(
+async def create_booking(
     booking: schemas.BookingCreate, 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(get_current_user)
 ):
     # 1. Validate dates
@@ -26,19 +36,24 @@ def create_booking(
         )
     
     # 2. Check room existence and get rate
-    room = db.query(models.Room).filter(models.Room.id == booking.room_id).first()
+    room = await db.get(models.Room, booking.room_id)
     if not room:
          raise HTTPException(status_code=404, detail="Room not found")
     
     # 3. Check for overlaps
+    # Writers for the same room queue on an advisory lock until commit, so
+    # the check below cannot race another insert. Other rooms are unaffected.
+    await lock_room(db, booking.room_id)
     # Overlap if: (StartA <= EndB) and (EndA >= StartB)
     # Django model check was: check_in__lt=self.check_out, check_out__gt=self.check_in
-    overlapping = db.query(models.Booking).filter(
-        models.Booking.room_id == booking.room_id,
-        models.Booking.check_in < booking.check_out,
-        models.Booking.check_out > booking.check_in,
-        models.Booking.status.notin_(['cancelled', 'no_show'])
-    ).first()
+    overlapping = (await db.execute(
+        select(models.Booking.id).where(
+            models.Booking.room_id == booking.room_id,
+            models.Booking.check_in < booking.check_out,
+            models.Booking.check_out > booking.check_in,
+            models.Booking.status.notin_(models.INACTIVE_BOOKING_STATUSES)
+        ).limit(1)
+    )).scalar_one_or_none()
 
     if overlapping:
         raise HTTPException(
@@ -47,20 +62,8 @@ def create_booking(
         )
 
     # 4. Calculate Price
-    # Simple logic: days * base_rate (ignoring seasonal override for MVP speed, can be added)
-    days = (booking.check_out - booking.check_in).days
-    # Need to join RoomType to get rate
-    # SQLAlchemy lazy load might need explicit join if not loaded
-    # Room model in models.py defines relationship? Yes: room_type relationship
-    if not room.room_type:
-        # Load it if missing (depends on model definition)
-        # Assuming eager load or lazy load works. room.room_type should work if definition is correct.
-        pass
-    
-    # We didn't define relationship backref in RoomType, but Room has room_type_id and relationship
-    # Let's query RoomType directly to be safe and faster
-    room_type = db.query(models.RoomType).filter(models.RoomType.id == room.room_type_id).first()
-    total_price = room_type.base_rate * days
+    # Sum of the nightly rates from the seasonal rate calendar
+    total_price = await quote_stay(db, room.room_type_id, booking.check_in, booking.check_out)
 
     new_booking = models.Booking(
         guest_id=current_user.id,
@@ -72,14 +75,164 @@ def create_booking(
     )
     
     db.add(new_booking)
-    db.commit()
-    db.refresh(new_booking)
+    try:
+        await db.flush()  # assigns new_booking.id for the room-night rows
+        await add_room_nights(db, [new_booking])
+        with span("commit"):
+            await db.commit()
+    except IntegrityError as exc:
+        # booking_no_overlap exclusion constraint, e.g. a writer that
+        # bypassed the advisory lock
+        await db.rollback()
+        if is_exclusion_violation(exc):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Room is already booked for these dates"
+            )
+        raise
+    await db.refresh(new_booking)
+    await mark_booked([(new_booking.room_id, new_booking.check_in, new_booking.check_out)])
+    await publish_events([booking_event(new_booking, "created")])
+
+    audit_buffer.log("created", "Booking", new_booking.id, user_id=current_user.id, details={
+        "room_id": new_booking.room_id, "check_in": str(new_booking.check_in),
+        "check_out": str(new_booking.check_out), "status": new_booking.status, "source": "api",
+    })
     
     return new_booking
 
+@router.post("/batch", response_model=schemas.BookingBatchOut)
+async def create_booking_batch(
+    batch: schemas.BookingBatchCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_user)
+):
+    """Book many rooms in one transaction (group and tour bookings).
+
+    Rooms, conflicts with existing bookings and prices are each resolved
+    with a single query for the whole batch, then all bookings are inserted
+    with one multi-row INSERT.
+    """
+    items = batch.items
+    results = {}
+
+    def reject(index, outcome, detail):
+        results[index] = schemas.BookingBatchItemResult(index=index, status=outcome, detail=detail)
+
+    # 1. Validate dates
+    for index, item in enumerate(items):
+        if item.check_in >= item.check_out:
+            reject(index, "invalid", "Check-out date must be after check-in date")
+
+    # 2. Resolve all rooms at once
+    room_ids = {item.room_id for item in items}
+    room_types = dict((await db.execute(
+        select(models.Room.id, models.Room.room_type_id).where(models.Room.id.in_(room_ids))
+    )).all())
+    for index, item in enumerate(items):
+        if index not in results and item.room_id not in room_types:
+            reject(index, "not_found", "Room not found")
+
+    # 3. Conflicts. Same per-room advisory locks as create_booking (taken in
+    # room id order), then one anti-join of every requested range against
+    # existing active bookings.
+    pending = [index for index in range(len(items)) if index not in results]
+    await lock_rooms(db, [items[index].room_id for index in pending])
+    if pending:
+        requested = values(
+            column("idx", Integer), column("room_id", Integer),
+            column("check_in", Date), column("check_out", Date),
+            name="requested",
+        ).data([(i, items[i].room_id, items[i].check_in, items[i].check_out) for i in pending])
+        clashing = (await db.execute(
+            select(requested.c.idx).distinct().join(models.Booking, and_(
+                models.Booking.room_id == requested.c.room_id,
+                models.Booking.check_in < requested.c.check_out,
+                models.Booking.check_out > requested.c.check_in,
+            )).where(models.Booking.status.notin_(models.INACTIVE_BOOKING_STATUSES))
+        )).scalars().all()
+        for index in clashing:
+            reject(index, "conflict", "Room is already booked for these dates")
+
+    # ...and against each other: earlier items in the batch win
+    accepted = {}
+    for index in pending:
+        if index in results:
+            continue
+        item = items[index]
+        taken = accepted.setdefault(item.room_id, [])
+        if any(item.check_in < check_out and item.check_out > check_in for check_in, check_out in taken):
+            reject(index, "conflict", "Overlaps another booking in this batch")
+        else:
+            taken.append((item.check_in, item.check_out))
+
+    if results and batch.mode == "all_or_nothing":
+        await db.rollback()
+        conflict = any(r.status == "conflict" for r in results.values())
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT if conflict else status.HTTP_400_BAD_REQUEST,
+            detail=jsonable_encoder([results[i] for i in sorted(results)]),
+        )
+
+    # 4. Price everything with one calendar query
+    to_create = [index for index in range(len(items)) if index not in results]
+    prices = await quote_ranges(db, [
+        (index, room_types[items[index].room_id], items[index].check_in, items[index].check_out)
+        for index in to_create
+    ])
+
+    # 5. One multi-row INSERT ... RETURNING, in parameter order
+    created = []
+    if to_create:
+        created = (await db.scalars(
+            insert(models.Booking).returning(models.Booking, sort_by_parameter_order=True),
+            [
+                {
+                    "guest_id": current_user.id,
+                    "room_id": items[index].room_id,
+                    "check_in": items[index].check_in,
+                    "check_out": items[index].check_out,
+                    "status": "reserved",
+                    "total_price": prices[index],
+                }
+                for index in to_create
+            ],
+        )).all()
+        await add_room_nights(db, created)
+    try:
+        await db.commit()
+    except IntegrityError as exc:
+        await db.rollback()
+        if is_exclusion_violation(exc):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Room is already booked for these dates"
+            )
+        raise
+    await mark_booked([(b.room_id, b.check_in, b.check_out) for b in created])
+    await publish_events([booking_event(b, "created") for b in created])
+
+    for index, new_booking in zip(to_create, created):
+        audit_buffer.log("created", "Booking", new_booking.id, user_id=current_user.id, details={
+            "room_id": new_booking.room_id, "check_in": str(new_booking.check_in),
+            "check_out": str(new_booking.check_out), "status": new_booking.status, "source": "api-batch",
+        })
+        results[index] = schemas.BookingBatchItemResult(
+            index=index, status="created", booking=schemas.BookingOut.model_validate(new_booking)
+        )
+    return schemas.BookingBatchOut(created=len(created), results=[results[i] for i in sorted(results)])
+
 @router.get("/me", response_model=List[schemas.BookingOut])
-def my_bookings(
-    db: Session = Depends(get_db),
+async def my_bookings(
+    db: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(get_current_user)
 ):
-    return db.query(models.Booking).filter(models.Booking.guest_id == current_user.id).all()
+    # Columns in BookingOut order, straight to orjson: no ORM objects and no
+    # response_model re-validation (FastAPI skips it for a Response)
+    result = await db.execute(
+        select(
+            models.Booking.room_id, models.Booking.check_in, models.Booking.check_out, models.Booking.id,
+            models.Booking.status, models.Booking.total_price, models.Booking.guest_id,
+        ).where(models.Booking.guest_id == current_user.id)
+    )
+    return FastJSONResponse([row._asdict() for row in result])
@@ -0,0 +1,51 @@
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+import asyncio
+import json
+from .. import models
+from ..database import get_db
+from ..auth import get_current_user
+from ..events import event_hub
+
+router = APIRouter(
+    prefix="/events",
+    tags=["events"],
+)
+
+HEARTBEAT_SECONDS = 15
+
+def _sse(event: dict) -> str:
+    return f"event: {event['type']}\ndata: {json.dumps(event, separators=(',', ':'))}\n\n"
+
+@router.get("/rooms")
+async def room_events(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_user)
+):
+    """Server-sent stream of room, booking and housekeeping changes.
+
+    The first event is "resync" (load the current state, then apply
+    deltas); it is sent again whenever events may have been missed.
+    """
+    if current_user.role not in models.STAFF_ROLES:
+        raise HTTPException(status_code=403, detail="Staff only")
+    # The stream can stay open for hours; don't hold a pooled connection
+    await db.close()
+
+    async def stream():
+        with event_hub.subscribe() as queue:
+            yield "retry: 3000\n\n" + _sse({"type": "resync"})
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": ping\n\n"  # keeps proxies from closing an idle stream
+                    continue
+                yield _sse(event)
+
+    return StreamingResponse(stream(), media_type="text/event-stream", headers={
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no",
+    })
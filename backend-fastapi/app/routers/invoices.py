@@ -1,8 +1,41 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.concurrency import run_in_threadpool
+from celery.result import AsyncResult
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from urllib.parse import quote
+from redis.exceptions import RedisError
+import logging
+import os
+import uuid
 from ..database import get_db
 from ..celery_utils import celery_app
-from .. import models
+from ..auth import get_current_user
+from ..redis_client import get_redis
+from ..audit import audit_buffer
+from .. import models, schemas
+
+logger = logging.getLogger(__name__)
+
+# nginx location (internal) that aliases the shared media volume
+PROTECTED_MEDIA_PREFIX = os.getenv("PROTECTED_MEDIA_PREFIX", "/protected-media/")
+
+# One queued/running render per invoice. Key matches PDF_RENDER_LOCK_PREFIX
+# in billing/tasks.py, which releases it when the task finishes; the TTL
+# only matters if a worker dies mid-task.
+PDF_RENDER_LOCK_PREFIX = "invoice-pdf-render:"
+PDF_RENDER_LOCK_TTL = int(os.getenv("PDF_RENDER_LOCK_TTL", "600"))
+
+# Take the lock, or return the task id already holding it, in one step: a
+# separate SET NX + GET could see the lock expire in between
+ACQUIRE_LOCK_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if current then
+    return current
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+return false
+"""
 
 router = APIRouter(
     prefix="/invoices",
@@ -10,7 +43,11 @@ router = APIRouter(
 )
 
 @router.post("/{invoice_id}/generate-pdf")
-def generate_pdf(invoice_id: int, db: Session = Depends(get_db)):
+async def generate_pdf(
+    invoice_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_user)
+):
     # Verify invoice exists (optional, task handles it too but better to fail fast)
     # Using raw SQL for simplicity since we didn't map Invoice model in FastAPI yet, 
     # OR assume we map it. 
@@ -21,6 +58,78 @@ def generate_pdf(invoice_id: int, db: Session = Depends(get_db)):
     # Shared tasks usually get name 'billing.tasks.generate_invoice_pdf'
     
     task_name = "billing.tasks.generate_invoice_pdf"
-    task = celery_app.send_task(task_name, args=[invoice_id])
+
+    # Deduplicate repeated clicks: if a render for this invoice is already
+    # in flight, hand back its task id instead of queueing another one.
+    # (Unchanged invoices are also skipped by the task's fingerprint check.)
+    task_id = str(uuid.uuid4())
+    lock_key = f"{PDF_RENDER_LOCK_PREFIX}{invoice_id}"
+    redis = get_redis()
+    try:
+        running = await redis.eval(ACQUIRE_LOCK_SCRIPT, 1, lock_key, task_id, PDF_RENDER_LOCK_TTL)
+        if running:
+            return {"message": "PDF generation already in progress", "task_id": running}
+    except RedisError as e:
+        logger.warning("PDF render lock unavailable, not deduplicating: %s", e)
+
+    # send_task talks to the broker synchronously; keep it off the event loop
+    try:
+        task = await run_in_threadpool(celery_app.send_task, task_name, args=[invoice_id], task_id=task_id)
+    except Exception:
+        try:
+            await redis.delete(lock_key)
+        except RedisError:
+            pass
+        raise
+
+    audit_buffer.log("pdf_requested", "Invoice", invoice_id, details={"task_id": str(task.id)})
     
     return {"message": "PDF generation started", "task_id": str(task.id)}
+
+def _task_status(task_id: str) -> schemas.TaskStatusOut:
+    result = AsyncResult(task_id, app=celery_app)
+    state = result.state
+    ready = state in ("SUCCESS", "FAILURE", "REVOKED")
+    value = None
+    if state == "SUCCESS":
+        value = str(result.result)
+    elif state == "FAILURE":
+        value = repr(result.result)
+    return schemas.TaskStatusOut(task_id=task_id, state=state, ready=ready, result=value)
+
+@router.get("/tasks/{task_id}", response_model=schemas.TaskStatusOut)
+async def task_status(task_id: str, current_user: models.User = Depends(get_current_user)):
+    # Reads the Celery Redis result backend. Unknown ids report PENDING,
+    # exactly like tasks that have not started yet. Results carry invoice
+    # numbers, so only signed-in users may poll.
+    return await run_in_threadpool(_task_status, task_id)
+
+@router.get("/{invoice_id}/pdf", response_class=Response)
+async def download_pdf(
+    invoice_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_user)
+):
+    row = (await db.execute(
+        select(models.Invoice.pdf_file, models.Invoice.invoice_number, models.Booking.guest_id)
+        .join(models.Booking, models.Booking.id == models.Invoice.booking_id)
+        .where(models.Invoice.id == invoice_id)
+    )).first()
+    if not row:
+        raise HTTPException(status_code=404, detail="Invoice not found")
+    pdf_file, invoice_number, guest_id = row
+    if guest_id != current_user.id and current_user.role not in models.STAFF_ROLES:
+        raise HTTPException(status_code=404, detail="Invoice not found")
+    if not pdf_file:
+        raise HTTPException(status_code=404, detail="PDF has not been generated yet")
+
+    # nginx serves the file itself (sendfile, ETag, Range); no bytes pass
+    # through this worker
+    return Response(
+        media_type="application/pdf",
+        headers={
+            "X-Accel-Redirect": PROTECTED_MEDIA_PREFIX + quote(pdf_file),
+            "Content-Disposition": f'inline; filename="invoice_{invoice_number}.pdf"',
+            "Cache-Control": "private, no-cache",
+        },
+    )
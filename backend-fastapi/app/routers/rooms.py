@@ -1,19 +1,196 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import select, exists, func, tuple_
+from sqlalchemy.orm import joinedload, contains_eager
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Literal, Optional
+from datetime import date
 from .. import models, schemas
 from ..database import get_db
+from ..pricing import quote_stays
+from ..pagination import NEXT_CURSOR_HEADER, encode_cursor, decode_cursor
+from ..inventory import month_calendar
+from ..response_cache import catalog_cache
+from ..responses import dumps
 
 router = APIRouter(
     prefix="/rooms",
     tags=["rooms"],
 )
 
+def _rooms_with_type():
+    # room_type is joined into the same SELECT: no per-room query while
+    # serializing RoomOut (AsyncSession could not lazy load it anyway)
+    return select(models.Room).options(joinedload(models.Room.room_type, innerjoin=True))
+
+def _room_rows():
+    # Plain columns for the list fast path: no ORM identity map, no
+    # RoomOut validation; _room_dict builds the RoomOut shape directly
+    return select(
+        models.Room.id, models.Room.room_number, models.Room.status,
+        models.RoomType.id.label("room_type_id"), models.RoomType.name,
+        models.RoomType.base_rate, models.RoomType.capacity,
+    ).join(models.RoomType, models.RoomType.id == models.Room.room_type_id)
+
+def _room_dict(row) -> dict:
+    # Key order as RoomOut serializes it, so cached ETags stay stable
+    return {
+        "room_number": row.room_number,
+        "status": row.status,
+        "id": row.id,
+        "room_type": {"name": row.name, "base_rate": row.base_rate, "id": row.room_type_id, "capacity": row.capacity},
+    }
+
 @router.get("/", response_model=List[schemas.RoomOut])
-def list_rooms(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    rooms = db.query(models.Room).offset(skip).limit(limit).all()
+async def list_rooms(
+    request: Request,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
+    order_by: Literal["id", "room_number"] = "id",
+    status: Optional[str] = None,
+    floor: Optional[int] = None,
+    room_type_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_db),
+):
+    async def produce():
+        stmt = _room_rows()
+        if status is not None:
+            stmt = stmt.where(models.Room.status == status)
+        if floor is not None:
+            stmt = stmt.where(models.Room.floor == floor)
+        if room_type_id is not None:
+            stmt = stmt.where(models.Room.room_type_id == room_type_id)
+
+        # Keyset pagination: seek past the last row of the previous page
+        # instead of OFFSET, so deep pages cost the same as the first one
+        if order_by == "room_number":
+            sort_key = lambda row: (row.room_number, row.id)
+            if cursor:
+                after_number, after_id = decode_cursor(cursor, 2)
+                if not isinstance(after_number, str) or not isinstance(after_id, int):
+                    raise HTTPException(status_code=400, detail="Invalid cursor")
+                stmt = stmt.where(tuple_(models.Room.room_number, models.Room.id) > tuple_(after_number, after_id))
+            stmt = stmt.order_by(models.Room.room_number, models.Room.id)
+        else:
+            sort_key = lambda row: (row.id,)
+            if cursor:
+                (after_id,) = decode_cursor(cursor, 1)
+                if not isinstance(after_id, int):
+                    raise HTTPException(status_code=400, detail="Invalid cursor")
+                stmt = stmt.where(models.Room.id > after_id)
+            stmt = stmt.order_by(models.Room.id)
+
+        rows = (await db.execute(stmt.limit(limit + 1))).all()
+        headers = {}
+        if len(rows) > limit:
+            rows = rows[:limit]
+            headers[NEXT_CURSOR_HEADER] = encode_cursor(*sort_key(rows[-1]))
+        return dumps([_room_dict(row) for row in rows]), headers
+
+    # Served from the catalog cache; the body and its cursor header are
+    # cached together and revalidated with ETag / If-None-Match
+    return await catalog_cache.respond(request, "rooms:list", produce)
+
+@router.get("/available", response_model=List[schemas.RoomOut])
+async def available_rooms(
+    response: Response,
+    check_in: date,
+    check_out: date,
+    capacity: int = Query(1, ge=1),
+    amenities: Optional[str] = Query(None, description="Comma separated amenity names, all required"),
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+    db: AsyncSession = Depends(get_db),
+):
+    if check_in >= check_out:
+        raise HTTPException(status_code=400, detail="Check-out date must be after check-in date")
+
+    # Anti-join: a room is free when it has no occupied night in the window.
+    # Point lookups on the (room, night) unique index of the room-night table
+    # instead of a range-overlap scan over bookings; create_booking still
+    # checks bookings themselves under the room lock.
+    overlapping = select(models.RoomNight.id).where(
+        models.RoomNight.room_id == models.Room.id,
+        models.RoomNight.night >= check_in,
+        models.RoomNight.night < check_out,
+    )
+
+    stmt = (
+        select(models.Room)
+        .join(models.Room.room_type)
+        .options(contains_eager(models.Room.room_type))
+        .where(models.RoomType.capacity >= capacity, ~exists(overlapping))
+    )
+
+    names = sorted({name.strip() for name in (amenities or "").split(",") if name.strip()})
+    if names:
+        # Room types that have *all* requested amenities
+        with_amenities = (
+            select(models.room_type_amenities.c.roomtype_id)
+            .join(models.Amenity, models.Amenity.id == models.room_type_amenities.c.amenity_id)
+            .where(models.Amenity.name.in_(names))
+            .group_by(models.room_type_amenities.c.roomtype_id)
+            .having(func.count(models.Amenity.id.distinct()) == len(names))
+        )
+        stmt = stmt.where(models.RoomType.id.in_(with_amenities))
+
+    if cursor:
+        (after_id,) = decode_cursor(cursor, 1)
+        if not isinstance(after_id, int):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        stmt = stmt.where(models.Room.id > after_id)
+
+    # Fetch one extra row to know whether there is a next page
+    result = await db.execute(stmt.order_by(models.Room.id).limit(limit + 1))
+    rooms = result.scalars().all()
+    if len(rooms) > limit:
+        rooms = rooms[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(rooms[-1].id)
     return rooms
 
+@router.get("/quote", response_model=List[schemas.RoomTypeQuote])
+async def quote_room_types(check_in: date, check_out: date, db: AsyncSession = Depends(get_db)):
+    """Price of the stay for every room type, from the seasonal rate calendar."""
+    if check_in >= check_out:
+        raise HTTPException(status_code=400, detail="Check-out date must be after check-in date")
+    totals = await quote_stays(db, check_in, check_out)
+    room_types = (await db.execute(select(models.RoomType).order_by(models.RoomType.id))).scalars().all()
+    nights = (check_out - check_in).days
+    return [
+        schemas.RoomTypeQuote(room_type_id=rt.id, name=rt.name, nights=nights, total=totals[rt.id])
+        for rt in room_types if rt.id in totals
+    ]
+
+@router.get("/{room_id}/calendar", response_model=schemas.RoomCalendarOut)
+async def room_calendar(
+    room_id: int,
+    month: Optional[str] = Query(None, pattern=r"^\d{4}-(0[1-9]|1[0-2])$", description="YYYY-MM, default this month"),
+    db: AsyncSession = Depends(get_db),
+):
+    """Booked / free nights of one room for a month, from the Redis bitmap."""
+    if month:
+        year, month_number = (int(part) for part in month.split("-"))
+    else:
+        today = date.today()
+        year, month_number = today.year, today.month
+    booked = await month_calendar(db, room_id, year, month_number)
+    if booked is None:
+        raise HTTPException(status_code=404, detail="Room not found")
+    return schemas.RoomCalendarOut(
+        room_id=room_id,
+        month=f"{year:04d}-{month_number:02d}",
+        nights=[
+            schemas.CalendarNight(night=date(year, month_number, day), booked=flag)
+            for day, flag in enumerate(booked, start=1)
+        ],
+    )
+
 @router.get("/{room_id}", response_model=schemas.RoomOut)
-def get_room(room_id: int, db: Session = Depends(get_db)):
-    return db.query(models.Room).filter(models.Room.id == room_id).first()
+async def get_room(room_id: int, request: Request, db: AsyncSession = Depends(get_db)):
+    async def produce():
+        result = await db.execute(_rooms_with_type().where(models.Room.id == room_id))
+        room = result.scalar_one_or_none()
+        if not room:
+            raise HTTPException(status_code=404, detail="Room not found")
+        return schemas.RoomOut.model_validate(room).model_dump_json().encode(), {}
+
+    return await catalog_cache.respond(request, f"rooms:{room_id}", produce)
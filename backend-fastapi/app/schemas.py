@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional, List
+from pydantic import BaseModel, Field
+from typing import Optional, List, Literal
 from decimal import Decimal
 from datetime import date
 
@@ -9,6 +9,7 @@ class RoomTypeBase(BaseModel):
 
 class RoomTypeOut(RoomTypeBase):
     id: int
+    capacity: int
     class Config:
         from_attributes = True
 
@@ -22,6 +23,12 @@ class RoomOut(RoomBase):
     class Config:
         from_attributes = True
 
+class RoomTypeQuote(BaseModel):
+    room_type_id: int
+    name: str
+    nights: int
+    total: Decimal
+
 class BookingBase(BaseModel):
     room_id: int
     check_in: date
@@ -38,3 +45,54 @@ class BookingOut(BookingBase):
 
     class Config:
         from_attributes = True
+
+class BookingBatchCreate(BaseModel):
+    items: List[BookingCreate] = Field(..., min_length=1, max_length=500)
+    # all_or_nothing: any bad item rejects the whole batch
+    # partial: book what fits, report the rest per item
+    mode: Literal["all_or_nothing", "partial"] = "all_or_nothing"
+
+class BookingBatchItemResult(BaseModel):
+    index: int
+    status: Literal["created", "conflict", "invalid", "not_found"]
+    detail: Optional[str] = None
+    booking: Optional[BookingOut] = None
+
+class BookingBatchOut(BaseModel):
+    created: int
+    results: List[BookingBatchItemResult]
+
+class TaskStatusOut(BaseModel):
+    task_id: str
+    state: str
+    ready: bool
+    result: Optional[str] = None
+
+class CalendarNight(BaseModel):
+    night: date
+    booked: bool
+
+class RoomCalendarOut(BaseModel):
+    room_id: int
+    month: str
+    nights: List[CalendarNight]
+
+class ReportMetrics(BaseModel):
+    room_nights_sold: int
+    room_nights_available: int
+    revenue: float
+    occupancy: float
+    adr: float
+    revpar: float
+
+class ReportBreakdownRow(ReportMetrics):
+    key: str
+
+class OccupancyReportOut(BaseModel):
+    start: date
+    end: date
+    group_by: str
+    rooms: int
+    nights: int
+    totals: ReportMetrics
+    breakdown: List[ReportBreakdownRow]
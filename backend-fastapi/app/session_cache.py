@@ -0,0 +1,143 @@
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+
+from redis.exceptions import RedisError
+
+from .redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Two tiers: a bounded in-process LRU with a short TTL in front of Redis.
+# Keys and channel must match users/session_cache.py in Django, which
+# deletes/publishes on logout, session deletion and user changes.
+SESSION_CACHE_TTL = float(os.getenv("SESSION_CACHE_TTL", "30"))
+SESSION_CACHE_MAX_ENTRIES = int(os.getenv("SESSION_CACHE_MAX_ENTRIES", "10000"))
+SESSION_CACHE_REDIS_TTL = int(os.getenv("SESSION_CACHE_REDIS_TTL", "300"))
+SESSION_CACHE_USE_REDIS = os.getenv("SESSION_CACHE_USE_REDIS", "true").lower() in ("1", "true", "yes")
+
+KEY_PREFIX = "session-user:"
+USER_INDEX_PREFIX = "session-user:by-user:"
+INVALIDATION_CHANNEL = "session-invalidate"
+
+class CachedUser(NamedTuple):
+    user_id: int
+    username: str
+    role: str
+    expires_at: float  # session expiry, epoch seconds
+
+class SessionUserCache:
+    def __init__(self, max_entries: int, ttl: float, use_redis: bool):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.use_redis = use_redis
+        self._entries = OrderedDict()  # session_key -> (CachedUser, deadline)
+        self.hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+
+    def _get_local(self, session_key: str) -> Optional[CachedUser]:
+        entry = self._entries.get(session_key)
+        if entry is None:
+            return None
+        user, deadline = entry
+        if deadline <= time.time():
+            del self._entries[session_key]
+            return None
+        self._entries.move_to_end(session_key)
+        return user
+
+    def _set_local(self, session_key: str, user: CachedUser):
+        # Never serve an entry past the session's own expiry
+        self._entries[session_key] = (user, min(time.time() + self.ttl, user.expires_at))
+        self._entries.move_to_end(session_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get(self, session_key: str) -> Optional[CachedUser]:
+        user = self._get_local(session_key)
+        if user is not None:
+            self.hits += 1
+            return user
+
+        if self.use_redis:
+            try:
+                raw = await get_redis().get(KEY_PREFIX + session_key)
+            except RedisError as e:
+                logger.warning("Session cache read failed: %s", e)
+                raw = None
+            if raw:
+                user = CachedUser(**json.loads(raw))
+                if user.expires_at > time.time():
+                    self.redis_hits += 1
+                    self._set_local(session_key, user)
+                    return user
+
+        self.misses += 1
+        return None
+
+    async def set(self, session_key: str, user: CachedUser):
+        self._set_local(session_key, user)
+        if not self.use_redis:
+            return
+        ttl = int(min(SESSION_CACHE_REDIS_TTL, user.expires_at - time.time()))
+        if ttl <= 0:
+            return
+        try:
+            # Per-user index lets Django drop every cached session of a user
+            # whose role or active flag changed
+            index_key = f"{USER_INDEX_PREFIX}{user.user_id}"
+            async with get_redis().pipeline(transaction=False) as pipe:
+                pipe.set(KEY_PREFIX + session_key, json.dumps(user._asdict()), ex=ttl)
+                pipe.sadd(index_key, session_key)
+                pipe.expire(index_key, SESSION_CACHE_REDIS_TTL)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning("Session cache write failed: %s", e)
+
+    def invalidate_session(self, session_key: str):
+        self._entries.pop(session_key, None)
+
+    def invalidate_user(self, user_id: int):
+        stale = [key for key, (user, _) in self._entries.items() if user.user_id == user_id]
+        for key in stale:
+            del self._entries[key]
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.redis_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_ratio": (self.hits + self.redis_hits) / lookups if lookups else 0.0,
+        }
+
+    async def listen_for_invalidations(self):
+        # Django publishes "session:<key>" / "user:<id>" on logout, session
+        # deletion and user updates; drop matching in-process entries.
+        while True:
+            try:
+                async with get_redis().pubsub() as pubsub:
+                    await pubsub.subscribe(INVALIDATION_CHANNEL)
+                    async for message in pubsub.listen():
+                        if message["type"] != "message":
+                            continue
+                        kind, _, value = message["data"].partition(":")
+                        if kind == "session":
+                            self.invalidate_session(value)
+                        elif kind == "user" and value.isdigit():
+                            self.invalidate_user(int(value))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Missed messages are bounded by SESSION_CACHE_TTL; reconnect
+                logger.warning("Session invalidation listener error: %s", e)
+                self._entries.clear()
+                await asyncio.sleep(1)
+
+session_cache = SessionUserCache(SESSION_CACHE_MAX_ENTRIES, SESSION_CACHE_TTL, SESSION_CACHE_USE_REDIS)
@@ -0,0 +1,32 @@
+import os
+from jose import jwt, JWTError
+
+# Mirrors the API_TOKEN_* settings in Django (core/settings.py), which mints
+# the tokens. Keys are "kid=secret" pairs; any listed key verifies.
+def _parse_keys(raw: str) -> dict:
+    keys = {}
+    for pair in raw.split(","):
+        kid, sep, secret = pair.strip().partition("=")
+        if sep and kid and secret:
+            keys[kid] = secret
+    return keys
+
+API_TOKEN_KEYS = _parse_keys(os.getenv("API_TOKEN_KEYS", "")) or {
+    "default": os.getenv("DJANGO_SECRET_KEY") or "django-insecure-local-dev-key"
+}
+API_TOKEN_ALGORITHM = "HS256"
+API_TOKEN_ISSUER = "hotel-management"
+
+def verify_access_token(token: str) -> dict:
+    """Verify signature, expiry, issuer and type purely in-process.
+
+    Raises JWTError on any failure.
+    """
+    kid = jwt.get_unverified_header(token).get("kid")
+    key = API_TOKEN_KEYS.get(kid)
+    if key is None:
+        raise JWTError("Unknown signing key")
+    claims = jwt.decode(token, key, algorithms=[API_TOKEN_ALGORITHM], issuer=API_TOKEN_ISSUER)
+    if claims.get("typ") != "access":
+        raise JWTError("Wrong token type")
+    return claims
@@ -0,0 +1,23 @@
+from app.auth import get_user_from_session
+from app.database import SessionLocal
+from app.session_cache import session_cache
+
+def bench_get_user_from_session(measure, data):
+    # The DB path behind a session-cache miss
+    async def call():
+        async with SessionLocal() as db:
+            assert await get_user_from_session(data.session_key, db) == str(data.guest_id)
+    measure(call)
+
+def bench_session_cookie_request_cold_cache(measure, client, data):
+    # Full request after an in-process session cache miss (falls through
+    # to Redis if configured, else to the DB)
+    cookie = {"Cookie": f"sessionid={data.session_key}"}
+
+    def cold():
+        session_cache.invalidate_session(data.session_key)
+
+    async def call():
+        response = await client.get("/bookings/me", headers=cookie)
+        assert response.status_code == 200, response.text
+    measure(call, setup=cold)
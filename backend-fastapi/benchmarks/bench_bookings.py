@@ -0,0 +1,29 @@
+import itertools
+from datetime import timedelta
+
+from .dataset import BENCH_WINDOW_START
+
+def bench_create_booking(measure, client, data):
+    # Every call books a different free slot in the far-future window
+    slots = itertools.count()
+    cookie = {"Cookie": f"sessionid={data.session_key}"}
+
+    async def call():
+        slot = next(slots)
+        room_id = data.room_ids[slot % len(data.room_ids)]
+        check_in = BENCH_WINDOW_START + timedelta(days=3 * (slot // len(data.room_ids)))
+        response = await client.post("/bookings/", headers=cookie, json={
+            "room_id": room_id,
+            "check_in": check_in.isoformat(),
+            "check_out": (check_in + timedelta(days=2)).isoformat(),
+        })
+        assert response.status_code == 200, response.text
+    measure(call, rounds=300)
+
+def bench_my_bookings(measure, client, data):
+    cookie = {"Cookie": f"sessionid={data.session_key}"}
+
+    async def call():
+        response = await client.get("/bookings/me", headers=cookie)
+        assert response.status_code == 200, response.text
+    measure(call)
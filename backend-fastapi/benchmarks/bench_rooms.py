@@ -0,0 +1,52 @@
+import itertools
+from datetime import date, timedelta
+
+from app.response_cache import catalog_cache
+
+_versions = itertools.count()
+
+def _cold_catalog():
+    # Fresh catalog version: misses both cache tiers, like the first
+    # request after a Django change
+    catalog_cache._set_version(f"bench-{next(_versions)}")
+
+def _expect(response, status=200):
+    assert response.status_code == status, response.text
+    return response
+
+def bench_list_rooms_uncached(measure, client):
+    async def call():
+        _expect(await client.get("/rooms/", params={"limit": 100}))
+    measure(call, setup=_cold_catalog)
+
+def bench_list_rooms_cached(measure, client):
+    async def call():
+        _expect(await client.get("/rooms/", params={"limit": 100}))
+    measure(call)
+
+def bench_list_rooms_not_modified(measure, client, loop):
+    etag = loop.run_until_complete(client.get("/rooms/", params={"limit": 100})).headers["ETag"]
+    async def call():
+        _expect(await client.get("/rooms/", params={"limit": 100}, headers={"If-None-Match": etag}), 304)
+    measure(call)
+
+def bench_get_room_uncached(measure, client, data):
+    async def call():
+        _expect(await client.get(f"/rooms/{data.room_ids[len(data.room_ids) // 2]}"))
+    measure(call, setup=_cold_catalog)
+
+def bench_available_rooms(measure, client):
+    check_in = date.today() + timedelta(days=30)
+    async def call():
+        _expect(await client.get("/rooms/available", params={
+            "check_in": check_in.isoformat(), "check_out": (check_in + timedelta(days=3)).isoformat(), "limit": 50,
+        }))
+    measure(call)
+
+def bench_quote_room_types(measure, client):
+    check_in = date.today() + timedelta(days=30)
+    async def call():
+        _expect(await client.get("/rooms/quote", params={
+            "check_in": check_in.isoformat(), "check_out": (check_in + timedelta(days=7)).isoformat(),
+        }))
+    measure(call)
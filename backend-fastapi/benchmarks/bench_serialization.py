@@ -0,0 +1,86 @@
+"""Rows/sec of GET /bookings/me on a 10k-row response: the ORM + response
+model pipeline it used to run against the column-select + orjson fast path.
+Both run in-process against the same data, without HTTP, so only the query and
+serialization differ; rows_per_sec lands in the benchmark's extra_info.
+"""
+import json
+from datetime import timedelta
+from decimal import Decimal
+from typing import List
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from sqlalchemy import delete, insert, select
+
+from app import models, schemas
+from app.database import SessionLocal
+from app.routers.bookings import my_bookings
+from .dataset import BENCH_WINDOW_START
+
+ROWS = 10_000
+# Past the window bench_create_booking books into
+WINDOW_START = BENCH_WINDOW_START + timedelta(days=3650)
+
+_booking_list = TypeAdapter(List[schemas.BookingOut])
+
+@pytest.fixture(scope="module")
+def many_bookings(loop, data):
+    rooms = len(data.room_ids)
+    rows = [
+        {"guest_id": data.guest_id, "room_id": data.room_ids[i % rooms],
+         "check_in": WINDOW_START + timedelta(days=2 * (i // rooms)),
+         "check_out": WINDOW_START + timedelta(days=2 * (i // rooms) + 1),
+         "status": "reserved", "total_price": Decimal("100.00")}
+        for i in range(ROWS)
+    ]
+
+    async def setup():
+        async with SessionLocal() as db:
+            await db.execute(insert(models.Booking), rows)
+            await db.commit()
+
+    async def teardown():
+        async with SessionLocal() as db:
+            await db.execute(delete(models.Booking).where(models.Booking.check_in >= WINDOW_START))
+            await db.commit()
+
+    loop.run_until_complete(setup())
+    yield
+    loop.run_until_complete(teardown())
+
+def _rows_per_sec(benchmark, rows):
+    if benchmark.stats:  # None under --benchmark-disable
+        benchmark.extra_info["rows_per_sec"] = round(rows / benchmark.stats.stats.median)
+
+def _expected_rows(loop, guest_id):
+    async def count():
+        async with SessionLocal() as db:
+            result = await db.execute(select(models.Booking.id).where(models.Booking.guest_id == guest_id))
+            return len(result.all())
+    return loop.run_until_complete(count())
+
+def bench_my_bookings_10k_orm(measure, benchmark, loop, data, many_bookings):
+    # What FastAPI did with response_model: ORM objects, validation into
+    # BookingOut, jsonable_encoder, then json.dumps in JSONResponse
+    expected = _expected_rows(loop, data.guest_id)
+
+    async def call():
+        async with SessionLocal() as db:
+            result = await db.execute(select(models.Booking).where(models.Booking.guest_id == data.guest_id))
+            bookings = _booking_list.validate_python(result.scalars().all(), from_attributes=True)
+            body = json.dumps(jsonable_encoder(bookings), separators=(",", ":")).encode()
+        assert body.count(b'"id"') == expected
+    measure(call, rounds=20)
+    _rows_per_sec(benchmark, expected)
+
+def bench_my_bookings_10k_fast(measure, benchmark, loop, data, many_bookings):
+    expected = _expected_rows(loop, data.guest_id)
+    user = models.User(id=data.guest_id, username="bench", role="guest")
+
+    async def call():
+        async with SessionLocal() as db:
+            body = (await my_bookings(db=db, current_user=user)).body
+        assert body.count(b'"id"') == expected
+    measure(call, rounds=20)
+    _rows_per_sec(benchmark, expected)
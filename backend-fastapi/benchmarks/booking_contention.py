@@ -0,0 +1,112 @@
+"""Booking throughput on a single hot room under concurrent writers.
+
+Runs the same write path as POST /bookings/ (advisory lock, overlap check,
+insert, commit) against the configured DATABASE_URL with N concurrent
+writers all targeting one room, and reports bookings/sec.
+
+    python -m benchmarks.booking_contention --writers 32 --attempts 50 --room-id 1 --guest-id 1
+
+Modes:
+  lock        advisory lock + overlap check (what the router does)
+  constraint  no lock, rely on the exclusion constraint and translate 23P01
+Bookings are placed in a far-future window and removed afterwards.
+"""
+import argparse
+import asyncio
+import random
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
+
+from app import models
+from app.database import SessionLocal, engine
+from app.locking import lock_room, is_exclusion_violation
+
+WINDOW_START = date(2099, 1, 1)
+WINDOW_DAYS = 365
+
+async def attempt(mode, room_id, guest_id, check_in, check_out):
+    async with SessionLocal() as db:
+        if mode == "lock":
+            await lock_room(db, room_id)
+        overlapping = (await db.execute(
+            select(models.Booking.id).where(
+                models.Booking.room_id == room_id,
+                models.Booking.check_in < check_out,
+                models.Booking.check_out > check_in,
+                models.Booking.status.notin_(models.INACTIVE_BOOKING_STATUSES),
+            ).limit(1)
+        )).scalar_one_or_none()
+        if overlapping:
+            return "conflict"
+        db.add(models.Booking(
+            guest_id=guest_id, room_id=room_id, check_in=check_in,
+            check_out=check_out, status="reserved", total_price=Decimal("1.00"),
+        ))
+        try:
+            await db.commit()
+        except IntegrityError as exc:
+            await db.rollback()
+            if is_exclusion_violation(exc):
+                return "conflict"
+            raise
+        return "booked"
+
+async def writer(mode, room_id, guest_id, attempts, rng, counts):
+    for _ in range(attempts):
+        check_in = WINDOW_START + timedelta(days=rng.randrange(WINDOW_DAYS))
+        check_out = check_in + timedelta(days=rng.randint(1, 3))
+        try:
+            outcome = await attempt(mode, room_id, guest_id, check_in, check_out)
+        except Exception:
+            outcome = "error"
+        counts[outcome] = counts.get(outcome, 0) + 1
+
+async def cleanup(room_id):
+    async with SessionLocal() as db:
+        await db.execute(delete(models.Booking).where(
+            models.Booking.room_id == room_id,
+            models.Booking.check_in >= WINDOW_START,
+        ))
+        await db.commit()
+
+async def run(mode, args):
+    await cleanup(args.room_id)
+    rng = random.Random(args.seed)
+    counts = {}
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        writer(mode, args.room_id, args.guest_id, args.attempts, random.Random(rng.random()), counts)
+        for _ in range(args.writers)
+    ))
+    elapsed = time.perf_counter() - started
+    await cleanup(args.room_id)
+
+    total = sum(counts.values())
+    print(
+        f"{mode:>10}: writers={args.writers} attempts={total} "
+        f"booked={counts.get('booked', 0)} conflicts={counts.get('conflict', 0)} "
+        f"errors={counts.get('error', 0)} elapsed={elapsed:.2f}s "
+        f"attempts/s={total / elapsed:.0f} bookings/s={counts.get('booked', 0) / elapsed:.0f}"
+    )
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--writers", type=int, default=32)
+    parser.add_argument("--attempts", type=int, default=50, help="attempts per writer")
+    parser.add_argument("--room-id", type=int, required=True)
+    parser.add_argument("--guest-id", type=int, required=True)
+    parser.add_argument("--mode", choices=["lock", "constraint", "both"], default="both")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    modes = ["lock", "constraint"] if args.mode == "both" else [args.mode]
+    for mode in modes:
+        await run(mode, args)
+    await engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,115 @@
+"""Fixtures for the endpoint micro-benchmarks (bench_*.py).
+
+    cd backend-fastapi
+    BENCH_DATABASE_URL=postgres://... python -m pytest -c benchmarks/pytest.ini benchmarks
+
+Without BENCH_DATABASE_URL the suite runs against a throwaway SQLite file
+(needs aiosqlite). Timing baselines are pytest-benchmark's own JSON
+(--benchmark-save / --benchmark-compare-fail); DB query counts per call
+are checked against benchmarks/query_baseline.json, see QueryBaseline.
+"""
+import asyncio
+import json
+import os
+from pathlib import Path
+
+# Must be configured before the app (and its engine) is imported
+os.environ["DATABASE_URL"] = os.getenv("BENCH_DATABASE_URL", "sqlite+aiosqlite:///./bench.sqlite3")
+os.environ.setdefault("REDIS_URL", os.getenv("BENCH_REDIS_URL", "redis://localhost:6379/15"))
+
+import httpx
+import pytest
+from sqlalchemy import event
+
+from app.database import engine
+from app.main import app
+from . import dataset
+
+QUERY_BASELINE_PATH = Path(__file__).with_name("query_baseline.json")
+
+def pytest_addoption(parser):
+    parser.addoption("--update-query-baseline", action="store_true",
+                     help="Record the DB query count of every benchmark as the new baseline")
+
+class QueryBaseline:
+    """Queries per call, per database dialect, stored as JSON.
+
+    Query counts are deterministic, so any increase over the baseline
+    fails the benchmark (typically an N+1 or a lost eager load).
+    """
+
+    def __init__(self, path: Path, dialect: str, update: bool):
+        self.path = path
+        self.dialect = dialect
+        self.update = update
+        self.data = json.loads(path.read_text()) if path.exists() else {}
+        self.recorded = {}
+
+    def check(self, name: str, queries: int):
+        self.recorded[name] = queries
+        expected = self.data.get(self.dialect, {}).get(name)
+        if not self.update and expected is not None and queries > expected:
+            pytest.fail(f"{name}: {queries} queries per call, baseline is {expected}")
+
+    def save(self):
+        if self.update and self.recorded:
+            self.data.setdefault(self.dialect, {}).update(self.recorded)
+            self.path.write_text(json.dumps(self.data, indent=2, sort_keys=True) + "\n")
+
+@pytest.fixture(scope="session")
+def loop():
+    # One loop for the whole session: the engine's pooled connections are
+    # bound to the loop they were opened on
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+@pytest.fixture(scope="session")
+def data(loop):
+    ds = loop.run_until_complete(dataset.prepare())
+    yield ds
+    loop.run_until_complete(dataset.teardown(ds))
+
+@pytest.fixture(scope="session")
+def client(loop, data):
+    # In-process ASGI calls: measures the app, not the network stack
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench")
+    yield client
+    loop.run_until_complete(client.aclose())
+
+@pytest.fixture(scope="session")
+def query_baseline(request, data):
+    baseline = QueryBaseline(QUERY_BASELINE_PATH, data.dialect, request.config.getoption("--update-query-baseline"))
+    yield baseline
+    baseline.save()
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+@pytest.fixture
+def measure(benchmark, loop, request, query_baseline):
+    """Benchmark an async callable and check its queries per call.
+
+    `setup` (sync) runs before every round, outside the timing.
+    """
+    def run(call, setup=None, rounds=200):
+        counter = QueryCounter()
+        if setup:
+            setup()
+        event.listen(engine.sync_engine, "before_cursor_execute", counter)
+        try:
+            loop.run_until_complete(call())
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", counter)
+        benchmark.extra_info["queries"] = counter.count
+        query_baseline.check(request.node.name, counter.count)
+
+        return benchmark.pedantic(
+            lambda: loop.run_until_complete(call()),
+            setup=setup, rounds=rounds, warmup_rounds=5,
+        )
+    return run
@@ -0,0 +1,125 @@
+"""Data the benchmark suite runs against.
+
+Postgres (BENCH_DATABASE_URL): a database migrated by Django and filled by
+`manage.py seed_data` (e.g. `make seed-large`); only a session row for the
+benchmark user is added. SQLite fallback: the mirrored tables are created
+from app.models and filled with a small synthetic dataset here.
+
+Benchmark bookings are written to a far-future window and removed again.
+"""
+import base64
+import json
+import random
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import List
+
+from sqlalchemy import delete, func, insert, select
+
+from app import models
+from app.database import Base, engine, SessionLocal
+
+BENCH_WINDOW_START = date(2099, 1, 1)
+
+@dataclass
+class Dataset:
+    dialect: str
+    room_ids: List[int]
+    guest_id: int
+    session_key: str
+    rooms: int
+    bookings: int
+
+def session_data(user_id: int) -> str:
+    # Same "hash:base64(json)" shape app.auth.load_session decodes
+    payload = base64.b64encode(json.dumps({"_auth_user_id": str(user_id)}).encode()).decode()
+    return f"bench:{payload}"
+
+async def _seed_sqlite(rooms: int = 200, guests: int = 50, days: int = 365, seed: int = 42):
+    rng = random.Random(seed)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    today = date.today()
+    async with SessionLocal() as db:
+        await db.execute(insert(models.User), [
+            {"id": i, "username": f"guest{i}", "role": "guest"} for i in range(1, guests + 1)
+        ])
+        await db.execute(insert(models.RoomType), [
+            {"id": 1, "name": "Standard User", "base_rate": Decimal("100.00"), "capacity": 2},
+            {"id": 2, "name": "Deluxe Suite", "base_rate": Decimal("250.00"), "capacity": 4},
+            {"id": 3, "name": "Penthouse", "base_rate": Decimal("500.00"), "capacity": 6},
+        ])
+        await db.execute(insert(models.NightlyRate), [
+            {"room_type_id": rt, "night": today + timedelta(days=d), "rate": base}
+            for rt, base in ((1, Decimal("100.00")), (2, Decimal("250.00")), (3, Decimal("500.00")))
+            for d in range(days * 2)
+        ])
+        await db.execute(insert(models.Room), [
+            {"id": i, "room_number": str((i - 1) // 50 * 100 + 101 + (i - 1) % 50), "floor": (i - 1) // 50 + 1,
+             "room_type_id": rng.randint(1, 3), "status": "available"}
+            for i in range(1, rooms + 1)
+        ])
+        booking_rows, night_rows = [], []
+        booking_id = 0
+        for room_id in range(1, rooms + 1):
+            night = today
+            while True:
+                night += timedelta(days=rng.randint(0, 3))
+                check_out = night + timedelta(days=rng.randint(1, 5))
+                if check_out > today + timedelta(days=days):
+                    break
+                booking_id += 1
+                booking_rows.append({
+                    "id": booking_id, "guest_id": rng.randint(1, guests), "room_id": room_id,
+                    "check_in": night, "check_out": check_out, "status": "reserved",
+                    "total_price": Decimal("100.00") * (check_out - night).days,
+                })
+                night_rows.extend(
+                    {"room_id": room_id, "night": night + timedelta(days=d), "booking_id": booking_id,
+                     "status": "reserved", "nightly_rate": Decimal("100.00")}
+                    for d in range((check_out - night).days)
+                )
+                night = check_out
+        await db.execute(insert(models.Booking), booking_rows)
+        await db.execute(insert(models.RoomNight), night_rows)
+        await db.commit()
+
+async def prepare() -> Dataset:
+    dialect = engine.dialect.name
+    if dialect == "sqlite":
+        await _seed_sqlite()
+
+    async with SessionLocal() as db:
+        await cleanup_bench_bookings(db)
+        room_ids = (await db.execute(select(models.Room.id).order_by(models.Room.id))).scalars().all()
+        guest_id = (await db.execute(
+            select(models.User.id).where(models.User.role == "guest").order_by(models.User.id).limit(1)
+        )).scalar_one_or_none()
+        if not room_ids or guest_id is None:
+            raise RuntimeError("Benchmark database is empty; run `manage.py seed_data` first")
+        bookings = (await db.execute(select(func.count()).select_from(models.Booking))).scalar_one()
+
+        session_key = f"bench{uuid.uuid4().hex}"
+        db.add(models.DjangoSession(
+            session_key=session_key, session_data=session_data(guest_id),
+            expire_date=datetime.now() + timedelta(days=1),
+        ))
+        await db.commit()
+    return Dataset(dialect, list(room_ids), guest_id, session_key, len(room_ids), bookings)
+
+async def cleanup_bench_bookings(db):
+    bench_bookings = select(models.Booking.id).where(models.Booking.check_in >= BENCH_WINDOW_START)
+    await db.execute(delete(models.RoomNight).where(models.RoomNight.booking_id.in_(bench_bookings)))
+    await db.execute(delete(models.Booking).where(models.Booking.check_in >= BENCH_WINDOW_START))
+    await db.commit()
+
+async def teardown(dataset: Dataset):
+    async with SessionLocal() as db:
+        await cleanup_bench_bookings(db)
+        await db.execute(delete(models.DjangoSession).where(models.DjangoSession.session_key == dataset.session_key))
+        await db.commit()
+    await engine.dispose()
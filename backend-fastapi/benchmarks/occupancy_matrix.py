@@ -0,0 +1,116 @@
+"""Occupancy / revenue matrix build time for a synthetic property.
+
+Generates back-to-back stays for every room (default 1,000 rooms x 365
+nights, ~75% occupancy) and times both matrix builders: from room-night
+rows (matrices_from_room_nights, what GET /reports/occupancy uses) and,
+as the baseline it replaced, from booking ranges (build_matrices below),
+then summarize for each group_by. Pure NumPy, no database needed.
+
+    python -m benchmarks.occupancy_matrix --rooms 1000 --nights 365 --repeat 20
+"""
+import argparse
+import time
+from datetime import date
+
+import numpy as np
+
+from app.reports import matrices_from_room_nights, summarize
+
+def build_matrices(
+    room_rows: np.ndarray,
+    start_offsets: np.ndarray,
+    end_offsets: np.ndarray,
+    nightly_rates: np.ndarray,
+    n_rooms: int,
+    n_nights: int,
+):
+    """Occupancy and revenue matrices from per-booking arrays.
+
+    Each booking adds +1 / -1 (or +rate / -rate) at its first and
+    past-the-end night in a difference matrix; a cumulative sum along the
+    night axis expands those into the full matrices.
+
+    Offsets are nights relative to the window start and are clipped to it,
+    so stays that straddle the window edges count only their inner nights.
+    """
+    lo = np.clip(start_offsets, 0, n_nights)
+    hi = np.clip(end_offsets, 0, n_nights)
+    keep = lo < hi
+    rows, lo, hi, rates = room_rows[keep], lo[keep], hi[keep], nightly_rates[keep]
+
+    occ_diff = np.zeros((n_rooms, n_nights + 1), dtype=np.int32)
+    np.add.at(occ_diff, (rows, lo), 1)
+    np.add.at(occ_diff, (rows, hi), -1)
+    occupied = np.cumsum(occ_diff[:, :n_nights], axis=1) > 0
+
+    rev_diff = np.zeros((n_rooms, n_nights + 1), dtype=np.float64)
+    np.add.at(rev_diff, (rows, lo), rates)
+    np.add.at(rev_diff, (rows, hi), -rates)
+    revenue = np.cumsum(rev_diff[:, :n_nights], axis=1)
+    # Cancel float drift on empty nights
+    revenue[~occupied] = 0.0
+    return occupied, revenue
+
+def synthetic_bookings(rooms, nights, occupancy, seed):
+    rng = np.random.default_rng(seed)
+    rows, starts, ends = [], [], []
+    for room in range(rooms):
+        night = int(rng.integers(0, 3))
+        while night < nights:
+            stay = int(rng.integers(1, 8))
+            if rng.random() < occupancy:
+                rows.append(room)
+                starts.append(night)
+                ends.append(night + stay)
+            night += stay
+    rates = rng.uniform(80, 400, size=len(rows)).round(2)
+    return np.array(rows), np.array(starts), np.array(ends), rates
+
+def room_night_rows(rows, starts, ends, rates):
+    # One (room, night offset, rate) row per booked night, like bookings_roomnight
+    lengths = ends - starts
+    night_rows = np.repeat(rows, lengths)
+    first = np.repeat(starts, lengths)
+    within = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    return night_rows, first + within, np.repeat(rates, lengths)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rooms", type=int, default=1000)
+    parser.add_argument("--nights", type=int, default=365)
+    parser.add_argument("--occupancy", type=float, default=0.75)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rows, starts, ends, rates = synthetic_bookings(args.rooms, args.nights, args.occupancy, args.seed)
+    floors = np.arange(args.rooms) // 50 + 1
+    room_types = np.array(["Single", "Double", "Suite", "Family"])[np.arange(args.rooms) % 4]
+    # Room-night rows are clipped to the window, as the endpoint's query is
+    night_rows, night_offsets, night_rates = room_night_rows(rows, starts, ends, rates)
+    inside = night_offsets < args.nights
+    night_rows, night_offsets, night_rates = night_rows[inside], night_offsets[inside], night_rates[inside]
+    print(f"{args.rooms} rooms x {args.nights} nights, {len(rows)} bookings, {len(night_rows)} room-nights")
+
+    timings = {}
+    for _ in range(args.repeat):
+        t = time.perf_counter()
+        build_matrices(rows, starts, ends, rates, args.rooms, args.nights)
+        t0 = time.perf_counter()
+        occupied, revenue = matrices_from_room_nights(night_rows, night_offsets, night_rates, args.rooms, args.nights)
+        t1 = time.perf_counter()
+        totals, _ = summarize(occupied, revenue, date(2026, 1, 1), "day")
+        t2 = time.perf_counter()
+        summarize(occupied, revenue, date(2026, 1, 1), "room_type", room_types)
+        t3 = time.perf_counter()
+        summarize(occupied, revenue, date(2026, 1, 1), "floor", floors)
+        t4 = time.perf_counter()
+        for name, seconds in (("build ranges", t0 - t), ("build nights", t1 - t0), ("by day", t2 - t1), ("by room_type", t3 - t2), ("by floor", t4 - t3)):
+            timings.setdefault(name, []).append(seconds)
+
+    print(f"occupancy={totals['occupancy']:.2%} adr={totals['adr']} revpar={totals['revpar']}")
+    for name, samples in timings.items():
+        print(f"{name:>13}: median {np.median(samples) * 1000:.2f} ms, best {min(samples) * 1000:.2f} ms")
+
+if __name__ == "__main__":
+    main()
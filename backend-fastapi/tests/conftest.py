@@ -0,0 +1,61 @@
+"""API tests without Postgres or Redis.
+
+Routers get a FakeSession (canned results per execute() call, in order)
+instead of get_db, and a detached User instead of get_current_user. The
+app's lifespan (Redis listeners) is not started.
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from app import models
+from app.auth import get_current_user
+from app.database import get_db
+from app.main import app
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = list(rows)
+
+    def all(self):
+        return self.rows
+
+    def first(self):
+        return self.rows[0] if self.rows else None
+
+class FakeSession:
+    def __init__(self, *results):
+        self.results = [FakeResult(rows) for rows in results]
+        self.closed = False
+
+    async def execute(self, statement, *args, **kwargs):
+        return self.results.pop(0)
+
+    async def close(self):
+        self.closed = True
+
+def make_user(role: str, user_id: int = 1) -> models.User:
+    return models.User(id=user_id, username=f"{role}{user_id}", role=role)
+
+@pytest.fixture
+def client():
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+@pytest.fixture
+def login():
+    def as_user(role: str, user_id: int = 1) -> models.User:
+        user = make_user(role, user_id)
+        app.dependency_overrides[get_current_user] = lambda: user
+        return user
+    return as_user
+
+@pytest.fixture
+def db():
+    def with_results(*results) -> FakeSession:
+        session = FakeSession(*results)
+
+        async def get_fake_db():
+            yield session
+        app.dependency_overrides[get_db] = get_fake_db
+        return session
+    return with_results
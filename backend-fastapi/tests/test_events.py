@@ -0,0 +1,33 @@
+import asyncio
+
+from app.events import event_hub
+from app.routers.events import room_events
+from .conftest import FakeSession, make_user
+
+class DisconnectedRequest:
+    async def is_disconnected(self):
+        return True
+
+def test_room_events_stream_starts_with_resync():
+    session = FakeSession()
+
+    async def first_frame():
+        response = await room_events(request=DisconnectedRequest(), db=session, current_user=make_user("manager"))
+        try:
+            return response, await response.body_iterator.__anext__()
+        finally:
+            await response.body_iterator.aclose()
+
+    response, frame = asyncio.run(first_frame())
+    assert response.media_type == "text/event-stream"
+    assert frame.startswith("retry: 3000\n\n")
+    assert 'event: resync\ndata: {"type":"resync"}\n\n' in frame
+    # The pooled DB connection is released before streaming, the hub queue after
+    assert session.closed
+    assert event_hub.clients == 0
+
+def test_room_events_forbidden_for_guest(client, login, db):
+    login("guest")
+    db()
+    response = client.get("/events/rooms")
+    assert response.status_code == 403
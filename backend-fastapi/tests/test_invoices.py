@@ -0,0 +1,29 @@
+import pytest
+
+INVOICE_ROW = ("invoices/INV-12.pdf", "INV-12", 7)  # pdf_file, invoice_number, guest_id
+
+@pytest.mark.parametrize("role, user_id", [("guest", 7), ("receptionist", 99)])
+def test_download_pdf_for_owner_and_staff(client, login, db, role, user_id):
+    login(role, user_id)
+    db([INVOICE_ROW])
+    response = client.get("/invoices/12/pdf")
+    assert response.status_code == 200, response.text
+    assert response.headers["x-accel-redirect"] == "/protected-media/invoices/INV-12.pdf"
+    assert response.headers["content-disposition"] == 'inline; filename="invoice_INV-12.pdf"'
+
+def test_download_pdf_hidden_from_other_guests(client, login, db):
+    login("guest", 8)
+    db([INVOICE_ROW])
+    response = client.get("/invoices/12/pdf")
+    assert response.status_code == 404
+    assert "x-accel-redirect" not in response.headers
+
+def test_task_status_requires_login(client, db):
+    db()
+    response = client.get("/invoices/tasks/some-task-id")
+    assert response.status_code == 401
+
+def test_generate_pdf_requires_login(client, db):
+    db()
+    response = client.post("/invoices/12/generate-pdf")
+    assert response.status_code == 401
@@ -0,0 +1,42 @@
+from collections import namedtuple
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+RoomRow = namedtuple("RoomRow", "id floor name")
+NightRow = namedtuple("NightRow", "room_id night nightly_rate")
+
+PARAMS = {"start": "2026-10-01", "end": "2026-10-03"}
+
+@pytest.mark.parametrize("role", ["superadmin", "manager", "receptionist", "housekeeping"])
+def test_occupancy_report_for_staff(client, login, db, role):
+    login(role)
+    db(
+        [RoomRow(1, 1, "Standard"), RoomRow(2, 1, "Standard")],
+        [NightRow(1, date(2026, 10, 1), Decimal("100.00")), NightRow(1, date(2026, 10, 2), Decimal("120.00"))],
+    )
+    response = client.get("/reports/occupancy", params=PARAMS)
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert (body["rooms"], body["nights"]) == (2, 2)
+    assert body["totals"]["room_nights_sold"] == 2
+    assert body["totals"]["room_nights_available"] == 4
+    assert body["totals"]["revenue"] == 220.0
+    assert [row["key"] for row in body["breakdown"]] == ["2026-10-01", "2026-10-02"]
+
+def test_occupancy_report_forbidden_for_guest(client, login, db):
+    login("guest")
+    db()
+    response = client.get("/reports/occupancy", params=PARAMS)
+    assert response.status_code == 403
+
+def test_occupancy_report_skips_nights_of_unknown_rooms(client, login, db):
+    login("manager")
+    db(
+        [RoomRow(1, 1, "Standard")],
+        [NightRow(1, date(2026, 10, 1), Decimal("100.00")), NightRow(9, date(2026, 10, 1), Decimal("90.00"))],
+    )
+    response = client.get("/reports/occupancy", params=PARAMS)
+    assert response.status_code == 200, response.text
+    assert response.json()["totals"]["room_nights_sold"] == 1
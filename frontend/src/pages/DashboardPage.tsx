@@ -24,12 +24,32 @@ export default function DashboardPage() {
     const [loading, setLoading] = useState(true);
 
     useEffect(() => {
-        axios.get('/api/rooms/')
-            .then(res => {
-                setRooms(res.data);
-                setLoading(false);
-            })
-            .catch(() => setLoading(false));
+        const loadRooms = () =>
+            axios.get('/api/rooms/')
+                .then(res => {
+                    setRooms(res.data);
+                    setLoading(false);
+                })
+                .catch(() => setLoading(false));
+
+        loadRooms();
+
+        // Live room status: reload on "resync" (missed events), otherwise
+        // apply deltas. Staff only; for anyone else the stream just closes.
+        const events = new EventSource('/api/events/rooms');
+        let connected = false;
+        events.addEventListener('resync', () => {
+            // The first resync arrives right after the initial load
+            if (connected) loadRooms();
+            connected = true;
+        });
+        events.addEventListener('room', (e) => {
+            const change = JSON.parse((e as MessageEvent).data);
+            setRooms(current => change.action === 'deleted'
+                ? current.filter(r => r.id !== change.id)
+                : current.map(r => r.id === change.id ? { ...r, status: change.status } : r));
+        });
+        return () => events.close();
     }, []);
 
     const stats = {
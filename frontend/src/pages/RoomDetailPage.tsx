@@ -1,6 +1,6 @@
 import { useState, useEffect } from 'react';
 import { useParams, useNavigate } from 'react-router-dom';
-import { Star, Users, Wifi, Tv, Coffee, Wind, MapPin, Calendar, ArrowLeft } from 'lucide-react';
+import { Star, Users, Wifi, Tv, Coffee, Wind, MapPin, Calendar, ArrowLeft, ChevronLeft, ChevronRight } from 'lucide-react';
 import axios from 'axios';
 
 interface Room {
@@ -14,6 +14,14 @@ interface Room {
     };
 }
 
+interface CalendarNight {
+    night: string;
+    booked: boolean;
+}
+
+const monthKey = (date: Date) =>
+    `${date.getFullYear()}-${String(date.getMonth() + 1).padStart(2, '0')}`;
+
 export default function RoomDetailPage() {
     const { id } = useParams();
     const navigate = useNavigate();
@@ -21,6 +29,8 @@ export default function RoomDetailPage() {
     const [loading, setLoading] = useState(true);
     const [checkIn, setCheckIn] = useState('');
     const [checkOut, setCheckOut] = useState('');
+    const [month, setMonth] = useState(() => new Date(new Date().getFullYear(), new Date().getMonth(), 1));
+    const [nights, setNights] = useState<CalendarNight[]>([]);
 
     useEffect(() => {
         axios.get(`/api/rooms/${id}`)
@@ -34,6 +44,15 @@ export default function RoomDetailPage() {
             });
     }, [id]);
 
+    useEffect(() => {
+        axios.get(`/api/rooms/${id}/calendar`, { params: { month: monthKey(month) } })
+            .then(res => setNights(res.data.nights))
+            .catch(err => console.error(err));
+    }, [id, month]);
+
+    const shiftMonth = (delta: number) =>
+        setMonth(current => new Date(current.getFullYear(), current.getMonth() + delta, 1));
+
     const handleBook = () => {
         if (room && checkIn && checkOut) {
             navigate(`/booking?roomId=${room.id}&checkIn=${checkIn}&checkOut=${checkOut}`);
@@ -112,6 +131,36 @@ export default function RoomDetailPage() {
                             </p>
                         </div>
 
+                        {/* Availability */}
+                        <div className="card p-6">
+                            <div className="flex items-center justify-between mb-4">
+                                <h2 className="text-xl font-semibold text-gray-900">Availability</h2>
+                                <div className="flex items-center gap-2">
+                                    <button onClick={() => shiftMonth(-1)} className="p-1 text-gray-500 hover:text-indigo-600">
+                                        <ChevronLeft className="h-5 w-5" />
+                                    </button>
+                                    <span className="text-sm font-medium text-gray-700 w-24 text-center">
+                                        {month.toLocaleString(undefined, { month: 'long', year: 'numeric' })}
+                                    </span>
+                                    <button onClick={() => shiftMonth(1)} className="p-1 text-gray-500 hover:text-indigo-600">
+                                        <ChevronRight className="h-5 w-5" />
+                                    </button>
+                                </div>
+                            </div>
+                            <div className="grid grid-cols-7 gap-2">
+                                {Array.from({ length: month.getDay() }).map((_, i) => <div key={`pad-${i}`} />)}
+                                {nights.map(({ night, booked }) => (
+                                    <div
+                                        key={night}
+                                        title={booked ? 'Booked' : 'Available'}
+                                        className={`text-center text-sm rounded-lg py-2 ${booked ? 'bg-gray-200 text-gray-400 line-through' : 'bg-green-50 text-green-700'}`}
+                                    >
+                                        {Number(night.slice(8))}
+                                    </div>
+                                ))}
+                            </div>
+                        </div>
+
                         {/* Amenities */}
                         <div className="card p-6">
                             <h2 className="text-xl font-semibold text-gray-900 mb-4">Amenities</h2>
@@ -0,0 +1,7 @@
+"""Open-loop load generator for the full docker-compose stack.
+
+    pip install -r loadtest/requirements.txt
+    python -m loadtest loadtest/scenarios/browse.toml --base-url http://localhost
+
+See loadtest/scenarios/*.toml for the scenario format.
+"""
@@ -0,0 +1,28 @@
+import argparse
+import asyncio
+import sys
+
+from . import scenario as scenarios
+from .runner import Runner
+from .stats import print_report, write_json
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m loadtest", description="Open-loop load test against the running stack")
+    parser.add_argument("scenario", help="Scenario TOML file, e.g. loadtest/scenarios/browse.toml")
+    parser.add_argument("--base-url", default="http://localhost", help="nginx in front of both backends")
+    parser.add_argument("--duration", type=float, default=None, help="Stop after this many seconds (cuts the stages short)")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for a reproducible arrival sequence")
+    parser.add_argument("--json", metavar="PATH", help="Also write the report as JSON")
+    args = parser.parse_args(argv)
+
+    scenario = scenarios.load(args.scenario)
+    runner = Runner(scenario, args.base_url, seed=args.seed, duration=args.duration)
+    print(f"Running {scenario.name!r} against {args.base_url} for {args.duration or scenario.duration:.0f}s")
+    summary = asyncio.run(runner.run())
+    print_report(summary, scenario.name)
+    if args.json:
+        write_json(summary, args.json)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
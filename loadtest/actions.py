@@ -0,0 +1,130 @@
+"""Steps a flow can run. Each step is a table in the scenario file:
+
+    { action = "list_rooms" }                 GET  /api/rooms/
+    { action = "room_detail" }                GET  /api/rooms/{id}
+    { action = "room_calendar" }              GET  /api/rooms/{id}/calendar?month=
+    { action = "available_rooms" }            GET  /api/rooms/available
+    { action = "quote" }                      GET  /api/rooms/quote
+    { action = "create_booking" }             POST /api/bookings/
+    { action = "my_bookings" }                GET  /api/bookings/me
+    { action = "login" }                      GET /auth/csrf/ + POST /auth/login/
+
+Options shared by the room / date steps:
+
+    rooms = 20           pick among the first 20 room ids only (contention)
+    room = "search"      use a room from the last available_rooms result
+    lead_days = [1, 60]  check-in this many days from today (uniform)
+    nights = [1, 5]      stay length (uniform)
+    stay = "search"      reuse the dates of the last search
+
+Every request is recorded under its route template, so /rooms/17 and
+/rooms/42 land in the same row of the report.
+"""
+import time
+from datetime import date, timedelta
+
+import httpx
+
+class FlowAbort(Exception):
+    """A step cannot continue (e.g. login failed); the rest of the flow is skipped."""
+
+class FlowContext:
+    def __init__(self, client: httpx.AsyncClient, rng, stats, room_ids, user):
+        self.client = client
+        self.rng = rng
+        self.stats = stats
+        self.room_ids = room_ids
+        self.user = user  # (username, password)
+        self.logged_in = False
+        self.search_results = []
+        self.stay = None
+
+    async def request(self, route: str, method: str, url: str, **kwargs) -> httpx.Response:
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        except httpx.HTTPError as e:
+            self.stats.record(route, type(e).__name__, time.perf_counter() - started)
+            raise FlowAbort(f"{route}: {type(e).__name__}") from e
+        self.stats.record(route, response.status_code, time.perf_counter() - started)
+        return response
+
+    def pick_room(self, step) -> int:
+        if step.get("room") == "search":
+            if not self.search_results:
+                raise FlowAbort("no search result to pick a room from")
+            return self.rng.choice(self.search_results)
+        pool = self.room_ids[:step["rooms"]] if "rooms" in step else self.room_ids
+        return self.rng.choice(pool)
+
+    def pick_stay(self, step):
+        if step.get("stay") == "search" and self.stay:
+            return self.stay
+        lead_lo, lead_hi = step.get("lead_days", (1, 60))
+        nights_lo, nights_hi = step.get("nights", (1, 5))
+        check_in = date.today() + timedelta(days=self.rng.randint(lead_lo, lead_hi))
+        self.stay = (check_in, check_in + timedelta(days=self.rng.randint(nights_lo, nights_hi)))
+        return self.stay
+
+async def login(ctx: FlowContext, step):
+    if ctx.logged_in:
+        return
+    await ctx.request("GET /auth/csrf/", "GET", "/auth/csrf/")
+    username, password = ctx.user
+    response = await ctx.request(
+        "POST /auth/login/", "POST", "/auth/login/",
+        json={"username": username, "password": password},
+        headers={"X-CSRFToken": ctx.client.cookies.get("csrftoken", "")},
+    )
+    if response.status_code != 200:
+        raise FlowAbort(f"login as {username} failed ({response.status_code})")
+    ctx.logged_in = True
+
+async def list_rooms(ctx, step):
+    params = {"limit": step.get("limit", 100)}
+    await ctx.request("GET /api/rooms/", "GET", "/api/rooms/", params=params)
+
+async def room_detail(ctx, step):
+    await ctx.request("GET /api/rooms/{id}", "GET", f"/api/rooms/{ctx.pick_room(step)}")
+
+async def room_calendar(ctx, step):
+    check_in, _ = ctx.pick_stay(step)
+    await ctx.request(
+        "GET /api/rooms/{id}/calendar", "GET", f"/api/rooms/{ctx.pick_room(step)}/calendar",
+        params={"month": check_in.strftime("%Y-%m")},
+    )
+
+async def available_rooms(ctx, step):
+    check_in, check_out = ctx.pick_stay(step)
+    params = {"check_in": check_in.isoformat(), "check_out": check_out.isoformat(),
+              "limit": step.get("limit", 50)}
+    if "capacity" in step:
+        params["capacity"] = step["capacity"]
+    response = await ctx.request("GET /api/rooms/available", "GET", "/api/rooms/available", params=params)
+    if response.status_code == 200:
+        ctx.search_results = [room["id"] for room in response.json()]
+
+async def quote(ctx, step):
+    check_in, check_out = ctx.pick_stay(step)
+    await ctx.request("GET /api/rooms/quote", "GET", "/api/rooms/quote",
+                      params={"check_in": check_in.isoformat(), "check_out": check_out.isoformat()})
+
+async def create_booking(ctx, step):
+    check_in, check_out = ctx.pick_stay(step)
+    await ctx.request("POST /api/bookings/", "POST", "/api/bookings/", json={
+        "room_id": ctx.pick_room(step), "check_in": check_in.isoformat(), "check_out": check_out.isoformat(),
+    })
+
+async def my_bookings(ctx, step):
+    await ctx.request("GET /api/bookings/me", "GET", "/api/bookings/me")
+
+ACTIONS = {
+    "login": login,
+    "list_rooms": list_rooms,
+    "room_detail": room_detail,
+    "room_calendar": room_calendar,
+    "available_rooms": available_rooms,
+    "quote": quote,
+    "create_booking": create_booking,
+    "my_bookings": my_bookings,
+}
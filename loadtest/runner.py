@@ -0,0 +1,127 @@
+"""Open-loop runner.
+
+Arrivals follow a Poisson process at the stage's rate, independent of how
+fast the server answers: a slow server builds up in-flight flows instead
+of quietly lowering the offered load (the coordinated-omission trap of
+closed-loop "N users in a loop" tools). Arrivals beyond max_in_flight are
+counted as shed rather than queued.
+"""
+import asyncio
+import random
+import time
+from typing import Dict, List, Optional
+
+import httpx
+
+from .actions import ACTIONS, FlowAbort, FlowContext
+from .scenario import Flow, Scenario
+from .stats import Stats
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+class Runner:
+    def __init__(self, scenario: Scenario, base_url: str, seed: Optional[int] = None,
+                 duration: Optional[float] = None):
+        for flow in scenario.flows:
+            for step in flow.steps:
+                if step.get("action") not in ACTIONS:
+                    raise ValueError(f"flow {flow.name!r}: unknown action {step.get('action')!r}")
+        self.scenario = scenario
+        self.base_url = base_url.rstrip("/")
+        self.rng = random.Random(seed)
+        self.duration = duration
+        self.stats = Stats()
+        self.room_ids: List[int] = []
+        # username -> cookies of a logged-in session (reuse_sessions)
+        self.sessions: Dict[str, httpx.Cookies] = {}
+        self.in_flight = 0
+        self.transport = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(max_connections=scenario.max_in_flight, max_keepalive_connections=scenario.max_in_flight),
+        )
+
+    def client(self, cookies=None) -> httpx.AsyncClient:
+        # Own cookie jar per flow, shared connection pool. Flow clients are
+        # never closed: aclose() would close the shared transport.
+        return httpx.AsyncClient(transport=self.transport, base_url=self.base_url,
+                                 cookies=cookies, timeout=30.0)
+
+    async def load_room_ids(self, limit: int = 5000):
+        client = self.client()
+        cursor = None
+        while len(self.room_ids) < limit:
+            params = {"limit": 500, **({"cursor": cursor} if cursor else {})}
+            response = await client.get("/api/rooms/", params=params)
+            response.raise_for_status()
+            self.room_ids.extend(room["id"] for room in response.json())
+            cursor = response.headers.get(NEXT_CURSOR_HEADER)
+            if not cursor:
+                break
+        if not self.room_ids:
+            raise RuntimeError("No rooms returned by /api/rooms/; seed the database first")
+
+    def pick_flow(self) -> Flow:
+        flows = self.scenario.flows
+        return self.rng.choices(flows, weights=[flow.weight for flow in flows])[0]
+
+    def pick_user(self):
+        users = self.scenario.users
+        return f"{users.prefix}{self.rng.randint(1, users.count)}", users.password
+
+    async def run_flow(self, flow: Flow):
+        user = self.pick_user()
+        cookies = self.sessions.get(user[0]) if self.scenario.reuse_sessions else None
+        ctx = FlowContext(self.client(cookies), random.Random(self.rng.random()), self.stats, self.room_ids, user)
+        ctx.logged_in = cookies is not None
+        self.stats.flows[flow.name] += 1
+        try:
+            for i, step in enumerate(flow.steps):
+                if i and flow.think[1]:
+                    await asyncio.sleep(ctx.rng.uniform(*flow.think))
+                await ACTIONS[step["action"]](ctx, step)
+        except FlowAbort:
+            self.stats.failed_flows[flow.name] += 1
+        finally:
+            self.in_flight -= 1
+        if self.scenario.reuse_sessions and ctx.logged_in:
+            self.sessions[user[0]] = ctx.client.cookies
+
+    async def arrivals(self, tasks: set):
+        deadline = time.monotonic() + self.duration if self.duration else None
+        for stage in self.scenario.stages:
+            stage_end = time.monotonic() + stage.duration
+            if deadline:
+                stage_end = min(stage_end, deadline)
+            # Schedule against absolute times so sleep overshoot doesn't drift the rate
+            next_at = time.monotonic()
+            while True:
+                next_at += self.rng.expovariate(stage.rate) if stage.rate > 0 else stage.duration
+                if next_at >= stage_end:
+                    break
+                await asyncio.sleep(max(next_at - time.monotonic(), 0))
+                self.stats.arrivals += 1
+                if self.in_flight >= self.scenario.max_in_flight:
+                    self.stats.shed += 1
+                    continue
+                self.in_flight += 1
+                task = asyncio.create_task(self.run_flow(self.pick_flow()))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            await asyncio.sleep(max(stage_end - time.monotonic(), 0))
+            if deadline and time.monotonic() >= deadline:
+                break
+
+    async def run(self) -> dict:
+        await self.load_room_ids()
+        tasks = set()
+        started = time.monotonic()
+        try:
+            await self.arrivals(tasks)
+            # Let in-flight flows finish; their latencies belong in the report
+            if tasks:
+                await asyncio.wait(tasks, timeout=60)
+            elapsed = time.monotonic() - started
+        finally:
+            for task in tasks:
+                task.cancel()
+            await self.transport.aclose()
+        return self.stats.summary(elapsed)
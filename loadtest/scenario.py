@@ -0,0 +1,86 @@
+"""Scenario files (TOML).
+
+    name = "search-heavy browsing"
+    max_in_flight = 500           # arrivals beyond this are shed, not queued
+    reuse_sessions = true         # log each user in once, then reuse the cookie
+
+    [users]                       # accounts created by `manage.py seed_data`
+    prefix = "guest"
+    count = 1000
+    password = "password"
+
+    [[stages]]                    # open-loop Poisson arrivals per second
+    duration = 60
+    rate = 50
+
+    [[flows]]                     # one arrival runs one flow, picked by weight
+    name = "browse"
+    weight = 5
+    think = [0.1, 0.5]            # seconds between steps (uniform)
+    steps = [
+        { action = "list_rooms" },
+        { action = "available_rooms", lead_days = [1, 60], nights = [1, 5] },
+    ]
+
+Actions and their options are documented in loadtest/actions.py.
+"""
+import tomllib
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+@dataclass
+class Stage:
+    duration: float
+    rate: float
+
+@dataclass
+class Flow:
+    name: str
+    steps: List[dict]
+    weight: float = 1.0
+    think: Tuple[float, float] = (0.0, 0.0)
+
+@dataclass
+class Users:
+    prefix: str = "guest"
+    count: int = 100
+    password: str = "password"
+
+@dataclass
+class Scenario:
+    name: str
+    stages: List[Stage]
+    flows: List[Flow]
+    users: Users = field(default_factory=Users)
+    max_in_flight: int = 1000
+    reuse_sessions: bool = True
+
+    @property
+    def duration(self) -> float:
+        return sum(stage.duration for stage in self.stages)
+
+def load(path: str) -> Scenario:
+    with open(path, "rb") as fh:
+        raw = tomllib.load(fh)
+    stages = [Stage(float(s["duration"]), float(s["rate"])) for s in raw.get("stages", [])]
+    if not stages:
+        raise ValueError(f"{path}: at least one [[stages]] entry is required")
+    flows = [
+        Flow(
+            name=f["name"],
+            steps=list(f["steps"]),
+            weight=float(f.get("weight", 1)),
+            think=tuple(f.get("think", (0, 0))),
+        )
+        for f in raw.get("flows", [])
+    ]
+    if not flows:
+        raise ValueError(f"{path}: at least one [[flows]] entry is required")
+    return Scenario(
+        name=raw.get("name", path),
+        stages=stages,
+        flows=flows,
+        users=Users(**raw.get("users", {})),
+        max_in_flight=int(raw.get("max_in_flight", 1000)),
+        reuse_sessions=bool(raw.get("reuse_sessions", True)),
+    )
@@ -0,0 +1,73 @@
+import json
+import math
+from collections import Counter, defaultdict
+from typing import Dict, List
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(q / 100 * len(sorted_values)) - 1, 0)
+    return sorted_values[rank]
+
+class Stats:
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.statuses: Dict[str, Counter] = defaultdict(Counter)
+        self.arrivals = 0
+        self.shed = 0
+        self.flows = Counter()
+        self.failed_flows = Counter()
+
+    def record(self, route: str, status, seconds: float):
+        """status: HTTP status code, or an exception class name."""
+        self.latencies[route].append(seconds * 1000)
+        self.statuses[route][status] += 1
+
+    def summary(self, elapsed: float) -> dict:
+        routes = {}
+        for route in sorted(self.latencies):
+            values = sorted(self.latencies[route])
+            statuses = self.statuses[route]
+            total = len(values)
+            errors = sum(n for s, n in statuses.items() if not isinstance(s, int) or s >= 500)
+            routes[route] = {
+                "requests": total,
+                "rps": round(total / elapsed, 1),
+                "p50_ms": round(percentile(values, 50), 1),
+                "p95_ms": round(percentile(values, 95), 1),
+                "p99_ms": round(percentile(values, 99), 1),
+                "max_ms": round(values[-1], 1),
+                "error_rate": round(errors / total, 4),
+                "conflict_rate": round(statuses.get(409, 0) / total, 4),
+                "statuses": {str(s): n for s, n in sorted(statuses.items(), key=lambda item: str(item[0]))},
+            }
+        requests = sum(r["requests"] for r in routes.values())
+        return {
+            "elapsed_s": round(elapsed, 1),
+            "arrivals": self.arrivals,
+            "shed": self.shed,
+            "flows": dict(self.flows),
+            "failed_flows": dict(self.failed_flows),
+            "requests": requests,
+            "rps": round(requests / elapsed, 1) if elapsed else 0.0,
+            "routes": routes,
+        }
+
+def print_report(summary: dict, scenario_name: str):
+    print(f"\n== {scenario_name}: {summary['requests']} requests in {summary['elapsed_s']}s "
+          f"({summary['rps']} req/s), {summary['arrivals']} arrivals, {summary['shed']} shed")
+    flows = ", ".join(f"{name}={n}" for name, n in summary["flows"].items())
+    failed = ", ".join(f"{name}={n}" for name, n in summary["failed_flows"].items()) or "none"
+    print(f"flows: {flows}; failed: {failed}\n")
+    header = f"{'route':<38}{'reqs':>8}{'req/s':>8}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}{'err%':>7}{'409%':>7}"
+    print(header)
+    print("-" * len(header))
+    for route, r in summary["routes"].items():
+        print(f"{route:<38}{r['requests']:>8}{r['rps']:>8}{r['p50_ms']:>9}{r['p95_ms']:>9}{r['p99_ms']:>9}"
+              f"{r['max_ms']:>9}{r['error_rate'] * 100:>7.1f}{r['conflict_rate'] * 100:>7.1f}")
+    print("\nlatencies in ms; err% = 5xx + transport errors")
+
+def write_json(summary: dict, path: str):
+    with open(path, "w") as fh:
+        json.dump(summary, fh, indent=2)